@@ -1,10 +1,15 @@
+import asyncio
+import statistics
+import sys
 import time
 import httpx
-import json
 
 base_url = "http://localhost:11435"
 model = "qwen2.5:1.5b"
 
+# Requests sent at once; pass a number on the command line to override
+concurrency = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+
 prompt = """Extract structured information from this resume. Output ONLY valid JSON.
 Resume text:
 John Doe
@@ -29,28 +34,62 @@ Required JSON structure (extract real info only):
   "suggested_roles": ["Role 1", "Role 2"]
 }"""
 
-print(f"Benchmarking {model}...")
-start_time = time.time()
-
-with httpx.Client(timeout=120.0) as client:
-    response = client.post(
-        f"{base_url}/api/generate",
-        json={
-            "model": model,
-            "prompt": prompt,
-            "stream": False,
-            "options": {
-                "num_thread": 4,
-                "num_ctx": 2048,
-                "temperature": 0.1
-            }
-        }
-    )
-
-end_time = time.time()
-if response.status_code == 200:
-    print(f"Success! Time taken: {end_time - start_time:.2f} seconds")
-    print("Response snippet:", response.json().get("response", "")[:100])
-else:
-    print(f"Failed! Status code: {response.status_code}")
-    print(response.text)
+payload = {
+    "model": model,
+    "prompt": prompt,
+    "stream": False,
+    "options": {
+        "num_thread": 4,
+        "num_ctx": 2048,
+        "temperature": 0.1
+    }
+}
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+async def timed_post(client):
+    start = time.perf_counter()
+    response = await client.post(f"{base_url}/api/generate", json=payload)
+    return time.perf_counter() - start, response
+
+
+async def main():
+    print(f"Benchmarking {model} with {concurrency} concurrent requests...")
+
+    # Pooled keep-alive connections, so later requests skip connection setup.
+    # Ollama only speaks HTTP/1.1, so each in-flight request holds one connection.
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(timeout=120.0, limits=limits) as client:
+        # Warm-up request loads the model so load time isn't measured
+        await client.post(f"{base_url}/api/generate", json={**payload, "options": {**payload["options"], "num_predict": 1}})
+
+        start_time = time.perf_counter()
+        results = await asyncio.gather(*(timed_post(client) for _ in range(concurrency)))
+        wall_time = time.perf_counter() - start_time
+
+    ok = [(latency, response.json()) for latency, response in results if response.status_code == 200]
+    for latency, response in results:
+        if response.status_code != 200:
+            print(f"Failed! Status code: {response.status_code}")
+            print(response.text)
+    if not ok:
+        return
+
+    latencies = [latency for latency, _ in ok]
+    # Decode speed as measured by Ollama itself (durations are in nanoseconds)
+    decode_rates = [body["eval_count"] / (body["eval_duration"] / 1e9) for _, body in ok if body.get("eval_duration")]
+    total_tokens = sum(body.get("eval_count", 0) for _, body in ok)
+
+    print(f"Success! {len(ok)}/{len(results)} requests in {wall_time:.2f} seconds")
+    print(f"Latency p50: {percentile(latencies, 50):.2f}s  p95: {percentile(latencies, 95):.2f}s")
+    if decode_rates:
+        print(f"Decode speed per request: {statistics.mean(decode_rates):.1f} tokens/sec")
+    print(f"Aggregate throughput: {total_tokens / wall_time:.1f} tokens/sec")
+    print("Response snippet:", ok[0][1].get("response", "")[:100])
+
+
+asyncio.run(main())
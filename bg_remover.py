@@ -1,20 +1,26 @@
 import sys
+import numpy as np
 from PIL import Image
 
+# Fully transparent white as one RGBA word, in native byte order
+_TRANSPARENT_WHITE = np.frombuffer(bytes((255, 255, 255, 0)), dtype=np.uint32)[0]
+
+def _mask_white(pixels, threshold):
+    """Make pixels above threshold on R, G and B transparent white, in place"""
+    # Channel-wise minimum on strided views: one HxW temporary instead of an
+    # HxWx3 boolean array reduced afterwards
+    lowest = np.minimum(np.minimum(pixels[..., 0], pixels[..., 1]), pixels[..., 2])
+    # Each RGBA pixel viewed as a single uint32, so the write is one store per pixel
+    np.putmask(pixels.view(np.uint32)[..., 0], lowest > threshold, _TRANSPARENT_WHITE)
+
 def remove_white_background(input_path, output_path, fuzz=20):
     img = Image.open(input_path).convert("RGBA")
-    data = img.getdata()
+    pixels = np.array(img, dtype=np.uint8)
 
-    new_data = []
-    for item in data:
-        # Check if pixel is close to white (255, 255, 255)
-        if item[0] > 255 - fuzz and item[1] > 255 - fuzz and item[2] > 255 - fuzz:
-            new_data.append((255, 255, 255, 0)) # Fully transparent
-        else:
-            new_data.append(item)
+    # Pixels close to white (255, 255, 255) become fully transparent
+    _mask_white(pixels, 255 - fuzz)
 
-    img.putdata(new_data)
-    img.save(output_path, "PNG")
+    Image.fromarray(pixels, "RGBA").save(output_path, "PNG")
 
 if __name__ == "__main__":
     if len(sys.argv) != 3:
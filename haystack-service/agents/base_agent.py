@@ -1,10 +1,88 @@
 from haystack_integrations.components.generators.ollama import OllamaGenerator
-from typing import Dict, Any
+from typing import Dict, Any, AsyncIterator, Optional
+import httpx
+import orjson
 
 class BaseAgent:
+    # Decode budget for conversational replies; subclasses may override
+    generation_kwargs: Dict[str, Any] = {"num_predict": 512}
+
+    # One connection pool to Ollama shared by every agent that talks to it
+    # directly, so keep-alive connections are reused across requests
+    _http_client: Optional[httpx.AsyncClient] = None
+
     def __init__(self, generator: OllamaGenerator):
         self.generator = generator
 
+    @classmethod
+    def http_client(cls) -> httpx.AsyncClient:
+        """Shared async HTTP client for direct Ollama API calls"""
+        if BaseAgent._http_client is None or BaseAgent._http_client.is_closed:
+            BaseAgent._http_client = httpx.AsyncClient(
+                timeout=httpx.Timeout(1200.0, connect=10.0),
+                limits=httpx.Limits(max_keepalive_connections=32),
+            )
+        return BaseAgent._http_client
+
+    @classmethod
+    async def aclose_http_client(cls):
+        """Close the shared client; called on app shutdown"""
+        if BaseAgent._http_client is not None:
+            await BaseAgent._http_client.aclose()
+            BaseAgent._http_client = None
+
+    def build_prompt(self, state: Dict[str, Any]) -> str:
+        """Override this method in subclasses to build the LLM prompt"""
+        raise NotImplementedError
+
+    def _generate_request(self, prompt: str, stream: bool, generation_kwargs: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Ollama /api/generate body using the generator's model and sampling settings"""
+        return {
+            "model": self.generator.model,
+            "prompt": prompt,
+            "stream": stream,
+            "options": {**self.generator.generation_kwargs, **(generation_kwargs or self.generation_kwargs)},
+            "keep_alive": self.generator.keep_alive,
+        }
+
+    @property
+    def generate_url(self) -> str:
+        return f"{self.generator.url.rstrip('/')}/api/generate"
+
+    async def agenerate(self, prompt: str, generation_kwargs: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Full completion awaited on the event loop over the shared connection
+        pool, so in-flight generations don't each hold a worker thread.
+        """
+        response = await self.http_client().post(
+            self.generate_url, json=self._generate_request(prompt, False, generation_kwargs)
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content).get("response", "")
+
     async def run(self, state: Dict[str, Any]) -> Dict[str, Any]:
-        """Override this method in subclasses"""
+        """Run the agent to completion, recording its reply on the state in place"""
+        state["final_output"] = await self.agenerate(self.build_prompt(state))
         return state
+
+    async def astream(self, state: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream the agent's reply token by token.
+
+        Reads Ollama's newline-delimited JSON stream directly, so callers see
+        the first token as soon as Ollama emits it instead of waiting for the
+        full completion.
+        """
+        request = self._generate_request(self.build_prompt(state), True)
+        async with self.http_client().stream("POST", self.generate_url, json=request) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line:
+                    continue
+                chunk = orjson.loads(line)
+                if "error" in chunk:
+                    raise RuntimeError(f"Ollama error: {chunk['error']}")
+                if chunk.get("response"):
+                    yield {"delta": chunk["response"]}
+                if chunk.get("done"):
+                    break
@@ -1,12 +1,45 @@
 from .base_agent import BaseAgent
 from typing import Dict, Any, List
-import json
+import orjson
 import logging
 import random
+import re
+from cache.memory_cache import LRUCache, content_key
 
 logger = logging.getLogger(__name__)
 
+_FENCE_RE = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL)
+
+# Ready application packages, keyed by the (profile, job) pair
+_DRAFT_CACHE = LRUCache(maxsize=512)
+
+_DRAFT_PROMPT = """You are an expert Career Agent.
+Draft a high-conversion Job Application for the candidate.
+
+Output ONLY valid JSON with no markdown formatting or extra text:
+{
+    "tailored_resume_summary": "A 2-3 sentence summary tailored to the job.",
+    "cover_letter": "A compelling, 3-paragraph cover letter.",
+    "outreach_message": "A short LinkedIn connection message to the hiring manager.",
+    "interview_prep_tips": ["Tip 1", "Tip 2", "Tip 3"]
+}
+"""
+
+# Mock listings: (id, title, company, location or None for the requested one,
+# posted, match score, salary, description, source)
+_OPPORTUNITY_TEMPLATES = (
+    ("job_101", "Senior {role}", "TechFlow Systems", None, "2 days ago", 92, "$140k - $180k",
+     "We are looking for a {role} with experience in Python and Cloud Architecture...", "LinkedIn"),
+    ("job_102", "{role} II", "DataDrive Inc", None, "5 hours ago", 88, "$120k - $150k",
+     "Join our fast-paced team as a {role}. Must have strong problem-solving skills...", "Direct"),
+    ("job_103", "Lead {role}", "InnovateAI", "Hybrid", "1 day ago", 85, "$160k - $210k",
+     "Leading the future of AI. Seeking a {role} to drive our core platform...", "Aggregator"),
+)
+
 class JobHunterAgent(BaseAgent):
+    # Room for a 3-paragraph cover letter plus the other package fields
+    generation_kwargs = {"num_predict": 1024}
+
     def find_opportunities(self, criteria: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Find job opportunities based on criteria.
@@ -28,38 +61,18 @@ class JobHunterAgent(BaseAgent):
         
         opportunities = [
             {
-                "id": "job_101",
-                "title": f"Senior {role}",
-                "company": "TechFlow Systems",
-                "location": location,
-                "posted_date": "2 days ago",
-                "match_score": 92,
-                "salary": "$140k - $180k",
-                "description": f"We are looking for a {role} with experience in Python and Cloud Architecture...",
-                "source": "LinkedIn"
-            },
-            {
-                "id": "job_102",
-                "title": f"{role} II",
-                "company": "DataDrive Inc",
-                "location": location,
-                "posted_date": "5 hours ago",
-                "match_score": 88,
-                "salary": "$120k - $150k",
-                "description": f"Join our fast-paced team as a {role}. Must have strong problem-solving skills...",
-                "source": "Direct"
-            },
-            {
-                "id": "job_103",
-                "title": f"Lead {role}",
-                "company": "InnovateAI",
-                "location": "Hybrid",
-                "posted_date": "1 day ago",
-                "match_score": 85,
-                "salary": "$160k - $210k",
-                "description": f"Leading the future of AI. Seeking a {role} to drive our core platform...",
-                "source": "Aggregator"
+                "id": job_id,
+                "title": title.format(role=role),
+                "company": company,
+                "location": job_location or location,
+                "posted_date": posted_date,
+                "match_score": match_score,
+                "salary": salary,
+                "description": description.format(role=role),
+                "source": source
             }
+            for job_id, title, company, job_location, posted_date, match_score, salary, description, source
+            in _OPPORTUNITY_TEMPLATES
         ]
         
         return opportunities
@@ -68,39 +81,37 @@ class JobHunterAgent(BaseAgent):
         """Draft a shadow application for a specific job"""
         logger.info(f"Drafting application for {job_details.get('company')}")
         
-        prompt = f"""You are an expert Career Agent. 
-        Draft a high-conversion Job Application for the candidate.
-        
-        Output ONLY valid JSON with no markdown formatting or extra text:
-        {{
-            "tailored_resume_summary": "A 2-3 sentence summary tailored to the job.",
-            "cover_letter": "A compelling, 3-paragraph cover letter.",
-            "outreach_message": "A short LinkedIn connection message to the hiring manager.",
-            "interview_prep_tips": ["Tip 1", "Tip 2", "Tip 3"]
-        }}
-        
-        Candidate Profile:
-        {json.dumps(user_profile, indent=2)}
-        
-        Job Details:
-        {json.dumps(job_details, indent=2)}
-        """
+        profile_json = orjson.dumps(user_profile, option=orjson.OPT_SORT_KEYS).decode()
+        job_json = orjson.dumps(job_details, option=orjson.OPT_SORT_KEYS).decode()
+
+        cache_key = content_key(profile_json, job_json)
+        cached = _DRAFT_CACHE.get(cache_key)
+        if cached is not None:
+            logger.info("Draft cache hit")
+            return cached
+
+        prompt = (
+            f"{_DRAFT_PROMPT}\n"
+            f"Candidate Profile:\n{profile_json}\n\n"
+            f"Job Details:\n{job_json}\n"
+        )
         
         try:
-            response = self.generator.run(prompt=prompt)
+            response = self.generator.run(prompt=prompt, generation_kwargs=self.generation_kwargs)
             content = response["replies"][0]
             
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0]
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0]
+            fenced = _FENCE_RE.search(content)
+            if fenced:
+                content = fenced.group(1)
             
-            result = json.loads(content.strip())
-            return {
+            result = orjson.loads(content.strip())
+            draft = {
                 "status": "ready",
                 "application_package": result,
                 "job_id": job_details.get("id")
             }
+            _DRAFT_CACHE.set(cache_key, draft)
+            return draft
             
         except Exception as e:
             logger.error(f"Error drafting application: {e}")
@@ -1,13 +1,10 @@
 from .base_agent import BaseAgent
 from typing import Dict, Any
+import logging
 
-class ProfileAgent(BaseAgent):
-    async def run(self, state: Dict[str, Any]) -> Dict[str, Any]:
-        print("Profile Agent running...")
-        messages = state.get("messages", [])
-        last_message = messages[-1]["content"] if messages else ""
-        
-        prompt = f"""You are CareerGini, a friendly and concise AI career assistant.
+logger = logging.getLogger(__name__)
+
+_SYSTEM_PROMPT = """You are CareerGini, a friendly and concise AI career assistant.
 You have access to the user's profile information embedded in the context below.
 
 CRITICAL RULES — follow these strictly:
@@ -15,10 +12,11 @@ CRITICAL RULES — follow these strictly:
 2. Only produce multi-step career advice when the user explicitly asks for advice, strategies, tips, or recommendations.
 3. Never invent information. Use only what is in the profile context.
 4. Keep all responses short, warm, and conversational by default.
-5. Do not start with lengthy greetings or re-summarize the user's whole profile unprompted.
+5. Do not start with lengthy greetings or re-summarize the user's whole profile unprompted."""
 
-User Message and Context: {last_message}"""
-        
-        response = self.generator.run(prompt=prompt)
-        
-        return {**state, "final_output": response["replies"][0]}
+class ProfileAgent(BaseAgent):
+    def build_prompt(self, state: Dict[str, Any]) -> str:
+        logger.debug("Profile Agent running...")
+        messages = state.get("messages", [])
+        last_message = messages[-1]["content"] if messages else ""
+        return f"{_SYSTEM_PROMPT}\n\nUser Message and Context: {last_message}"
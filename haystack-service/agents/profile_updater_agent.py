@@ -1,60 +1,97 @@
 from .base_agent import BaseAgent
 from typing import Dict, Any, List
-import json
+import orjson
 import logging
+import re
 import asyncio
 
 logger = logging.getLogger(__name__)
 
+_JSON_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+# Phrases that signal a skill, goal or preference worth remembering. Turns
+# with none of them (greetings, plain questions) skip the LLM entirely.
+_FACT_KEYWORDS = frozenset({
+    "i know", "i can", "i learned", "i've learned", "i have learned", "i am learning", "i'm learning",
+    "i use", "i've used", "i worked", "i work", "skilled", "proficient", "certified",
+    "i want", "i'd like", "i would like", "my goal", "goal is", "aspire", "become a", "transition",
+    "prefer", "remote", "hybrid", "on-site", "onsite", "relocate", "salary", "lpa", "ctc",
+    "experience", "years", "industry", "looking for",
+})
+_FACT_RE = re.compile(
+    r"\d+\s*\+?\s*(?:year|yr)|" + "|".join(re.escape(k) for k in sorted(_FACT_KEYWORDS, key=len, reverse=True))
+)
+
+# News about the user themselves: a first-person reference plus an
+# achievement or change verb ("I passed the AWS exam", "I moved to Berlin")
+_SELF_RE = re.compile(r"\b(?:i|i'm|im|i've|ive|i'd|my)\b")
+_ACHIEVEMENT_RE = re.compile(
+    r"\b(?:passed|cleared|completed|finished|built|created|developed|launched|shipped|got|earned|received"
+    r"|moved|relocated|joined|started|graduated|promoted|hired|led|managed|mastered|studied|learnt|won)\b"
+)
+
+
+def _has_fact_cue(message_lower: str) -> bool:
+    """Whether the turn may carry a profile fact worth an LLM call."""
+    return bool(
+        _FACT_RE.search(message_lower)
+        or (_SELF_RE.search(message_lower) and _ACHIEVEMENT_RE.search(message_lower))
+    )
+
+# Facts are stated up front; long turns (pasted resumes, multi-paragraph
+# AI advice) only add prompt tokens. The AI side is context, so it gets less.
+_MAX_USER_CHARS = 1000
+_MAX_AI_CHARS = 500
+
+_MEMORY_PROMPT = """You are a "Memory Manager" for a career coaching AI.
+Your job is to listen to the user's chat messages and exact permanent facts about their profile.
+
+Categories to track:
+1. SKILLS: New skills they learned or mentioned owning.
+2. GOALS: Specific career goals (e.g., "I want to be a CTO", "I want remote work").
+3. PREFERENCES: Job preferences like location, salary, industry.
+
+If the user message contains such info, return a JSON object:
+{
+    "has_update": true,
+    "intent": "update_skills" | "update_goals" | "update_preferences",
+    "data": {
+        "skills": ["..."], 
+        # OR 
+        "goals": ["..."],
+        # OR
+        "target_roles": ["..."], "target_locations": ["..."]
+    }
+}
+
+If NO new useful info is present (e.g., questions, greetings, feedback), return:
+{"has_update": false}
+
+Output ONLY valid JSON.
+"""
+
 class ProfileUpdaterAgent(BaseAgent):
+    # The update JSON is short; keep it deterministic
+    generation_kwargs = {"num_predict": 128, "temperature": 0}
+
     async def analyze_convo(self, user_message: str, ai_response: str) -> Dict[str, Any]:
         """
         Analyze a chat turn to see if the user revealed new profile information.
         """
-        if len(user_message) < 5:
+        if len(user_message) < 5 or not _has_fact_cue(user_message.lower()):
             return None
 
-        prompt = f"""
-        You are a "Memory Manager" for a career coaching AI.
-        Your job is to listen to the user's chat messages and exact permanent facts about their profile.
-        
-        Categories to track:
-        1. SKILLS: New skills they learned or mentioned owning.
-        2. GOALS: Specific career goals (e.g., "I want to be a CTO", "I want remote work").
-        3. PREFERENCES: Job preferences like location, salary, industry.
-        
-        If the user message contains such info, return a JSON object:
-        {{
-            "has_update": true,
-            "intent": "update_skills" | "update_goals" | "update_preferences",
-            "data": {{
-                "skills": ["..."], 
-                # OR 
-                "goals": ["..."],
-                # OR
-                "target_roles": ["..."], "target_locations": ["..."]
-            }}
-        }}
-        
-        If NO new useful info is present (e.g., questions, greetings, feedback), return:
-        {{"has_update": false}}
-        
-        Output ONLY valid JSON.
-        
-        USER: {user_message}
-        AI: {ai_response}
-        """
+        prompt = f"{_MEMORY_PROMPT}\nUSER: {user_message[:_MAX_USER_CHARS]}\nAI: {ai_response[:_MAX_AI_CHARS]}\n"
         
         try:
-            response = await asyncio.to_thread(self.generator.run, prompt=prompt)
+            # Concurrent turns already overlap in Ollama's parallel slots
+            response = await asyncio.to_thread(self.generator.run, prompt=prompt, generation_kwargs=self.generation_kwargs)
             
             content = response["replies"][0]
             # Clean JSON
-            import re
-            json_pattern = r'\{.*\}'
-            match = re.search(json_pattern, content, re.DOTALL)
+            match = _JSON_RE.search(content)
             if match:
-                data = json.loads(match.group(0))
+                data = orjson.loads(match.group(0))
                 if data.get("has_update"):
                     return data
             return None
@@ -1,36 +1,303 @@
 from .base_agent import BaseAgent
 from typing import Dict, Any, List, Optional
-import json
+import orjson
 import logging
 import re
 import asyncio
+from functools import lru_cache
 from haystack import component
 from haystack.core.pipeline import AsyncPipeline
+from cache.memory_cache import LRUCache, content_key
 
 logger = logging.getLogger(__name__)
 
+# Successful persona extractions, keyed by resume text digest
+_PERSONA_CACHE = LRUCache(maxsize=512)
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Static prompt text — kept at the front of each prompt and byte-identical
+# across calls so Ollama can reuse the prefix KV cache.
+# ─────────────────────────────────────────────────────────────────────────────
+
+_PERSONA_PROMPT = """Extract structured information from the resume below. Output ONLY valid JSON.
+
+Required JSON structure (extract real info only):
+{
+  "full_name": "Full name",
+  "professional_title": "Current role",
+  "years_experience": 0,
+  "email": "email",
+  "phone": "phone",
+  "location": "city, country",
+  "linkedin": "linkedin URL if present",
+  "portfolio_url": "portfolio/github URL if present",
+  "summary": "2-3 sentence bio",
+  "top_skills": ["Skill 1", "Skill 2"],
+  "experience_highlights": [{"role":"Title","company":"Company","duration":"Dates","key_achievement":"One bullet"}],
+  "projects": [{"name":"Project Name","description":"Brief description of what was built and tools used"}],
+  "education": [{"degree":"Degree","school":"School","year":"Year"}],
+  "career_level": "Entry/Mid/Senior/Exec",
+  "suggested_roles": ["Role 1", "Role 2"]
+}
+"""
+
+_TAILOR_PREAMBLE = """You are a professional resume writer. Tailor this candidate's resume for the job below.
+
+STRICT RULES:
+- DO NOT invent any job titles, companies, projects, or dates that are not in the candidate data.
+- DO NOT add fake achievements. Only rewrite and improve existing ones with stronger action verbs and quantifiable metrics where possible.
+- CONSOLIDATE EXPERIENCE: If multiple entries exist for the same Role at the same Company and Date, MERGE them into a single entry with a unified list of bullet points. NEVER output duplicate roles.
+- Generate 3-4 impactful bullet points per role based ONLY on the provided highlights."""
+
+_TAILOR_OUTPUT_RULES = """- Return the candidate's Education details exactly as provided.
+- If the candidate has Projects, include and tailor their descriptions.
+- Output ONLY valid JSON. No preamble or explanation.
+
+Required JSON:
+{"tailored_summary":"summary text","tailored_skills":["skill1","skill2"],"tailored_experience":[{"role":"Exact role","company":"Exact company","duration":"Exact dates","tailored_bullets":["Bullet 1","Bullet 2","Bullet 3"]}],"tailored_projects":[{"name":"Project Name","description":"Tailored Description"}],"education":[{"degree":"Degree","school":"School","year":"Year"}],"match_analysis":"1-2 sentences on candidate fit"}"""
+
+# Template-specific tailoring instructions; unknown templates use "professional"
+_TEMPLATE_RULES = {
+    "executive": """- Write all bullet points as leadership-impact statements: lead with scope (team size, budget, P&L) then outcome.
+- Generate a 4-5 sentence executive narrative summary (strategic vision + career arc + value proposition).
+- Reframe skills as 9 leadership domains / competency areas (not just tool names). E.g. "P&L Management", "Enterprise Sales", "Cross-Functional Leadership".
+- Quantify everything possible: revenue, headcount, growth %, cost savings, cycle time reduction.
+- Tone: authoritative, visionary, board-room ready. No first-person pronouns.""",
+    "fresher": """- Write a Career Objective (2-3 sentences) focused on what the candidate WANTS to contribute and learn, not just what they've done.
+- Emphasize academic achievements, coursework projects, hackathons, open-source, internships over formal career history.
+- Skills must be specific concrete tool/technology names (Python, React, SQL, Figma) learned in coursework or self-study.
+- For any internships or part-time work: frame contributions as learning + tangible delivery.
+- Tone: ambitious, enthusiastic, growth-focused. Max 2 bullet points per role.
+- If the candidate has limited work experience, prioritize projects — make project descriptions detailed and impactful.""",
+    "professional": """- Write all bullet points as concise metric-driven ATS-optimised statements (action verb → task → quantified result).
+- Generate a tight 3-sentence professional summary (current title + top 2 skills + value to employer).
+- Include exact keyword phrases from the JD in skills list for maximum ATS match.
+- Tone: professional and confident. No jargon. Sentences under 20 words each.""",
+}
+
+# Finalize tone rules per template; {max_bullets} comes from _MAX_BULLETS
+_TONE_RULES = {
+    "executive": """- Tone: authoritative, board-room ready, no first-person pronouns.
+- Summary: 4-5 sentence strategic narrative (vision + impact + career arc).
+- Competencies: 9 leadership domain phrases (not tool names).
+- Bullets: scope (team/budget/revenue) then measurable outcome. Max {max_bullets} per role.""",
+    "fresher": """- Rewrite summary as Career Objective: 2 sentences — contribution intent + strongest qualification.
+- Skills: concrete tool/tech names only.
+- Bullets per role: max {max_bullets} — frame as learning + tangible delivery.
+- Emphasize projects heavily — make descriptions specific and results-oriented.
+- Tone: ambitious, eager, forward-looking.""",
+    "professional": """- Tone: clean, confident, ATS-friendly.
+- Summary: exactly 3 sentences — role + top skill + value promise.
+- Bullets: action verb → task → metric. Max {max_bullets} per role.
+- Skills: exact keyword phrases from JD.""",
+}
+
+# Bullets per role as (1-page compact, 2-page full)
+_MAX_BULLETS = {"executive": (4, 4), "fresher": (2, 3), "professional": (2, 4)}
+
+
+def _tone_rules(template: str, compact: bool) -> str:
+    """Finalize tone rules for a template; unknown templates use "professional"."""
+    if template not in _TONE_RULES:
+        template = "professional"
+    compact_max, full_max = _MAX_BULLETS[template]
+    return _TONE_RULES[template].format(max_bullets=compact_max if compact else full_max)
+
+_PAGE_RULES = {
+    True:  "- Format: 1-PAGE COMPACT (be concise, trim bullets to 2 per role, skills max 8).",
+    False: "- Format: 2-PAGE FULL-DETAIL (include all bullets and skills, be thorough).",
+}
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Shared helpers
 # ─────────────────────────────────────────────────────────────────────────────
 
+_FENCE_RE = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL)
+_JSON_RE = re.compile(r'\{.*\}', re.DOTALL)
+_STRUCTURAL_RE = re.compile(r'[{}"\\]')
+_TRAILING_COMMA_RE = re.compile(r',(\s*[}\]])')
+
+def _first_json_object(content: str) -> Optional[str]:
+    """
+    Return the first balanced {...} block, ignoring braces inside string
+    literals. Only structural characters are visited. None if the object
+    never closes.
+    """
+    start = content.find("{")
+    if start < 0:
+        return None
+    depth = 0
+    in_str = False
+    skip = -1
+    for m in _STRUCTURAL_RE.finditer(content, start):
+        pos = m.start()
+        if pos == skip:
+            continue
+        ch = m.group()
+        if in_str:
+            if ch == "\\":
+                skip = pos + 1
+            elif ch == '"':
+                in_str = False
+        elif ch == '"':
+            in_str = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if not depth:
+                return content[start:pos + 1]
+    return None
+
+def _loads_repaired(raw: str) -> Optional[dict]:
+    """Parse raw after repairing trailing commas before } or ]; None on failure."""
+    try:
+        return orjson.loads(_TRAILING_COMMA_RE.sub(r'\1', raw))
+    except orjson.JSONDecodeError:
+        return None
+
 def _parse_json(content: str) -> dict:
     """Robustly extract the first JSON object from LLM output."""
     # Strip markdown fences
-    if "```json" in content:
-        content = content.split("```json")[1].split("```")[0]
-    elif "```" in content:
-        content = content.split("```")[1].split("```")[0]
-    # Find the first { ... } block
-    match = re.search(r'\{.*\}', content, re.DOTALL)
+    fenced = _FENCE_RE.search(content)
+    if fenced:
+        content = fenced.group(1)
+    # Greedy first-{ to last-} is near free and right for almost every reply
+    match = _JSON_RE.search(content)
     if match:
-        raw = match.group(0)
-        # Repair trailing commas before } or ]
-        raw = re.sub(r',(\s*[}\]])', r'\1', raw)
-        try:
-            return json.loads(raw)
-        except json.JSONDecodeError:
-            pass
-    return json.loads(content.strip())
+        result = _loads_repaired(match.group(0))
+        if result is not None:
+            return result
+        # Trailing prose with a stray "}" defeats the greedy match; cut at
+        # the first balanced object instead
+        raw = _first_json_object(match.group(0))
+        if raw:
+            result = _loads_repaired(raw)
+            if result is not None:
+                return result
+    return orjson.loads(content.strip())
+
+
+class _ObjectComplete(Exception):
+    """Raised from a streaming callback to stop decoding once the JSON is closed."""
+
+
+class _JsonObjectScanner:
+    """
+    Incrementally tracks brace depth over streamed LLM text so we know the
+    moment the first top-level JSON object closes, without re-scanning the
+    whole reply. Braces inside string literals are ignored.
+    """
+    def __init__(self):
+        self.chunks: List[str] = []
+        self.obj: List[str] = []
+        self.depth = 0
+        self.in_str = False
+        self.escape = False
+        self.done = False
+
+    def feed(self, text: str) -> bool:
+        """Consume a chunk; returns True once the top-level object has closed."""
+        self.chunks.append(text)
+        for ch in text:
+            if self.depth:
+                self.obj.append(ch)
+                if self.in_str:
+                    if self.escape:
+                        self.escape = False
+                    elif ch == "\\":
+                        self.escape = True
+                    elif ch == '"':
+                        self.in_str = False
+                elif ch == '"':
+                    self.in_str = True
+                elif ch == "{":
+                    self.depth += 1
+                elif ch == "}":
+                    self.depth -= 1
+                    if not self.depth:
+                        self.done = True
+                        return True
+            elif ch == "{":
+                self.obj.append(ch)
+                self.depth = 1
+        return False
+
+    @property
+    def text(self) -> str:
+        return "".join(self.chunks)
+
+    def parse(self) -> dict:
+        """Parse the captured object, falling back to the repairing parser."""
+        if self.done:
+            try:
+                return orjson.loads("".join(self.obj))
+            except orjson.JSONDecodeError:
+                pass
+        return _parse_json(self.text)
+
+
+# Expected shape of an extracted persona. Small models regularly emit a
+# string where a list belongs (or null), so values are coerced in one pass
+# instead of every consumer guarding each field.
+_PERSONA_TYPES = {
+    "full_name":             str,
+    "professional_title":    str,
+    "years_experience":      int,
+    "email":                 str,
+    "phone":                 str,
+    "location":              str,
+    "linkedin":              str,
+    "portfolio_url":         str,
+    "summary":               str,
+    "top_skills":            list,
+    "experience_highlights": list,
+    "projects":              list,
+    "education":             list,
+    "certifications":        list,
+    "career_level":          str,
+    "suggested_roles":       list,
+}
+
+# Contact fields must always exist to prevent UI errors
+_PERSONA_DEFAULTS = {"email": "", "phone": "", "linkedin": "", "portfolio_url": ""}
+
+_PERSONA_FALLBACK = {
+    "full_name":             "Candidate",
+    "professional_title":    "Professional",
+    "years_experience":      0,
+    "location":              "",
+    "summary":               "Resume uploaded. Please review and edit the details below.",
+    "career_level":          "Unknown",
+    **_PERSONA_DEFAULTS,
+}
+
+
+def _coerce_persona(raw: dict) -> dict:
+    """Fill contact defaults and normalise field types of an extracted persona."""
+    persona = {**_PERSONA_DEFAULTS, **raw}
+    for field, kind in _PERSONA_TYPES.items():
+        value = persona.get(field)
+        if value is None or isinstance(value, kind):
+            continue
+        if kind is list:
+            persona[field] = [value] if value else []
+        elif kind is int:
+            try:
+                persona[field] = int(float(value))
+            except (TypeError, ValueError):
+                persona[field] = 0
+        else:
+            persona[field] = str(value)
+    for field in _PERSONA_DEFAULTS:
+        if persona[field] is None:
+            persona[field] = ""
+    return persona
+
+
+def _fallback_persona() -> dict:
+    """Placeholder persona used when extraction fails (fresh lists each call)."""
+    return {**_PERSONA_FALLBACK, **{f: [] for f, kind in _PERSONA_TYPES.items() if kind is list}}
 
 
 def _fmt_exp(exp: dict) -> dict:
@@ -46,6 +313,32 @@ def _fmt_exp(exp: dict) -> dict:
     }
 
 
+def _fallback_tailored(persona: dict) -> dict:
+    """Untailored resume content used when the tailor step fails."""
+    return {
+        "tailored_summary":    persona.get("summary", ""),
+        "tailored_skills":     persona.get("top_skills", []),
+        "tailored_experience": [_fmt_exp(e) for e in (persona.get("experience_highlights") or [])],
+        "tailored_projects":   persona.get("projects", []),
+        "education":           persona.get("education", []),
+        "match_analysis":      "Tailor step encountered an error; original data preserved."
+    }
+
+
+def _fallback_cover_letter(persona: dict) -> str:
+    """Generic cover letter used when the cover letter step fails."""
+    name  = persona.get("full_name", "Candidate")
+    title = persona.get("professional_title", "Professional")
+    top3  = (persona.get("top_skills") or [])[:3]
+    return (
+        f"Dear Hiring Manager,\n\n"
+        f"I am excited to apply for this opportunity. As a {title}, I bring "
+        f"expertise in {', '.join(top3)} and a strong track record of delivering results. "
+        f"I am confident I would be a valuable addition to your team.\n\n"
+        f"Sincerely,\n{name}"
+    )
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Haystack components
 # ─────────────────────────────────────────────────────────────────────────────
@@ -58,6 +351,9 @@ class TailorResumeComponent:
     For a 1-page resume the PDF generator will trim bullets; for a 2-page
     resume it shows all of them, so we always generate as many as possible here.
     """
+    # Enough for the full tailored JSON; stops runaway decoding
+    generation_kwargs = {"num_predict": 1024}
+
     def __init__(self, generator):
         self.generator = generator
 
@@ -82,64 +378,26 @@ class TailorResumeComponent:
         industry_prompt = f"- Align the vocabulary and metrics to the {target_industry} industry standard." if target_industry else ""
         focus_prompt = f"- Give special emphasis to {focus_area} in the summary and bullets." if focus_area else ""
 
-        # ── Template-specific tailoring instructions ──────────────────────────
-        if template == "executive":
-            template_rules = """- Write all bullet points as leadership-impact statements: lead with scope (team size, budget, P&L) then outcome.
-- Generate a 4-5 sentence executive narrative summary (strategic vision + career arc + value proposition).
-- Reframe skills as 9 leadership domains / competency areas (not just tool names). E.g. "P&L Management", "Enterprise Sales", "Cross-Functional Leadership".
-- Quantify everything possible: revenue, headcount, growth %, cost savings, cycle time reduction.
-- Tone: authoritative, visionary, board-room ready. No first-person pronouns."""
-        elif template == "fresher":
-            template_rules = """- Write a Career Objective (2-3 sentences) focused on what the candidate WANTS to contribute and learn, not just what they've done.
-- Emphasize academic achievements, coursework projects, hackathons, open-source, internships over formal career history.
-- Skills must be specific concrete tool/technology names (Python, React, SQL, Figma) learned in coursework or self-study.
-- For any internships or part-time work: frame contributions as learning + tangible delivery.
-- Tone: ambitious, enthusiastic, growth-focused. Max 2 bullet points per role.
-- If the candidate has limited work experience, prioritize projects — make project descriptions detailed and impactful."""
-        else:
-            template_rules = """- Write all bullet points as concise metric-driven ATS-optimised statements (action verb → task → quantified result).
-- Generate a tight 3-sentence professional summary (current title + top 2 skills + value to employer).
-- Include exact keyword phrases from the JD in skills list for maximum ATS match.
-- Tone: professional and confident. No jargon. Sentences under 20 words each."""
-
-        prompt = f"""You are a professional resume writer. Tailor this candidate's resume for the job below.
-
-STRICT RULES:
-- DO NOT invent any job titles, companies, projects, or dates that are not in the candidate data.
-- DO NOT add fake achievements. Only rewrite and improve existing ones with stronger action verbs and quantifiable metrics where possible.
-- CONSOLIDATE EXPERIENCE: If multiple entries exist for the same Role at the same Company and Date, MERGE them into a single entry with a unified list of bullet points. NEVER output duplicate roles.
-- Generate 3-4 impactful bullet points per role based ONLY on the provided highlights.
-{template_rules}
+        prompt = f"""{_TAILOR_PREAMBLE}
+{_TEMPLATE_RULES.get(template, _TEMPLATE_RULES["professional"])}
 {industry_prompt}
 {focus_prompt}
-- Return the candidate's Education details exactly as provided.
-- If the candidate has Projects, include and tailor their descriptions.
-- Output ONLY valid JSON. No preamble or explanation.
+{_TAILOR_OUTPUT_RULES}
 
 Candidate:
-{json.dumps(candidate)}
+{orjson.dumps(candidate).decode()}
 
 Job Description (excerpt):
-{slim_jd}
-
-Required JSON:
-{{"tailored_summary":"summary text","tailored_skills":["skill1","skill2"],"tailored_experience":[{{"role":"Exact role","company":"Exact company","duration":"Exact dates","tailored_bullets":["Bullet 1","Bullet 2","Bullet 3"]}}],"tailored_projects":[{{"name":"Project Name","description":"Tailored Description"}}],"education":[{{"degree":"Degree","school":"School","year":"Year"}}],"match_analysis":"1-2 sentences on candidate fit"}}"""
+{slim_jd}"""
 
         try:
-            response = self.generator.run(prompt=prompt)
+            response = self.generator.run(prompt=prompt, generation_kwargs=self.generation_kwargs)
             content  = response["replies"][0]
             result   = _parse_json(content)
             return {"tailored_result": result}
         except Exception as e:
             logger.error(f"Tailoring failed: {e}")
-            return {"tailored_result": {
-                "tailored_summary":    persona.get("summary", ""),
-                "tailored_skills":     persona.get("top_skills", []),
-                "tailored_experience": [_fmt_exp(e) for e in (persona.get("experience_highlights") or [])],
-                "tailored_projects":   persona.get("projects", []),
-                "education":           persona.get("education", []),
-                "match_analysis":      "Tailor step encountered an error; original data preserved."
-            }}
+            return {"tailored_result": _fallback_tailored(persona)}
 
 
 @component
@@ -148,6 +406,9 @@ class CoverLetterComponent:
     Generates a crisp half-page cover letter (~150 words, 2-3 short paragraphs).
     Designed to fit on less than half of page 1 of the final PDF.
     """
+    # ~150 words plus slack
+    generation_kwargs = {"num_predict": 320}
+
     def __init__(self, generator):
         self.generator = generator
 
@@ -179,7 +440,7 @@ Job (excerpt):
 {slim_jd}"""
 
         try:
-            response = self.generator.run(prompt=prompt)
+            response = self.generator.run(prompt=prompt, generation_kwargs=self.generation_kwargs)
             letter   = response["replies"][0].strip()
             # Hard-trim at 1000 chars as a safety net so it never overruns half a page
             if len(letter) > 1000:
@@ -187,13 +448,7 @@ Job (excerpt):
             return {"cover_letter": letter}
         except Exception as e:
             logger.error(f"Cover letter failed: {e}")
-            return {"cover_letter": (
-                f"Dear Hiring Manager,\n\n"
-                f"I am excited to apply for this opportunity. As a {title}, I bring "
-                f"expertise in {', '.join(top3)} and a strong track record of delivering results. "
-                f"I am confident I would be a valuable addition to your team.\n\n"
-                f"Sincerely,\n{name}"
-            )}
+            return {"cover_letter": _fallback_cover_letter(persona)}
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -210,6 +465,9 @@ class FinalizeResumeComponent:
     NOT a re-tailor — JD alignment is preserved from Stage 1.
     Its job: adapt length, tone, and emphasis for the chosen format.
     """
+    # Enough for the finalized JSON; stops runaway decoding
+    generation_kwargs = {"num_predict": 1024}
+
     def __init__(self, generator):
         self.generator = generator
 
@@ -230,43 +488,24 @@ class FinalizeResumeComponent:
                 "duration": e.get("duration", ""), "bullets": blist,
             })
 
-        if template == "executive":
-            tone_rules = """- Tone: authoritative, board-room ready, no first-person pronouns.
-- Summary: 4-5 sentence strategic narrative (vision + impact + career arc).
-- Competencies: 9 leadership domain phrases (not tool names).
-- Bullets: scope (team/budget/revenue) then measurable outcome. Max 4 per role."""
-        elif template == "fresher":
-            tone_rules = f"""- Rewrite summary as Career Objective: 2 sentences — contribution intent + strongest qualification.
-- Skills: concrete tool/tech names only.
-- Bullets per role: max {'2' if compact else '3'} — frame as learning + tangible delivery.
-- Emphasize projects heavily — make descriptions specific and results-oriented.
-- Tone: ambitious, eager, forward-looking."""
-        else:
-            tone_rules = f"""- Tone: clean, confident, ATS-friendly.
-- Summary: exactly 3 sentences — role + top skill + value promise.
-- Bullets: action verb → task → metric. Max {'2' if compact else '4'} per role.
-- Skills: exact keyword phrases from JD."""
-
-        page_rules = f"""- Format: {'1-PAGE COMPACT (be concise, trim bullets to 2 per role, skills max 8)' if compact else '2-PAGE FULL-DETAIL (include all bullets and skills, be thorough)'}."""
-
         prompt = f"""You are a professional resume editor finalizing content for a {template.upper()} template on {page_count} page(s).
 DO NOT re-invent or hallucinate content. Only adapt tone, length, and emphasis.
 
 Rules:
-{tone_rules}
-{page_rules}
+{_tone_rules(template, compact)}
+{_PAGE_RULES[compact]}
 
 Tailored content to finalize:
 Summary: {tailored_summary[:600]}
 Skills: {', '.join(tailored_skills[:20])}
-Experience: {json.dumps(tailored_exp)}
+Experience: {orjson.dumps(tailored_exp).decode()}
 JD context: {slim_jd}
 
 Output ONLY valid JSON:
 {{"tailored_summary":"final summary","tailored_skills":["skill1","skill2"],"tailored_experience":[{{"role":"role","company":"company","duration":"duration","tailored_bullets":["bullet1","bullet2"]}}]}}"""
 
         try:
-            response = self.generator.run(prompt=prompt)
+            response = self.generator.run(prompt=prompt, generation_kwargs=self.generation_kwargs)
             content  = response["replies"][0]
             result   = _parse_json(content)
             result.setdefault("tailored_projects", persona.get("projects") or persona.get("tailored_projects", []))
@@ -290,11 +529,19 @@ Output ONLY valid JSON:
 # ─────────────────────────────────────────────────────────────────────────────
 
 class ResumeAdvisorAgent(BaseAgent):
+    # Persona extraction is pure extraction: deterministic, bounded JSON
+    generation_kwargs = {"num_predict": 1024, "temperature": 0}
+
     def __init__(self, generator):
         super().__init__(generator)
+        # Components are stateless wrappers around the generator; build once
+        self.tailor_comp   = TailorResumeComponent(self.generator)
+        self.cl_comp       = CoverLetterComponent(self.generator)
+        self.finalize_comp = FinalizeResumeComponent(self.generator)
         self.pipeline = AsyncPipeline()
-        self.pipeline.add_component("tailor_resume", TailorResumeComponent(self.generator))
-        self.pipeline.add_component("cover_letter",  CoverLetterComponent(self.generator))
+        self.pipeline.add_component("tailor_resume", self.tailor_comp)
+        self.pipeline.add_component("cover_letter",  self.cl_comp)
+        self.pipeline.add_component("finalize_resume", self.finalize_comp)
 
     def extract_persona(self, resume_text: str) -> Dict[str, Any]:
         """
@@ -306,92 +553,73 @@ class ResumeAdvisorAgent(BaseAgent):
         # Pass a meaningful slice — 3000 chars is enough for most resumes
         resume_snippet = str(resume_text).strip()[:3000]
 
-        prompt = f"""Extract structured information from this resume. Output ONLY valid JSON.
-Resume text:
-{resume_snippet}
+        # Same resume text → same persona; skip the LLM on re-uploads
+        cache_key = content_key(resume_snippet)
+        cached = _PERSONA_CACHE.get(cache_key)
+        if cached is not None:
+            logger.info("Persona cache hit")
+            return cached
 
-Required JSON structure (extract real info only):
-{{
-  "full_name": "Full name",
-  "professional_title": "Current role",
-  "years_experience": 0,
-  "email": "email",
-  "phone": "phone",
-  "location": "city, country",
-  "linkedin": "linkedin URL if present",
-  "portfolio_url": "portfolio/github URL if present",
-  "summary": "2-3 sentence bio",
-  "top_skills": ["Skill 1", "Skill 2"],
-  "experience_highlights": [{{"role":"Title","company":"Company","duration":"Dates","key_achievement":"One bullet"}}],
-  "projects": [{{"name":"Project Name","description":"Brief description of what was built and tools used"}}],
-  "education": [{{"degree":"Degree","school":"School","year":"Year"}}],
-  "career_level": "Entry/Mid/Senior/Exec",
-  "suggested_roles": ["Role 1", "Role 2"]
-}}"""
+        prompt = f"{_PERSONA_PROMPT}\nResume text:\n{resume_snippet}"
+
+        # Stream the reply and stop decoding as soon as the JSON object closes,
+        # so trailing chatter never costs generation time or a second parse.
+        scanner = _JsonObjectScanner()
+
+        def on_chunk(chunk):
+            if scanner.feed(chunk.content):
+                raise _ObjectComplete
 
         try:
-            response = self.generator.run(prompt=prompt)
-            content  = response["replies"][0]
-            result = _parse_json(content)
-            # Ensure contact fields exist to prevent UI errors
-            result.setdefault("email", "")
-            result.setdefault("phone", "")
-            result.setdefault("linkedin", "")
-            result.setdefault("portfolio_url", "")
+            try:
+                self.generator.run(prompt=prompt, generation_kwargs=self.generation_kwargs, streaming_callback=on_chunk)
+            except _ObjectComplete:
+                pass
+            result = _coerce_persona(scanner.parse())
+            _PERSONA_CACHE.set(cache_key, result)
             return result
         except Exception as e:
             logger.error(f"Persona extraction failed: {e}")
-            return {
-                "full_name":             "Candidate",
-                "professional_title":    "Professional",
-                "years_experience":      0,
-                "email":                 "",
-                "phone":                 "",
-                "location":              "",
-                "linkedin":              "",
-                "portfolio_url":         "",
-                "summary":               "Resume uploaded. Please review and edit the details below.",
-                "top_skills":            [],
-                "experience_highlights": [],
-                "projects":              [],
-                "education":             [],
-                "certifications":        [],
-                "career_level":          "Unknown",
-                "suggested_roles":       [],
-            }
+            return _fallback_persona()
 
     async def tailor_resume(self, persona: Dict[str, Any], job_description: str, target_industry: str = "", focus_area: str = "", template: str = "professional") -> Dict[str, Any]:
-        """Tailor persona to a JD, running components sequentially."""
-        print(f"Resume Advisor Agent tailoring resume [{template}]...")
-
-        tailor_comp = TailorResumeComponent(self.generator)
-        cl_comp     = CoverLetterComponent(self.generator)
-
-        loop = asyncio.get_event_loop()
-
-        tailor_result = await loop.run_in_executor(
-            None,
-            lambda: tailor_comp.run(persona=persona, job_description=job_description, target_industry=target_industry, focus_area=focus_area, template=template)
-        )
-        cl_result = await loop.run_in_executor(
-            None,
-            lambda: cl_comp.run(persona=persona, job_description=job_description, target_industry=target_industry, focus_area=focus_area)
+        """Tailor persona to a JD, running the resume and cover letter steps concurrently."""
+        logger.debug("Resume Advisor Agent tailoring resume [%s]...", template)
+
+        # Both steps only read the original persona + JD, so there is no reason
+        # to wait for the tailor call before starting the cover letter.
+        tailor_result, cl_result = await asyncio.gather(
+            asyncio.to_thread(
+                self.tailor_comp.run, persona=persona, job_description=job_description,
+                target_industry=target_industry, focus_area=focus_area, template=template,
+            ),
+            asyncio.to_thread(
+                self.cl_comp.run, persona=persona, job_description=job_description,
+                target_industry=target_industry, focus_area=focus_area,
+            ),
+            return_exceptions=True,
         )
 
-        final = tailor_result["tailored_result"]
-        final["cover_letter"] = cl_result["cover_letter"]
+        if isinstance(tailor_result, Exception):
+            logger.error(f"Tailoring failed: {tailor_result}")
+            final = _fallback_tailored(persona)
+        else:
+            final = tailor_result["tailored_result"]
+
+        if isinstance(cl_result, Exception):
+            logger.error(f"Cover letter failed: {cl_result}")
+            final["cover_letter"] = _fallback_cover_letter(persona)
+        else:
+            final["cover_letter"] = cl_result["cover_letter"]
         return final
 
     async def finalize_resume(self, persona: Dict[str, Any], template: str, page_count: int, job_description: str = "") -> Dict[str, Any]:
         """Stage 2: Finalize content for specific template and page count."""
-        print(f"Resume Advisor Agent finalizing resume [{template}, {page_count}p]...")
-        
-        finalize_comp = FinalizeResumeComponent(self.generator)
-        loop = asyncio.get_event_loop()
+        logger.debug("Resume Advisor Agent finalizing resume [%s, %sp]...", template, page_count)
         
-        result = await loop.run_in_executor(
-            None,
-            lambda: finalize_comp.run(persona=persona, template=template, page_count=page_count, job_description=job_description)
+        result = await asyncio.to_thread(
+            self.finalize_comp.run, persona=persona, template=template,
+            page_count=page_count, job_description=job_description,
         )
         return result["final_result"]
 
@@ -400,5 +628,12 @@ Required JSON structure (extract real info only):
         resume_text = state.get("resume_text", "")
         if resume_text:
             persona = self.extract_persona(resume_text)
-            return {**state, "persona": persona}
+            state["persona"] = persona
+            return state
         return state
+
+
+@lru_cache(maxsize=4)
+def get_resume_advisor(generator) -> ResumeAdvisorAgent:
+    """One agent (and its components) per generator, reused across API calls"""
+    return ResumeAdvisorAgent(generator)
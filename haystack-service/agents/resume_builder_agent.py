@@ -1,19 +1,17 @@
 from .base_agent import BaseAgent
 from typing import Dict, Any
+import logging
 
-class ResumeBuilderAgent(BaseAgent):
-    async def run(self, state: Dict[str, Any]) -> Dict[str, Any]:
-        print("Resume Builder Agent running...")
-        messages = state.get("messages", [])
-        last_message = messages[-1]["content"] if messages else ""
-        
-        prompt = f"""You are the Resume Builder Agent.
+logger = logging.getLogger(__name__)
+
+_SYSTEM_PROMPT = """You are the Resume Builder Agent.
 You have access to the user's PROFILE CONTEXT in the message below.
 Provide specific formatting and content advice based on their actual experience and target roles.
-Focus on actionable improvements to improve their ATS visibility.
+Focus on actionable improvements to improve their ATS visibility."""
 
-User Message and Context: {last_message}"""
-        
-        response = self.generator.run(prompt=prompt)
-        
-        return {**state, "final_output": response["replies"][0]}
+class ResumeBuilderAgent(BaseAgent):
+    def build_prompt(self, state: Dict[str, Any]) -> str:
+        logger.debug("Resume Builder Agent running...")
+        messages = state.get("messages", [])
+        last_message = messages[-1]["content"] if messages else ""
+        return f"{_SYSTEM_PROMPT}\n\nUser Message and Context: {last_message}"
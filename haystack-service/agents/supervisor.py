@@ -1,69 +1,107 @@
 from .base_agent import BaseAgent
-from typing import Dict, Any
+from typing import Dict, Any, Set
+import re
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Kept byte-identical across calls so Ollama can reuse the prefix KV cache;
+# the user message is appended last.
+_SYSTEM_PROMPT = (
+    "You are the Supervisor of CareerGini. Route user requests to the correct specialist agent.\n"
+    "Available agents:\n"
+    "- 'profile': Questions about the user's identity, career path, transitions, professional background\n"
+    "- 'skills_gap': Technical skills, programming languages, technologies to learn\n"
+    "- 'job_search': Finding jobs, job boards, interview prep, salary negotiation\n"
+    "- 'resume': Resume review, ATS optimization, formatting, content improvement\n"
+    "- 'learning': Courses, tutorials, certifications, learning resources\n\n"
+    "Examples:\n"
+    "User: 'What is my name?' → profile\n"
+    "User: 'What are my skills?' → profile\n"
+    "User: 'What skills do I need for AI?' → skills_gap\n"
+    "User: 'Review my resume' → resume\n"
+    "User: 'Make my resume ATS-friendly' → resume\n"
+    "User: 'Find remote jobs' → job_search\n"
+    "User: 'Recommend ML courses' → learning\n"
+    "User: 'Should I switch careers?' → profile\n"
+    "User: 'hi' or 'hello' → profile\n\n"
+    "Output ONLY the agent name (one word). No explanations.\n\n"
+)
+
+# Keyword rules, in priority order, used both to short-circuit obvious
+# routes and as a fallback for misroutes
+_KEYWORDS = {
+    "resume": ["resume", "cv", "ats", "application"],
+    "skills_gap": ["skill", "learn", "technology", "programming", "language"],
+    "job_search": ["job", "hire", "interview", "salary", "company"],
+    "learning": ["course", "tutorial", "certification", "study", "class"],
+    "profile": ["career", "transition", "path", "switch", "name", "who am i", "background"]
+}
+_KEYWORD_AGENT = {word: agent for agent, words in _KEYWORDS.items() for word in words}
+# One alternation, longest words first, so a single scan finds every keyword.
+# Anchored at word starts so "ats" in "whats" or "name" in "username" don't count.
+_KEYWORD_RE = re.compile(r"\b(?:" + "|".join(re.escape(w) for w in sorted(_KEYWORD_AGENT, key=len, reverse=True)) + ")")
+
+_VALID_AGENTS = frozenset(_KEYWORDS)
+
+
+def _keyword_hits(message_lower: str) -> Dict[str, int]:
+    """Count distinct keywords per agent in a single pass over the message."""
+    found: Dict[str, Set[str]] = {}
+    for match in _KEYWORD_RE.finditer(message_lower):
+        word = match.group(0)
+        found.setdefault(_KEYWORD_AGENT[word], set()).add(word)
+    return {agent: len(words) for agent, words in found.items()}
 
 class SupervisorAgent(BaseAgent):
+    # Routing only needs a one-word decision, so cap decode at a few tokens
+    generation_kwargs = {"num_predict": 4, "temperature": 0}
+
     async def run(self, state: Dict[str, Any]) -> Dict[str, Any]:
         """
         Route user request to the appropriate agent.
         """
-        print("Supervisor Agent routing...")
+        logger.debug("Supervisor Agent routing...")
         messages = state.get("messages", [])
         last_message = messages[-1]["content"] if messages else ""
         
-        system_prompt = (
-            "You are the Supervisor of CareerGini. Route user requests to the correct specialist agent.\n"
-            "Available agents:\n"
-            "- 'profile': Questions about the user's identity, career path, transitions, professional background\n"
-            "- 'skills_gap': Technical skills, programming languages, technologies to learn\n"
-            "- 'job_search': Finding jobs, job boards, interview prep, salary negotiation\n"
-            "- 'resume': Resume review, ATS optimization, formatting, content improvement\n"
-            "- 'learning': Courses, tutorials, certifications, learning resources\n\n"
-            "Examples:\n"
-            "User: 'What is my name?' → profile\n"
-            "User: 'What are my skills?' → profile\n"
-            "User: 'What skills do I need for AI?' → skills_gap\n"
-            "User: 'Review my resume' → resume\n"
-            "User: 'Make my resume ATS-friendly' → resume\n"
-            "User: 'Find remote jobs' → job_search\n"
-            "User: 'Recommend ML courses' → learning\n"
-            "User: 'Should I switch careers?' → profile\n"
-            "User: 'hi' or 'hello' → profile\n\n"
-            f"User Message: {last_message}\n"
-            "Output ONLY the agent name (one word). No explanations."
-        )
+        message_lower = last_message.lower()
+        hits = _keyword_hits(message_lower)
+        
+        # Obvious intents (2+ keywords from a single category, nothing else)
+        # are routed locally without an Ollama round-trip.
+        if len(hits) == 1:
+            agent, count = next(iter(hits.items()))
+            if count >= 2:
+                logger.info("Supervisor routed by keywords to: %s", agent)
+                state["active_agent"] = agent
+                return state
         
-        # Haystack generator uses 'run' method directly
-        response = self.generator.run(prompt=system_prompt)
+        system_prompt = f"{_SYSTEM_PROMPT}User Message: {last_message}\nAgent:"
+        
+        # Routing is on every request's hot path; awaited directly over the
+        # shared connection pool
+        decision = await self.agenerate(system_prompt)
         
         # Clean response to get agent name
-        decision = response["replies"][0].strip().lower().replace("'", "").replace('"', "")
+        decision = decision.strip().lower().replace("'", "").replace('"', "")
         
         # Take only the first word in case the LLM adds explanation
         decision = decision.split()[0] if decision else "profile"
         
-        # Keyword-based fallback for common misroutes
-        keywords = {
-            "resume": ["resume", "cv", "ats", "application"],
-            "skills_gap": ["skill", "learn", "technology", "programming", "language"],
-            "job_search": ["job", "hire", "interview", "salary", "company"],
-            "learning": ["course", "tutorial", "certification", "study", "class"],
-            "profile": ["career", "transition", "path", "switch", "name", "who am i", "background"]
-        }
-        
         # Validate decision
-        valid_agents = ["profile", "skills_gap", "job_search", "resume", "learning"]
-        if decision not in valid_agents:
-            # Try keyword matching
-            message_lower = last_message.lower()
-            for agent, words in keywords.items():
-                if any(word in message_lower for word in words):
+        if decision not in _VALID_AGENTS:
+            # Try keyword matching, in category priority order
+            for agent in _KEYWORDS:
+                if agent in hits:
                     decision = agent
-                    print(f"Supervisor used keyword fallback: {decision}")
+                    logger.info("Supervisor used keyword fallback: %s", decision)
                     break
             else:
                 # Final fallback to profile
-                print(f"Supervisor unsure (got '{decision}'), defaulting to profile.")
+                logger.info("Supervisor unsure (got '%s'), defaulting to profile.", decision)
                 decision = "profile"
             
-        print(f"Supervisor routed to: {decision}")
-        return {**state, "active_agent": decision}
+        logger.info("Supervisor routed to: %s", decision)
+        state["active_agent"] = decision
+        return state
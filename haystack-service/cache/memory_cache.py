@@ -0,0 +1,52 @@
+"""
+In-process LRU cache for deterministic LLM extractions.
+Avoids re-running the model when the exact same input is seen again.
+"""
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+def content_key(*parts: str) -> str:
+    """Short, stable digest of the given text parts."""
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        h.update(part.encode("utf-8", "surrogatepass"))
+        h.update(b"\x00")
+    return h.hexdigest()
+
+
+class LRUCache:
+    def __init__(self, maxsize: int = 512):
+        """Thread-safe LRU map; agents call it from executor threads."""
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return a copy of the cached value, or None on a miss."""
+        with self._lock:
+            if key not in self._data:
+                return None
+            self._data.move_to_end(key)
+            value = self._data[key]
+        # Callers are free to mutate what they get back
+        return copy.deepcopy(value)
+
+    def set(self, key: str, value: Any):
+        """Store a copy of value, evicting the least recently used entry."""
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -3,114 +3,351 @@ Career Path Predictor
 Predicts career trajectories and provides roadmap recommendations
 """
 
-from typing import Dict, List, Any, Optional
-import json
+import sys
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass, fields, is_dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Tuple
+import orjson
 
-class CareerPathPredictor:
-    def __init__(self):
-        # Career progression paths (simplified - can be ML model in production)
-        self.career_paths = {
-            'software_engineer': {
-                'levels': [
-                    {
-                        'title': 'Junior Software Engineer',
-                        'years_experience': '0-2',
-                        'avg_salary': 75000,
-                        'key_skills': ['Programming', 'Version Control', 'Testing'],
-                        'responsibilities': ['Write code', 'Fix bugs', 'Learn from seniors']
-                    },
-                    {
-                        'title': 'Software Engineer',
-                        'years_experience': '2-4',
-                        'avg_salary': 105000,
-                        'key_skills': ['System Design', 'Code Review', 'Mentoring'],
-                        'responsibilities': ['Design features', 'Review code', 'Mentor juniors']
-                    },
-                    {
-                        'title': 'Senior Software Engineer',
-                        'years_experience': '4-7',
-                        'avg_salary': 145000,
-                        'key_skills': ['Architecture', 'Leadership', 'Technical Strategy'],
-                        'responsibilities': ['Design systems', 'Lead projects', 'Technical decisions']
-                    },
-                    {
-                        'title': 'Staff Engineer / Engineering Manager',
-                        'years_experience': '7-10',
-                        'avg_salary': 185000,
-                        'key_skills': ['Strategic Planning', 'Team Leadership', 'Cross-functional'],
-                        'responsibilities': ['Set technical direction', 'Manage teams', 'Drive initiatives']
-                    },
-                    {
-                        'title': 'Principal Engineer / Director',
-                        'years_experience': '10+',
-                        'avg_salary': 230000,
-                        'key_skills': ['Org-wide Impact', 'Innovation', 'Executive Communication'],
-                        'responsibilities': ['Company-wide tech strategy', 'Major initiatives', 'Thought leadership']
-                    }
-                ],
-                'alternative_paths': [
-                    {
-                        'path': 'Technical Leadership',
-                        'roles': ['Tech Lead', 'Staff Engineer', 'Principal Engineer', 'CTO']
-                    },
-                    {
-                        'path': 'People Management',
-                        'roles': ['Engineering Manager', 'Senior Manager', 'Director', 'VP Engineering']
-                    },
-                    {
-                        'path': 'Product/Startup',
-                        'roles': ['Product Manager', 'Technical PM', 'Founder', 'CEO']
-                    }
-                ]
+from cache.memory_cache import content_key
+
+def _intern_nested(obj: Any) -> Any:
+    """Copy of a dict/list tree with every string interned"""
+    if isinstance(obj, str):
+        return sys.intern(obj)
+    if isinstance(obj, list):
+        return [_intern_nested(item) for item in obj]
+    if isinstance(obj, dict):
+        return {_intern_nested(key): _intern_nested(value) for key, value in obj.items()}
+    return obj
+
+
+# Career progression paths (simplified - can be ML model in production).
+# Read-only source data; requests use the column tables built from it below.
+# Strings repeated across tracks and levels are interned to one copy each.
+_CAREER_PATHS = MappingProxyType(_intern_nested({
+    'software_engineer': {
+        'levels': [
+            {
+                'title': 'Junior Software Engineer',
+                'years_experience': '0-2',
+                'avg_salary': 75000,
+                'key_skills': ['Programming', 'Version Control', 'Testing'],
+                'responsibilities': ['Write code', 'Fix bugs', 'Learn from seniors']
+            },
+            {
+                'title': 'Software Engineer',
+                'years_experience': '2-4',
+                'avg_salary': 105000,
+                'key_skills': ['System Design', 'Code Review', 'Mentoring'],
+                'responsibilities': ['Design features', 'Review code', 'Mentor juniors']
+            },
+            {
+                'title': 'Senior Software Engineer',
+                'years_experience': '4-7',
+                'avg_salary': 145000,
+                'key_skills': ['Architecture', 'Leadership', 'Technical Strategy'],
+                'responsibilities': ['Design systems', 'Lead projects', 'Technical decisions']
+            },
+            {
+                'title': 'Staff Engineer / Engineering Manager',
+                'years_experience': '7-10',
+                'avg_salary': 185000,
+                'key_skills': ['Strategic Planning', 'Team Leadership', 'Cross-functional'],
+                'responsibilities': ['Set technical direction', 'Manage teams', 'Drive initiatives']
             },
-            'data_scientist': {
-                'levels': [
-                    {
-                        'title': 'Junior Data Scientist',
-                        'years_experience': '0-2',
-                        'avg_salary': 80000,
-                        'key_skills': ['Python', 'Statistics', 'SQL', 'Data Visualization'],
-                        'responsibilities': ['Data analysis', 'Build models', 'Create reports']
-                    },
-                    {
-                        'title': 'Data Scientist',
-                        'years_experience': '2-5',
-                        'avg_salary': 120000,
-                        'key_skills': ['Machine Learning', 'Feature Engineering', 'A/B Testing'],
-                        'responsibilities': ['Own projects', 'Deploy models', 'Collaborate with stakeholders']
-                    },
-                    {
-                        'title': 'Senior Data Scientist',
-                        'years_experience': '5-8',
-                        'avg_salary': 160000,
-                        'key_skills': ['Deep Learning', 'MLOps', 'Business Strategy'],
-                        'responsibilities': ['Lead initiatives', 'Mentor team', 'Drive business impact']
-                    },
-                    {
-                        'title': 'Lead Data Scientist / ML Manager',
-                        'years_experience': '8+',
-                        'avg_salary': 200000,
-                        'key_skills': ['Team Leadership', 'Strategic Planning', 'Cross-functional'],
-                        'responsibilities': ['Manage team', 'Set ML strategy', 'Executive communication']
-                    }
-                ],
-                'alternative_paths': [
-                    {
-                        'path': 'ML Engineering',
-                        'roles': ['ML Engineer', 'Senior ML Engineer', 'ML Architect']
-                    },
-                    {
-                        'path': 'Research',
-                        'roles': ['Research Scientist', 'Senior Researcher', 'Research Director']
-                    },
-                    {
-                        'path': 'Leadership',
-                        'roles': ['Data Science Manager', 'Director of DS', 'VP of AI/ML']
-                    }
-                ]
+            {
+                'title': 'Principal Engineer / Director',
+                'years_experience': '10+',
+                'avg_salary': 230000,
+                'key_skills': ['Org-wide Impact', 'Innovation', 'Executive Communication'],
+                'responsibilities': ['Company-wide tech strategy', 'Major initiatives', 'Thought leadership']
             }
-        }
+        ],
+        'alternative_paths': [
+            {
+                'path': 'Technical Leadership',
+                'roles': ['Tech Lead', 'Staff Engineer', 'Principal Engineer', 'CTO']
+            },
+            {
+                'path': 'People Management',
+                'roles': ['Engineering Manager', 'Senior Manager', 'Director', 'VP Engineering']
+            },
+            {
+                'path': 'Product/Startup',
+                'roles': ['Product Manager', 'Technical PM', 'Founder', 'CEO']
+            }
+        ]
+    },
+    'data_scientist': {
+        'levels': [
+            {
+                'title': 'Junior Data Scientist',
+                'years_experience': '0-2',
+                'avg_salary': 80000,
+                'key_skills': ['Python', 'Statistics', 'SQL', 'Data Visualization'],
+                'responsibilities': ['Data analysis', 'Build models', 'Create reports']
+            },
+            {
+                'title': 'Data Scientist',
+                'years_experience': '2-5',
+                'avg_salary': 120000,
+                'key_skills': ['Machine Learning', 'Feature Engineering', 'A/B Testing'],
+                'responsibilities': ['Own projects', 'Deploy models', 'Collaborate with stakeholders']
+            },
+            {
+                'title': 'Senior Data Scientist',
+                'years_experience': '5-8',
+                'avg_salary': 160000,
+                'key_skills': ['Deep Learning', 'MLOps', 'Business Strategy'],
+                'responsibilities': ['Lead initiatives', 'Mentor team', 'Drive business impact']
+            },
+            {
+                'title': 'Lead Data Scientist / ML Manager',
+                'years_experience': '8+',
+                'avg_salary': 200000,
+                'key_skills': ['Team Leadership', 'Strategic Planning', 'Cross-functional'],
+                'responsibilities': ['Manage team', 'Set ML strategy', 'Executive communication']
+            }
+        ],
+        'alternative_paths': [
+            {
+                'path': 'ML Engineering',
+                'roles': ['ML Engineer', 'Senior ML Engineer', 'ML Architect']
+            },
+            {
+                'path': 'Research',
+                'roles': ['Research Scientist', 'Senior Researcher', 'Research Director']
+            },
+            {
+                'path': 'Leadership',
+                'roles': ['Data Science Manager', 'Director of DS', 'VP of AI/ML']
+            }
+        ]
+    }
+}))
+
+
+# Years of experience at which each level after Junior begins
+# (Mid, Senior, Staff/Manager, Principal/Director)
+_LEVEL_THRESHOLDS = (2, 4, 7, 10)
+
+# Skill keywords (lowercase) that place a profile on a non-default track,
+# checked in order
+_DS_KEYWORDS = frozenset({'machine learning', 'data science', 'statistics'})
+_ROLE_KEYWORDS = (
+    (_DS_KEYWORDS, 'data_scientist'),
+)
+
+# Path recommendations by current level (3+ shares the last set), each
+# followed by the advice common to every level
+_RECS_BY_LEVEL = (
+    ("Focus on building strong technical fundamentals",
+     "Seek mentorship from senior engineers",
+     "Contribute to open source projects"),
+    ("Start leading small projects",
+     "Develop system design skills",
+     "Begin mentoring junior developers"),
+    ("Choose between technical leadership or management track",
+     "Build cross-functional collaboration skills",
+     "Develop strategic thinking abilities"),
+    ("Focus on org-wide impact",
+     "Build executive communication skills",
+     "Drive innovation and thought leadership"),
+)
+_RECS_COMMON = (
+    "Network actively in your industry",
+    "Keep learning new technologies and trends",
+)
+_RECOMMENDATIONS = tuple(recs + _RECS_COMMON for recs in _RECS_BY_LEVEL)
+
+
+# Prediction result types. Frozen and slotted: results hold no per-instance
+# __dict__, can be shared between callers and are encoded by orjson directly.
+@dataclass(slots=True, frozen=True)
+class TimelineEntry:
+    level: int
+    title: str
+    years_from_now: int
+    duration_years: int
+    salary: int
+    key_skills_needed: Tuple[str, ...]
+
+
+@dataclass(slots=True, frozen=True)
+class Milestone:
+    milestone: str
+    type: str
+    timeline: str
+    importance: str
+
+
+@dataclass(slots=True, frozen=True)
+class SalaryRange:
+    min: int
+    max: int
+
+
+@dataclass(slots=True, frozen=True)
+class SalaryPoint:
+    year: int
+    title: str
+    salary: int
+    salary_range: SalaryRange
+
+
+@dataclass(slots=True, frozen=True)
+class SalaryProjection:
+    projections: Tuple[SalaryPoint, ...]
+    total_growth: int
+    growth_percentage: int
+
+
+@dataclass(slots=True, frozen=True)
+class AlternativePath:
+    path: str
+    roles: Tuple[str, ...]
+
+
+@dataclass(slots=True, frozen=True)
+class CareerPathResult:
+    current_level: int
+    role_category: str
+    timeline: Tuple[TimelineEntry, ...]
+    success_probability: int
+    milestones: Tuple[Milestone, ...]
+    salary_projection: SalaryProjection
+    alternative_paths: Tuple[AlternativePath, ...]
+    recommendations: Tuple[str, ...]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict/list form of the result, freshly built for the caller"""
+        return _to_plain(self)
+
+
+def _to_plain(value: Any) -> Any:
+    if isinstance(value, tuple):
+        return [_to_plain(v) for v in value]
+    if is_dataclass(value):
+        return {f.name: _to_plain(getattr(value, f.name)) for f in fields(value)}
+    return value
+
+
+# Milestones that follow the next-level skill milestone at every level
+_COMMON_MILESTONES = (
+    Milestone(
+        milestone="Lead a major project",
+        type="experience",
+        timeline="6-12 months",
+        importance="high"
+    ),
+    Milestone(
+        milestone="Mentor junior team members",
+        type="leadership",
+        timeline="Ongoing",
+        importance="high"
+    ),
+    Milestone(
+        milestone="Build strong network",
+        type="networking",
+        timeline="Ongoing",
+        importance="medium"
+    ),
+)
+
+@dataclass(slots=True, frozen=True)
+class RoleTable:
+    """
+    Column-wise view of one track's levels: index i of every column
+    describes level i, so the hot path walks arrays instead of level dicts.
+    """
+    titles: Tuple[str, ...]
+    min_years: array
+    durations: array
+    salaries: array
+    salary_min: array
+    salary_max: array
+    key_skills: Tuple[Tuple[str, ...], ...]
+    alternative_paths: Tuple[AlternativePath, ...]
+    # Salary projection for each possible starting level
+    salary_projections: Tuple[SalaryProjection, ...]
+
+
+def _project_salaries(
+    titles: Tuple[str, ...],
+    salaries: array,
+    salary_min: array,
+    salary_max: array,
+    start: int
+) -> SalaryProjection:
+    """Salary projection over the three levels from start (fewer near the top)"""
+    projections = tuple(
+        SalaryPoint(
+            year=(i - start) * 3,  # Assume 3 years per level
+            title=titles[i],
+            salary=salaries[i],
+            salary_range=SalaryRange(min=salary_min[i], max=salary_max[i])
+        )
+        for i in range(start, min(start + 3, len(titles)))
+    )
+    if not projections:
+        return SalaryProjection(projections=(), total_growth=0, growth_percentage=0)
+    
+    first, last = projections[0].salary, projections[-1].salary
+    return SalaryProjection(
+        projections=projections,
+        total_growth=last - first,
+        growth_percentage=int(((last / first) - 1) * 100) if first > 0 else 0
+    )
+
+
+def _build_role_table(path: Dict[str, Any]) -> RoleTable:
+    """Parse one _CAREER_PATHS entry into columns, once at import"""
+    min_years, durations = [], []
+    for level in path['levels']:
+        years_range = level['years_experience']
+        if '-' in years_range:
+            low, high = years_range.split('-')
+            min_years.append(int(low))
+            durations.append(int(high) - int(low))
+        else:
+            min_years.append(int(years_range.rstrip('+')))
+            durations.append(3)  # Default
+    titles = tuple(level['title'] for level in path['levels'])
+    salaries = array('i', (level['avg_salary'] for level in path['levels']))
+    salary_min = array('i', (int(salary * 0.8) for salary in salaries))
+    salary_max = array('i', (int(salary * 1.2) for salary in salaries))
     
+    return RoleTable(
+        titles=titles,
+        min_years=array('B', min_years),
+        durations=array('B', durations),
+        salaries=salaries,
+        salary_min=salary_min,
+        salary_max=salary_max,
+        key_skills=tuple(tuple(level['key_skills']) for level in path['levels']),
+        alternative_paths=tuple(
+            AlternativePath(path=alt['path'], roles=tuple(alt['roles']))
+            for alt in path.get('alternative_paths', ())
+        ),
+        # The projection depends only on the starting level, so every
+        # possible one is computed here rather than per request
+        salary_projections=tuple(
+            _project_salaries(titles, salaries, salary_min, salary_max, start)
+            for start in range(len(_LEVEL_THRESHOLDS) + 1)
+        ),
+    )
+
+
+_ROLE_TABLES = MappingProxyType({
+    name: _build_role_table(path) for name, path in _CAREER_PATHS.items()
+})
+
+
+class CareerPathPredictor:
     def predict_path(
         self,
         user_profile: Dict[str, Any],
@@ -126,218 +363,220 @@ class CareerPathPredictor:
         Returns:
             Career path prediction with timeline and milestones
         """
+        return self.predict(user_profile, target_role).to_dict()
+    
+    def predict(
+        self,
+        user_profile: Dict[str, Any],
+        target_role: Optional[str] = None
+    ) -> CareerPathResult:
+        """Same prediction as predict_path, as an immutable CareerPathResult"""
+        return self._build_prediction(*self._profile_key(user_profile, target_role))
+    
+    def predict_path_json(
+        self,
+        user_profile: Dict[str, Any],
+        target_role: Optional[str] = None
+    ) -> bytes:
+        """
+        Same prediction as predict_path, serialized to JSON bytes.
+        
+        The output only depends on a few derived profile features, so
+        repeat shapes are served straight from an LRU of encoded responses.
+        """
+        return _prediction_json(*self._profile_key(user_profile, target_role))
+    
+    def _profile_key(
+        self,
+        user_profile: Dict[str, Any],
+        target_role: Optional[str]
+    ) -> Tuple[int, str, int]:
+        """Reduce a profile to the (level, category, probability) the prediction depends on"""
         # Determine current level
         current_level = self._determine_current_level(user_profile)
         
         # Get career path
         role_category = target_role or self._infer_role_category(user_profile)
-        path_data = self.career_paths.get(role_category, self.career_paths['software_engineer'])
-        
-        # Generate progression timeline
-        timeline = self._generate_timeline(current_level, path_data['levels'])
         
         # Calculate success probability
-        success_probability = self._calculate_success_probability(user_profile, current_level)
+        success_probability = self._calculate_success_probability(
+            self._profile_features(user_profile), current_level
+        )
         
-        # Generate milestones
-        milestones = self._generate_milestones(current_level, path_data['levels'])
+        return current_level, role_category, success_probability
+    
+    def _build_prediction(
+        self,
+        current_level: int,
+        role_category: str,
+        success_probability: int
+    ) -> CareerPathResult:
+        """Assemble the prediction for already-derived profile features"""
+        table = _ROLE_TABLES.get(role_category) or _ROLE_TABLES['software_engineer']
         
-        # Salary projections
-        salary_projection = self._project_salary(current_level, path_data['levels'])
+        # Progression timeline, milestones and salary projections
+        timeline, milestones, salary_projection = self._walk_levels(current_level, table)
         
-        return {
-            "current_level": current_level,
-            "role_category": role_category,
-            "timeline": timeline,
-            "success_probability": success_probability,
-            "milestones": milestones,
-            "salary_projection": salary_projection,
-            "alternative_paths": path_data.get('alternative_paths', []),
-            "recommendations": self._generate_path_recommendations(current_level, user_profile)
-        }
+        return CareerPathResult(
+            current_level=current_level,
+            role_category=role_category,
+            timeline=timeline,
+            success_probability=success_probability,
+            milestones=milestones,
+            salary_projection=salary_projection,
+            alternative_paths=table.alternative_paths,
+            recommendations=self._generate_path_recommendations(current_level)
+        )
     
     def _determine_current_level(self, user_profile: Dict[str, Any]) -> int:
         """Determine user's current career level (0-4)"""
-        experience = user_profile.get('experience', [])
+        experience = user_profile.get('experience', ())
         years = len(experience) * 2  # Simplified calculation
         
-        if years < 2:
-            return 0  # Junior
-        elif years < 4:
-            return 1  # Mid
-        elif years < 7:
-            return 2  # Senior
-        elif years < 10:
-            return 3  # Staff/Manager
-        else:
-            return 4  # Principal/Director
+        return bisect_right(_LEVEL_THRESHOLDS, years)
     
     def _infer_role_category(self, user_profile: Dict[str, Any]) -> str:
         """Infer role category from profile"""
-        skills = [s.lower() for s in user_profile.get('skills', [])]
+        skills = {s.lower() for s in user_profile.get('skills', ())}
         
-        # Simple keyword matching
-        if any(skill in skills for skill in ['machine learning', 'data science', 'statistics']):
-            return 'data_scientist'
+        # Simple keyword matching, one set intersection per category
+        for keywords, category in _ROLE_KEYWORDS:
+            if not skills.isdisjoint(keywords):
+                return category
         
         return 'software_engineer'  # Default
     
-    def _generate_timeline(
+    def _walk_levels(
         self,
         current_level: int,
-        levels: List[Dict]
-    ) -> List[Dict]:
-        """Generate career progression timeline"""
+        table: RoleTable
+    ) -> Tuple[Tuple[TimelineEntry, ...], Tuple[Milestone, ...], SalaryProjection]:
+        """Build timeline and milestones in one pass over levels; the salary projection is precomputed"""
         timeline = []
+        milestones: Tuple[Milestone, ...] = ()
         current_year = 0
         
-        for i in range(current_level, len(levels)):
-            level = levels[i]
-            
-            # Parse years from experience range
-            years_range = level['years_experience']
-            if '-' in years_range:
-                min_years, max_years = years_range.split('-')
-                duration = int(max_years) - int(min_years)
-            else:
-                duration = 3  # Default
-            
-            timeline.append({
-                "level": i,
-                "title": level['title'],
-                "years_from_now": current_year,
-                "duration_years": duration,
-                "salary": level['avg_salary'],
-                "key_skills_needed": level['key_skills']
-            })
+        # Each level is visited once for both walked outputs rather than
+        # re-walked by separate helpers
+        for i in range(current_level, len(table.titles)):
+            offset = i - current_level
+            duration = table.durations[i]
             
+            timeline.append(TimelineEntry(
+                level=i,
+                title=table.titles[i],
+                years_from_now=current_year,
+                duration_years=duration,
+                salary=table.salaries[i],
+                key_skills_needed=table.key_skills[i]
+            ))
             current_year += duration
+            
+            # Milestones start with mastering the next level's first skill
+            if offset == 1:
+                milestones = (
+                    Milestone(
+                        milestone=f"Master {table.key_skills[i][0]}",
+                        type="skill",
+                        timeline="3-6 months",
+                        importance="critical"
+                    ),
+                ) + _COMMON_MILESTONES
         
-        return timeline
+        salary_projection = table.salary_projections[current_level]
+        return tuple(timeline), milestones, salary_projection
+    
+    def _generate_timeline(
+        self,
+        current_level: int,
+        table: RoleTable
+    ) -> Tuple[TimelineEntry, ...]:
+        """Generate career progression timeline"""
+        return self._walk_levels(current_level, table)[0]
+    
+    def _profile_features(self, user_profile: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract the profile facts the success probability is scored on"""
+        return {
+            "skills_count": len(user_profile.get('skills', ())),
+            "has_grad_degree": any(
+                'master' in text or 'phd' in text
+                for text in (str(edu).lower() for edu in user_profile.get('education', ()))
+            ),
+        }
     
     def _calculate_success_probability(
         self,
-        user_profile: Dict[str, Any],
+        profile_features: Dict[str, Any],
         current_level: int
     ) -> int:
         """Calculate probability of reaching next level (0-100)"""
-        # Factors: skills, education, experience quality
-        base_probability = 70
-        
-        # Adjust for skills
-        skills_count = len(user_profile.get('skills', []))
-        if skills_count > 10:
-            base_probability += 10
-        elif skills_count < 5:
-            base_probability -= 10
+        # Factors: skills, education, experience quality.
+        # Harder to progress at higher levels.
+        skills_count = profile_features['skills_count']
+        probability = (
+            70
+            + 10 * (skills_count > 10)
+            - 10 * (skills_count < 5)
+            + 10 * profile_features['has_grad_degree']
+            - 5 * current_level
+        )
         
-        # Adjust for education
-        education = user_profile.get('education', [])
-        if any('master' in str(edu).lower() or 'phd' in str(edu).lower() for edu in education):
-            base_probability += 10
-        
-        # Adjust for current level (harder to progress at higher levels)
-        base_probability -= current_level * 5
-        
-        return max(30, min(95, base_probability))
+        return max(30, min(95, probability))
     
     def _generate_milestones(
         self,
         current_level: int,
-        levels: List[Dict]
-    ) -> List[Dict]:
+        table: RoleTable
+    ) -> Tuple[Milestone, ...]:
         """Generate key milestones for career progression"""
-        if current_level >= len(levels) - 1:
-            return []
-        
-        next_level = levels[current_level + 1]
-        
-        milestones = [
-            {
-                "milestone": f"Master {next_level['key_skills'][0]}",
-                "type": "skill",
-                "timeline": "3-6 months",
-                "importance": "critical"
-            },
-            {
-                "milestone": "Lead a major project",
-                "type": "experience",
-                "timeline": "6-12 months",
-                "importance": "high"
-            },
-            {
-                "milestone": "Mentor junior team members",
-                "type": "leadership",
-                "timeline": "Ongoing",
-                "importance": "high"
-            },
-            {
-                "milestone": "Build strong network",
-                "type": "networking",
-                "timeline": "Ongoing",
-                "importance": "medium"
-            }
-        ]
-        
-        return milestones
+        return self._walk_levels(current_level, table)[1]
     
     def _project_salary(
         self,
         current_level: int,
-        levels: List[Dict]
-    ) -> Dict[str, Any]:
+        table: RoleTable
+    ) -> SalaryProjection:
         """Project salary growth over time"""
-        projections = []
-        
-        for i in range(current_level, min(current_level + 3, len(levels))):
-            level = levels[i]
-            years_from_now = (i - current_level) * 3  # Assume 3 years per level
-            
-            projections.append({
-                "year": years_from_now,
-                "title": level['title'],
-                "salary": level['avg_salary'],
-                "salary_range": {
-                    "min": int(level['avg_salary'] * 0.8),
-                    "max": int(level['avg_salary'] * 1.2)
-                }
-            })
-        
-        return {
-            "projections": projections,
-            "total_growth": projections[-1]['salary'] - projections[0]['salary'] if projections else 0,
-            "growth_percentage": int(((projections[-1]['salary'] / projections[0]['salary']) - 1) * 100) if projections and projections[0]['salary'] > 0 else 0
-        }
+        return self._walk_levels(current_level, table)[2]
     
-    def _generate_path_recommendations(
-        self,
-        current_level: int,
-        user_profile: Dict[str, Any]
-    ) -> List[str]:
+    def _generate_path_recommendations(self, current_level: int) -> Tuple[str, ...]:
         """Generate actionable career path recommendations"""
-        recommendations = []
-        
-        if current_level == 0:
-            recommendations.append("Focus on building strong technical fundamentals")
-            recommendations.append("Seek mentorship from senior engineers")
-            recommendations.append("Contribute to open source projects")
-        elif current_level == 1:
-            recommendations.append("Start leading small projects")
-            recommendations.append("Develop system design skills")
-            recommendations.append("Begin mentoring junior developers")
-        elif current_level == 2:
-            recommendations.append("Choose between technical leadership or management track")
-            recommendations.append("Build cross-functional collaboration skills")
-            recommendations.append("Develop strategic thinking abilities")
-        else:
-            recommendations.append("Focus on org-wide impact")
-            recommendations.append("Build executive communication skills")
-            recommendations.append("Drive innovation and thought leadership")
-        
-        recommendations.append("Network actively in your industry")
-        recommendations.append("Keep learning new technologies and trends")
-        
-        return recommendations
+        # Level 3 and above share the leadership set
+        return _RECOMMENDATIONS[min(current_level, 3)]
+
+
+# The predictor holds no per-request state, so one instance serves every call
+_PREDICTOR = CareerPathPredictor()
+
+
+# Optional shared cache (get/set of str by agent and query, e.g. the Redis
+# ResponseCache) behind the in-process LRU, so encoded predictions survive
+# restarts and are shared between workers. Off unless the app installs one.
+_persistent_cache: Optional[Any] = None
+
+
+def set_persistent_cache(cache: Optional[Any]):
+    """Install (or with None, remove) the shared second-level prediction cache"""
+    global _persistent_cache
+    _persistent_cache = cache
+    _prediction_json.cache_clear()
+
+
+@lru_cache(maxsize=4096)
+def _prediction_json(current_level: int, role_category: str, success_probability: int) -> bytes:
+    """Encoded prediction per distinct feature tuple; bytes are immutable so safe to share"""
+    persistent = _persistent_cache
+    if persistent is not None:
+        key = content_key(str(current_level), role_category, str(success_probability))
+        cached = persistent.get("career_path", key)
+        if cached is not None:
+            return cached.encode()
+    
+    # orjson encodes the slotted dataclasses natively, in field order
+    encoded = orjson.dumps(_PREDICTOR._build_prediction(current_level, role_category, success_probability))
+    if persistent is not None:
+        persistent.set("career_path", key, encoded.decode())
+    return encoded
 
 
 # Utility function for API endpoint
@@ -355,5 +594,21 @@ def predict_career_path(
     Returns:
         Career path prediction with timeline and recommendations
     """
-    predictor = CareerPathPredictor()
-    return predictor.predict_path(user_profile, target_role)
+    return _PREDICTOR.predict_path(user_profile, target_role)
+
+
+def predict_career_path_json(
+    user_profile: Dict[str, Any],
+    target_role: Optional[str] = None
+) -> bytes:
+    """
+    Predict career path for user, as ready-to-send JSON bytes
+    
+    Args:
+        user_profile: User's profile data
+        target_role: Optional target role category
+    
+    Returns:
+        UTF-8 JSON encoding of the predict_career_path result
+    """
+    return _PREDICTOR.predict_path_json(user_profile, target_role)
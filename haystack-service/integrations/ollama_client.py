@@ -3,95 +3,201 @@ Ollama Client for CareerGini (Haystack Version)
 100% Local LLM Inference - NO External APIs
 """
 
+from haystack import component
+from haystack.dataclasses import StreamingChunk
 from haystack_integrations.components.generators.ollama import OllamaGenerator
-from typing import Literal
+from functools import cached_property
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple
+import asyncio
+import httpx
 import os
 import logging
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
+# Single local model serving every task type
+_MODEL_NAME = "qwen2.5:1.5b"
+
+
+def _keep_alive():
+    """
+    How long Ollama keeps the model loaded after a request. Defaults to -1
+    (forever) so an idle spell never makes the next user pay for a reload;
+    OLLAMA_KEEP_ALIVE accepts seconds or a duration such as "30m".
+    """
+    value = os.getenv("OLLAMA_KEEP_ALIVE", "-1")
+    try:
+        return float(value) if "." in value else int(value)
+    except ValueError:
+        return value
+
+
+# Per-task sampling params layered over the shared generator settings
+_TASK_PARAMS = {
+    # Model 1: Complex Reasoning (Supervisor, Resume Builder)
+    "reasoning": {"temperature": 0.7, "repeat_penalty": 1.1},
+    # Model 2: Fast Tasks (Profile, Jobs, Learning)
+    # Lowered temperature for more determinism and speed
+    "fast": {"temperature": 0.1, "repeat_penalty": 1.0},
+    # Model 3: Technical/Coding Tasks (Skills Gap)
+    "coding": {"temperature": 0.1, "repeat_penalty": 1.05},
+}
+
+# Bounds for Ollama's per-request thread count
+_MIN_THREADS = 1
+_MAX_THREADS = 16
+# Used when OLLAMA_NUM_THREADS is unset. The threads run inside the Ollama
+# container, whose CPU allocation this service cannot see, so there is
+# nothing local worth probing.
+_DEFAULT_THREADS = 4
+
+
+def _detect_threads() -> int:
+    """CPU threads to ask Ollama for: OLLAMA_NUM_THREADS when set, otherwise 4."""
+    override = os.getenv("OLLAMA_NUM_THREADS")
+    if override:
+        try:
+            return max(_MIN_THREADS, min(_MAX_THREADS, int(override)))
+        except ValueError:
+            logger.warning(f"Ignoring invalid OLLAMA_NUM_THREADS={override!r}")
+    return _DEFAULT_THREADS
+
+
+# Seconds a health result is reused before Ollama is probed again
+_HEALTH_TTL = 1.5
+
+
+@component
+class TaskGenerator:
+    """
+    Per-task view over a shared OllamaGenerator.
+    Applies the task's sampling params on every call while all task types
+    share one model config and one underlying ollama.Client.
+    """
+    def __init__(self, generator: OllamaGenerator, **task_kwargs):
+        self.generator = generator
+        self.model = generator.model
+        self.url = generator.url
+        self.timeout = generator.timeout
+        self.keep_alive = generator.keep_alive
+        self.generation_kwargs = {**generator.generation_kwargs, **task_kwargs}
+
+    @component.output_types(replies=List[str], meta=List[Dict[str, Any]])
+    def run(
+        self,
+        prompt: str,
+        generation_kwargs: Optional[Dict[str, Any]] = None,
+        streaming_callback: Optional[Callable[[StreamingChunk], None]] = None,
+    ):
+        return self.generator.run(
+            prompt=prompt,
+            generation_kwargs={**self.generation_kwargs, **(generation_kwargs or {})},
+            streaming_callback=streaming_callback,
+        )
+
+
 class OllamaClient:
     """
     Centralized Ollama client for all LLM operations.
-    Supports three model types for different task complexities.
+    Supports three task types for different task complexities, all served
+    by the same model through one shared generator.
     """
     
     def __init__(self):
         self.base_url = os.getenv("OLLAMA_BASE_URL", "http://ollama:11434")
-        # Reduced threads to 4 for legacy CPU to avoid synchronization overhead
-        num_threads = 4
+        # OLLAMA_NUM_THREADS when set, else a fixed 4
+        self.num_threads = _detect_threads()
+        self._task_generators: Dict[str, TaskGenerator] = {}
+        # Reused across health probes; created on first check
+        self._http: Optional[httpx.AsyncClient] = None
+        self._last_health: Optional[Tuple[float, dict]] = None
+        self._health_lock: Optional[asyncio.Lock] = None
         
-        logger.info(f"Initializing Haystack Ollama client with base_url: {self.base_url}")
-        
-        # Model 1: Complex Reasoning (Supervisor, Resume Builder)
-        self.generator_reasoning = OllamaGenerator(
-            model="qwen2.5:1.5b",
-            url=self.base_url,
-            timeout=1200,
-            generation_kwargs={
-                "temperature": 0.7,
-                "num_ctx": 2048, # Reduced from 4096
-                "num_thread": num_threads,
-                "top_p": 0.9,
-                "repeat_penalty": 1.1
-            }
+        logger.info(
+            f"Initialized Haystack Ollama client (base_url={self.base_url}, num_threads={self.num_threads})",
+            extra={
+                "base_url": self.base_url,
+                "num_threads": self.num_threads,
+                "model_name": _MODEL_NAME,
+                "task_types": list(_TASK_PARAMS),
+            },
         )
-        logger.info("✓ Loaded reasoning model generator: qwen2.5:1.5b")
-        
-        # Model 2: Fast Tasks (Profile, Jobs, Learning)
-        self.generator_fast = OllamaGenerator(
-            model="qwen2.5:1.5b",
+
+        # Load the model into Ollama's memory now so the first user request
+        # doesn't pay for it. Runs in the background; failures only log.
+        if os.getenv("OLLAMA_PREWARM", "1") == "1":
+            threading.Thread(target=self._prewarm, name="ollama-prewarm", daemon=True).start()
+    
+    @cached_property
+    def generator(self) -> OllamaGenerator:
+        """Shared generator, built on first use"""
+        generator = OllamaGenerator(
+            model=_MODEL_NAME,
             url=self.base_url,
             timeout=1200,
+            keep_alive=_keep_alive(),
             generation_kwargs={
-                "temperature": 0.1, # Lowered for more determinism and speed
                 "num_ctx": 2048, # Reduced from 4096
-                "num_thread": num_threads,
-                "top_p": 0.9,
-                "repeat_penalty": 1.0
-            }
-        )
-        logger.info("✓ Loaded fast model generator: qwen2.5:1.5b")
-        
-        # Model 3: Technical/Coding Tasks (Skills Gap)
-        self.generator_coder = OllamaGenerator(
-            model="qwen2.5:1.5b",
-            url=self.base_url,
-            timeout=1200,
-            generation_kwargs={
-                "temperature": 0.1,
-                "num_ctx": 2048,
-                "num_thread": num_threads,
+                "num_thread": self.num_threads,
                 "top_p": 0.9,
-                "repeat_penalty": 1.05
             }
         )
-        logger.info("✓ Loaded coder model generator: qwen2.5:1.5b")
+        logger.info(f"✓ Loaded model generator: {_MODEL_NAME}")
+        return generator
     
-    def get_generator(self, task_type: Literal["reasoning", "fast", "coding"]) -> OllamaGenerator:
+    def _prewarm(self):
+        """One-token generation with the shared model settings"""
+        try:
+            self.generator.run(prompt="hi", generation_kwargs={"num_predict": 1})
+            logger.info(f"✓ Prewarmed model: {_MODEL_NAME}")
+        except Exception as e:
+            logger.warning(f"Ollama prewarm failed: {e}")
+    
+    def get_generator(self, task_type: Literal["reasoning", "fast", "coding"]) -> TaskGenerator:
         """
         Get appropriate generator for task type.
         """
-        if task_type == "reasoning":
-            return self.generator_reasoning
-        elif task_type == "coding":
-            return self.generator_coder
-        else:
-            return self.generator_fast
+        if task_type not in _TASK_PARAMS:
+            task_type = "fast"
+        generator = self._task_generators.get(task_type)
+        if generator is None:
+            generator = TaskGenerator(self.generator, **_TASK_PARAMS[task_type])
+            self._task_generators[task_type] = generator
+        return generator
     
     async def health_check(self) -> dict:
-        """Check Ollama service health"""
+        """
+        Check Ollama service health.
+        Results are reused for a short TTL and concurrent callers share a
+        single in-flight probe, so bursts of readiness checks cost one request.
+        """
+        cached = self._last_health
+        if cached is not None and time.monotonic() - cached[0] < _HEALTH_TTL:
+            return cached[1]
+        if self._health_lock is None:
+            self._health_lock = asyncio.Lock()
+        async with self._health_lock:
+            cached = self._last_health
+            if cached is not None and time.monotonic() - cached[0] < _HEALTH_TTL:
+                return cached[1]
+            result = await self._probe()
+            self._last_health = (time.monotonic(), result)
+            return result
+
+    async def _probe(self) -> dict:
         try:
-            import httpx
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(f"{self.base_url}/api/tags")
-                if response.status_code == 200:
-                    models = response.json().get("models", [])
-                    return {
-                        "status": "healthy",
-                        "models_available": len(models),
-                        "base_url": self.base_url
-                    }
+            if self._http is None or self._http.is_closed:
+                self._http = httpx.AsyncClient(base_url=self.base_url, timeout=5.0)
+            response = await self._http.get("/api/tags")
+            if response.status_code == 200:
+                models = response.json().get("models", [])
+                return {
+                    "status": "healthy",
+                    "models_available": len(models),
+                    "base_url": self.base_url
+                }
         except Exception as e:
             logger.error(f"Ollama health check failed: {e}")
             return {
@@ -100,12 +206,21 @@ class OllamaClient:
                 "base_url": self.base_url
             }
 
+    async def aclose(self):
+        """Close the pooled health-check connection; called on app shutdown"""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
 # Global singleton instance
 _ollama_client = None
+_ollama_client_lock = threading.Lock()
 
 def get_ollama_client() -> OllamaClient:
     """Get or create global Ollama client instance"""
     global _ollama_client
     if _ollama_client is None:
-        _ollama_client = OllamaClient()
+        with _ollama_client_lock:
+            if _ollama_client is None:
+                _ollama_client = OllamaClient()
     return _ollama_client
@@ -3,53 +3,170 @@ AI Mock Interview Simulator
 Conducts realistic interview practice sessions with AI evaluation
 """
 
-from typing import Dict, List, Any, Optional
-import json
+from typing import Dict, List, Any, Mapping, Optional, Tuple
+import asyncio
+import orjson
 import re
-from datetime import datetime
+import sys
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
+from cache.memory_cache import LRUCache, content_key
+
+# Parsed evaluations keyed by question and normalized answer; candidates
+# often give near-identical answers to the fixed question banks
+_EVAL_CACHE = LRUCache(maxsize=1024)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+_ISO_FMT = "%Y-%m-%dT%H:%M:%S"
+
+def _now_iso() -> str:
+    """Local timestamp in isoformat with microseconds, without building a datetime"""
+    t = time.time()
+    return f"{time.strftime(_ISO_FMT, time.localtime(t))}.{int(t % 1 * 1e6):06d}"
+
+# Body of the first markdown code fence (closing fence optional)
+_JSON_BLOCK_RE = re.compile(r"```(?:json)?\s*(.*?)\s*(?:```|$)", re.DOTALL)
+
+# Filler words are counted locally; small models miscount them and asking
+# costs prompt and output tokens
+_FILLER_RE = re.compile(
+    r"\b(?:um+|uh+|like|you know|basically|actually|literally|sort of|kind of|i mean)\b",
+    re.IGNORECASE,
+)
+
+# Evaluation prompts put everything static first and the candidate's answers
+# last. Every call then shares a byte-identical prefix, which Ollama can reuse
+# from its prompt cache instead of re-running prefill over the rubric.
+_EVALUATION_RUBRIC = """You are an expert interview coach evaluating a candidate's interview answers.
+
+Evaluate each answer on the following criteria (score each 0-100):
+1. Relevance - Does the answer address the question?
+2. Clarity - Is the answer clear and well-structured?
+3. Completeness - Does it cover all aspects of the question?
+4. Confidence - Does the candidate sound confident?
+5. Examples - Are there specific examples (for behavioral questions)?
+
+Also identify for each answer:
+- Strengths of the answer
+- Areas for improvement
+- Suggested better answer (brief)
+"""
+
+_EVALUATION_SCHEMA = """{
+    "overall_score": 85,
+    "relevance_score": 90,
+    "clarity_score": 80,
+    "completeness_score": 85,
+    "confidence_score": 85,
+    "strengths": ["specific example", "clear structure"],
+    "improvements": ["add more quantifiable results", "reduce filler words"],
+    "suggested_improvement": "Brief suggestion here"
+}"""
+
+_EVALUATION_PREFIX = f"""{_EVALUATION_RUBRIC}
+Return your evaluation in JSON format:
+{_EVALUATION_SCHEMA}
+
+Answer to evaluate:
+"""
+
+_BATCH_EVALUATION_PREFIX = f"""{_EVALUATION_RUBRIC}
+Return a JSON array with one evaluation per answer, in order, each tagged
+with its [index] as "index" (e.g. "index": 1) alongside these fields:
+{_EVALUATION_SCHEMA}
+
+Answers to evaluate:
+"""
+
+# Answers shorter than this can't satisfy any rubric and are scored
+# locally instead of spending an LLM round-trip on them
+_MIN_ANSWER_WORDS = 10
+_MIN_ANSWER_CHARS = 40
+
+# Most answers packed into one evaluation prompt; larger batches start to
+# cost accuracy on small local models
+_EVAL_BATCH_SIZE = 8
+
+# Question banks by type, shared read-only by every simulator
+_QUESTION_BANKS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    sys.intern('behavioral'): (
+        "Tell me about a time when you faced a significant challenge at work. How did you handle it?",
+        "Describe a situation where you had to work with a difficult team member.",
+        "Give me an example of a goal you set and how you achieved it.",
+        "Tell me about a time you failed. What did you learn from it?",
+        "Describe a situation where you had to adapt to significant changes.",
+    ),
+    sys.intern('technical'): (
+        "Explain the difference between a stack and a queue.",
+        "What is the time complexity of binary search?",
+        "How would you design a URL shortening service?",
+        "Explain what happens when you type a URL in a browser.",
+        "What are the principles of object-oriented programming?",
+    ),
+    sys.intern('situational'): (
+        "How would you handle a situation where you disagree with your manager?",
+        "What would you do if you discovered a critical bug right before a release?",
+        "How would you prioritize multiple urgent tasks?",
+        "What would you do if a team member wasn't pulling their weight?",
+        "How would you handle receiving negative feedback?",
+    ),
+})
+
+# Company-specific questions (can be expanded)
+_COMPANY_QUESTIONS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    sys.intern('google'): (
+        "Why do you want to work at Google?",
+        "How would you improve Google Search?",
+        "Tell me about a time you demonstrated leadership.",
+    ),
+    sys.intern('amazon'): (
+        "Tell me about a time you had to make a decision with incomplete information.",
+        "Describe a time when you went above and beyond for a customer.",
+        "How do you handle working under pressure?",
+    ),
+})
+
+@dataclass(slots=True)
+class SessionStats:
+    """Per-session aggregates gathered in one pass over the answered questions"""
+    strengths: Counter = field(default_factory=Counter)
+    improvements: Counter = field(default_factory=Counter)
+    filler_words_total: int = 0
+    evaluated: int = 0
+    # Running totals of [overall, clarity, relevance] scores
+    score_totals: List[int] = field(default_factory=lambda: [0, 0, 0])
+    
+    def averages(self) -> Tuple[float, float, float]:
+        """Mean overall, clarity and relevance scores (zeros if none evaluated)"""
+        if not self.evaluated:
+            return 0, 0, 0
+        overall, clarity, relevance = self.score_totals
+        n = self.evaluated
+        return overall / n, clarity / n, relevance / n
+
+
+def _with_filler_count(evaluation: Dict[str, Any], answer: str) -> Dict[str, Any]:
+    """Copy of an evaluation carrying the answer's locally counted filler words"""
+    return {**evaluation, "filler_words_count": len(_FILLER_RE.findall(answer))}
+
+def _eval_cache_key(question: str, answer: str, question_type: str) -> str:
+    """Cache key that ignores case and whitespace differences in the answer"""
+    normalized = _WHITESPACE_RE.sub(" ", answer).strip().lower()
+    return content_key(question_type, question, normalized)
+
 
 class InterviewSimulator:
     def __init__(self, ollama_client):
         self.ollama = ollama_client
-        
-        # Question banks by type
-        self.question_banks = {
-            'behavioral': [
-                "Tell me about a time when you faced a significant challenge at work. How did you handle it?",
-                "Describe a situation where you had to work with a difficult team member.",
-                "Give me an example of a goal you set and how you achieved it.",
-                "Tell me about a time you failed. What did you learn from it?",
-                "Describe a situation where you had to adapt to significant changes.",
-            ],
-            'technical': [
-                "Explain the difference between a stack and a queue.",
-                "What is the time complexity of binary search?",
-                "How would you design a URL shortening service?",
-                "Explain what happens when you type a URL in a browser.",
-                "What are the principles of object-oriented programming?",
-            ],
-            'situational': [
-                "How would you handle a situation where you disagree with your manager?",
-                "What would you do if you discovered a critical bug right before a release?",
-                "How would you prioritize multiple urgent tasks?",
-                "What would you do if a team member wasn't pulling their weight?",
-                "How would you handle receiving negative feedback?",
-            ]
-        }
-        
-        # Company-specific questions (can be expanded)
-        self.company_questions = {
-            'google': [
-                "Why do you want to work at Google?",
-                "How would you improve Google Search?",
-                "Tell me about a time you demonstrated leadership.",
-            ],
-            'amazon': [
-                "Tell me about a time you had to make a decision with incomplete information.",
-                "Describe a time when you went above and beyond for a customer.",
-                "How do you handle working under pressure?",
-            ]
-        }
+        # Serializes session writes from concurrently running steps
+        self._session_lock = asyncio.Lock()
+        self.question_banks = _QUESTION_BANKS
+        self.company_questions = _COMPANY_QUESTIONS
     
     async def start_session(
         self,
@@ -78,7 +195,7 @@ class InterviewSimulator:
             "question_types": question_types,
             "questions_asked": [],
             "current_question_index": 0,
-            "started_at": datetime.now().isoformat()
+            "started_at": _now_iso()
         }
         
         # Get first question
@@ -109,44 +226,171 @@ class InterviewSimulator:
         Returns:
             Evaluation with scores and feedback
         """
-        # Build evaluation prompt
-        prompt = self._build_evaluation_prompt(question, answer, question_type)
-        
-        # Get reasoning generator
-        generator = self.ollama.get_generator("reasoning")
-        
-        # Get AI evaluation natively via Haystack
-        import asyncio
-        result = await asyncio.to_thread(generator.run, prompt=prompt)
-        response = result["replies"][0]
+        short_circuit = self._is_trivial_answer(question, answer)
+        if short_circuit:
+            evaluation = self._short_answer_evaluation()
+        else:
+            cache_key = _eval_cache_key(question, answer, question_type)
+            evaluation = _EVAL_CACHE.get(cache_key)
+        if evaluation is None:
+            # Build evaluation prompt
+            prompt = self._build_evaluation_prompt(question, answer, question_type)
+            
+            # Get reasoning generator
+            generator = self.ollama.get_generator("reasoning")
+            
+            # Get AI evaluation natively via Haystack
+            result = await asyncio.to_thread(generator.run, prompt=prompt)
+            response = result["replies"][0]
+            
+            # Parse evaluation
+            evaluation = self._parse_evaluation(response)
+            self._cache_evaluation(cache_key, evaluation)
+        evaluation = _with_filler_count(evaluation, answer)
         
-        # Parse evaluation
-        evaluation = self._parse_evaluation(response)
+        entry = {
+            "question": question,
+            "type": question_type,
+            "answer": answer,
+            "evaluation": evaluation,
+            "timestamp": _now_iso()
+        }
+        if short_circuit:
+            entry["short_circuit"] = True
         
         # Add to session history
+        async with self._session_lock:
+            session['questions_asked'].append(entry)
+        
+        return evaluation
+    
+    def record_answer(
+        self,
+        session: Dict[str, Any],
+        question: str,
+        answer: str,
+        question_type: str
+    ):
+        """
+        Record an answer without evaluating it yet.
+        Pending answers are evaluated together, in batches, by end_session.
+        """
         session['questions_asked'].append({
             "question": question,
             "type": question_type,
             "answer": answer,
-            "evaluation": evaluation,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _now_iso()
         })
+    
+    async def evaluate_answers_batch(
+        self,
+        items: List[Tuple[str, str, str]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Evaluate several answers with one LLM call per batch of up to 8
         
-        return evaluation
+        Args:
+            items: (question, answer, question_type) triples
+        
+        Returns:
+            Evaluations aligned with items; nothing is recorded on a session
+        """
+        if not items:
+            return []
+        
+        # Score trivial answers locally, serve repeats from the cache and
+        # only send the misses to the model
+        keys = [_eval_cache_key(*item) for item in items]
+        evaluations = [
+            self._short_answer_evaluation() if self._is_trivial_answer(question, answer) else _EVAL_CACHE.get(key)
+            for (question, answer, _), key in zip(items, keys)
+        ]
+        misses = [i for i, evaluation in enumerate(evaluations) if evaluation is None]
+        if not misses:
+            return [_with_filler_count(evaluation, answer) for evaluation, (_, answer, _) in zip(evaluations, items)]
+        
+        generator = self.ollama.get_generator("reasoning")
+        
+        async def evaluate_chunk(chunk: List[Tuple[str, str, str]]) -> List[Dict[str, Any]]:
+            if len(chunk) == 1:
+                prompt = self._build_evaluation_prompt(*chunk[0])
+            else:
+                prompt = self._build_batch_evaluation_prompt(chunk)
+            result = await asyncio.to_thread(generator.run, prompt=prompt)
+            response = result["replies"][0]
+            if len(chunk) == 1:
+                return [self._parse_evaluation(response)]
+            return self._parse_batch_evaluation(response, len(chunk))
+        
+        pending = [items[i] for i in misses]
+        chunks = [pending[i:i + _EVAL_BATCH_SIZE] for i in range(0, len(pending), _EVAL_BATCH_SIZE)]
+        results = await asyncio.gather(*(evaluate_chunk(chunk) for chunk in chunks))
+        fresh = [evaluation for chunk_result in results for evaluation in chunk_result]
+        
+        for i, evaluation in zip(misses, fresh):
+            evaluations[i] = evaluation
+            self._cache_evaluation(keys[i], evaluation)
+        return [_with_filler_count(evaluation, answer) for evaluation, (_, answer, _) in zip(evaluations, items)]
+    
+    @staticmethod
+    def _is_trivial_answer(question: str, answer: str) -> bool:
+        """True for answers too short to evaluate or that just repeat the question"""
+        stripped = answer.strip()
+        if len(stripped) < _MIN_ANSWER_CHARS or len(stripped.split()) < _MIN_ANSWER_WORDS:
+            return True
+        return _WHITESPACE_RE.sub(" ", stripped).lower() == _WHITESPACE_RE.sub(" ", question.strip()).lower()
+    
+    def _cache_evaluation(self, cache_key: str, evaluation: Dict[str, Any]):
+        """Remember a parsed evaluation; fallbacks are retried next time"""
+        if evaluation != self._fallback_evaluation():
+            _EVAL_CACHE.set(cache_key, evaluation)
     
     async def get_next_question(
         self,
         session: Dict[str, Any]
     ) -> Optional[Dict[str, Any]]:
         """Get next question in the session"""
-        if session['current_question_index'] >= 10:  # Max 10 questions per session
-            return None
-        
-        question = self._get_next_question(session)
-        session['current_question_index'] += 1
+        async with self._session_lock:
+            if session['current_question_index'] >= 10:  # Max 10 questions per session
+                return None
+            
+            question = self._get_next_question(session)
+            session['current_question_index'] += 1
         
         return question
     
+    async def evaluate_and_advance(
+        self,
+        session: Dict[str, Any],
+        question: str,
+        answer: str,
+        question_type: str
+    ) -> Dict[str, Any]:
+        """
+        Evaluate an answer while fetching the next question
+        
+        Both steps start from the same session snapshot and write separate
+        fields, so the round takes as long as the slower of the two.
+        
+        Returns:
+            {"evaluation": ..., "next_question": ...}; next_question is None
+            when the session is over
+        """
+        eval_task = asyncio.create_task(self.evaluate_answer(session, question, answer, question_type))
+        next_task = asyncio.create_task(self.get_next_question(session))
+        evaluation, next_question = await asyncio.gather(eval_task, next_task, return_exceptions=True)
+        
+        if isinstance(evaluation, BaseException):
+            # Don't move past a question whose answer wasn't evaluated
+            if next_question is not None and not isinstance(next_question, BaseException):
+                async with self._session_lock:
+                    session['current_question_index'] -= 1
+            raise evaluation
+        if isinstance(next_question, BaseException):
+            raise next_question
+        
+        return {"evaluation": evaluation, "next_question": next_question}
+    
     async def end_session(
         self,
         session: Dict[str, Any]
@@ -168,18 +412,23 @@ class InterviewSimulator:
                 "message": "No questions answered"
             }
         
-        # Calculate overall metrics
-        scores = [q['evaluation']['overall_score'] for q in questions_asked if 'evaluation' in q]
-        avg_score = sum(scores) / len(scores) if scores else 0
-        
-        clarity_scores = [q['evaluation']['clarity_score'] for q in questions_asked if 'evaluation' in q]
-        avg_clarity = sum(clarity_scores) / len(clarity_scores) if clarity_scores else 0
+        # Evaluate answers recorded without evaluation, batched into few LLM calls
+        pending = [q for q in questions_asked if 'evaluation' not in q and q.get('answer')]
+        if pending:
+            evaluations = await self.evaluate_answers_batch(
+                [(q['question'], q['answer'], q.get('type', 'behavioral')) for q in pending]
+            )
+            for q, evaluation in zip(pending, evaluations):
+                q['evaluation'] = evaluation
+                if self._is_trivial_answer(q['question'], q['answer']):
+                    q['short_circuit'] = True
         
-        relevance_scores = [q['evaluation']['relevance_score'] for q in questions_asked if 'evaluation' in q]
-        avg_relevance = sum(relevance_scores) / len(relevance_scores) if relevance_scores else 0
+        # Calculate overall metrics
+        stats = self._aggregate_session_stats(questions_asked)
+        avg_score, avg_clarity, avg_relevance = stats.averages()
         
         # Generate recommendations
-        recommendations = self._generate_session_recommendations(questions_asked, avg_score)
+        recommendations = self._generate_session_recommendations(stats.filler_words_total, avg_score)
         
         return {
             "session_id": session['session_id'],
@@ -191,16 +440,33 @@ class InterviewSimulator:
                 "avg_confidence": int(avg_score)
             },
             "performance_level": self._get_performance_level(avg_score),
-            "strengths": self._identify_strengths(questions_asked),
-            "areas_to_improve": self._identify_weaknesses(questions_asked),
+            # Most common strengths and improvements needed
+            "strengths": [strength for strength, count in stats.strengths.most_common(3)],
+            "areas_to_improve": [improvement for improvement, count in stats.improvements.most_common(3)],
             "recommendations": recommendations,
-            "completed_at": datetime.now().isoformat()
+            "completed_at": _now_iso()
         }
     
+    def _aggregate_session_stats(self, questions_asked: List[Dict]) -> SessionStats:
+        """Collect scores, strengths, improvements and filler counts in one pass"""
+        stats = SessionStats()
+        for q in questions_asked:
+            evaluation = q.get('evaluation')
+            if evaluation is None:
+                continue
+            totals = stats.score_totals
+            totals[0] += evaluation['overall_score']
+            totals[1] += evaluation['clarity_score']
+            totals[2] += evaluation['relevance_score']
+            stats.evaluated += 1
+            stats.strengths.update(evaluation.get('strengths', ()))
+            stats.improvements.update(evaluation.get('improvements', ()))
+            stats.filler_words_total += evaluation.get('filler_words_count', 0)
+        return stats
+    
     def _generate_session_id(self) -> str:
         """Generate unique session ID"""
-        import uuid
-        return str(uuid.uuid4())
+        return uuid.uuid4().hex
     
     def _get_next_question(self, session: Dict[str, Any]) -> Dict[str, Any]:
         """Get next question based on session config"""
@@ -211,7 +477,7 @@ class InterviewSimulator:
         question_type = question_types[current_index % len(question_types)]
         
         # Get question from bank
-        questions = self.question_banks.get(question_type, [])
+        questions = self.question_banks.get(question_type, ())
         if not questions:
             question_type = 'behavioral'
             questions = self.question_banks['behavioral']
@@ -256,80 +522,106 @@ class InterviewSimulator:
         question_type: str
     ) -> str:
         """Build prompt for AI evaluation"""
-        return f"""You are an expert interview coach evaluating a candidate's answer.
-
-Question Type: {question_type}
-Question: {question}
-Candidate's Answer: {answer}
-
-Evaluate this answer on the following criteria (score each 0-100):
-1. Relevance - Does the answer address the question?
-2. Clarity - Is the answer clear and well-structured?
-3. Completeness - Does it cover all aspects of the question?
-4. Confidence - Does the candidate sound confident?
-5. Examples - Are there specific examples (for behavioral questions)?
-
-Also identify:
-- Strengths of the answer
-- Areas for improvement
-- Suggested better answer (brief)
-- Filler words used (um, like, you know, etc.)
-
-Return your evaluation in JSON format:
-{{
-    "overall_score": 85,
-    "relevance_score": 90,
-    "clarity_score": 80,
-    "completeness_score": 85,
-    "confidence_score": 85,
-    "strengths": ["specific example", "clear structure"],
-    "improvements": ["add more quantifiable results", "reduce filler words"],
-    "filler_words_count": 3,
-    "suggested_improvement": "Brief suggestion here"
-}}"""
+        return (
+            f"{_EVALUATION_PREFIX}"
+            f"Question Type: {question_type}\n"
+            f"Question: {question}\n"
+            f"Candidate's Answer: {answer}"
+        )
+    
+    def _build_batch_evaluation_prompt(
+        self,
+        items: List[Tuple[str, str, str]]
+    ) -> str:
+        """Build one prompt evaluating several answers, rubric stated once"""
+        answers = "\n\n".join(
+            f"[{index}]\nQuestion Type: {question_type}\nQuestion: {question}\nCandidate's Answer: {answer}"
+            for index, (question, answer, question_type) in enumerate(items, start=1)
+        )
+        return f"{_BATCH_EVALUATION_PREFIX}{answers}"
+    
+    def _extract_json(self, response: str) -> str:
+        """Strip markdown code fences around a JSON reply"""
+        match = _JSON_BLOCK_RE.search(response)
+        return match.group(1) if match else response.strip()
     
     def _parse_evaluation(self, response: str) -> Dict[str, Any]:
         """Parse AI evaluation response"""
         try:
-            # Try to extract JSON from response
-            if '```json' in response:
-                json_str = response.split('```json')[1].split('```')[0].strip()
-            elif '```' in response:
-                json_str = response.split('```')[1].split('```')[0].strip()
-            else:
-                json_str = response.strip()
-            
-            evaluation = json.loads(json_str)
-            
-            # Ensure all required fields exist
-            return {
-                "overall_score": evaluation.get('overall_score') or 70,
-                "relevance_score": evaluation.get('relevance_score') or 70,
-                "clarity_score": evaluation.get('clarity_score') or 70,
-                "completeness_score": evaluation.get('completeness_score') or 70,
-                "confidence_score": evaluation.get('confidence_score') or 70,
-                "strengths": evaluation.get('strengths') or [],
-                "improvements": evaluation.get('improvements') or [],
-                "filler_words_count": evaluation.get('filler_words_count') or 0,
-                "suggested_improvement": evaluation.get('suggested_improvement') or ''
-            }
-        except:
-            # Fallback evaluation
-            return {
-                "overall_score": 70,
-                "relevance_score": 70,
-                "clarity_score": 70,
-                "completeness_score": 70,
-                "confidence_score": 70,
-                "strengths": ["Answer provided"],
-                "improvements": ["Could not parse detailed feedback"],
-                "filler_words_count": 0,
-                "suggested_improvement": "Practice more structured answers"
-            }
+            evaluation = orjson.loads(self._extract_json(response))
+            return self._normalize_evaluation(evaluation)
+        except (orjson.JSONDecodeError, AttributeError, TypeError):
+            # Malformed JSON, or valid JSON that isn't an evaluation object
+            return self._fallback_evaluation()
+    
+    def _parse_batch_evaluation(self, response: str, count: int) -> List[Dict[str, Any]]:
+        """Parse a batch evaluation reply into count evaluations, aligned by index"""
+        evaluations = [self._fallback_evaluation() for _ in range(count)]
+        try:
+            parsed = orjson.loads(self._extract_json(response))
+        except orjson.JSONDecodeError:
+            return evaluations
+        if not isinstance(parsed, list):
+            return evaluations
+        
+        for position, item in enumerate(parsed):
+            if not isinstance(item, dict):
+                continue
+            # Prefer the model's [index] tag; fall back to array position
+            index = item.get('index')
+            slot = index - 1 if isinstance(index, int) and 1 <= index <= count else position
+            if slot < count:
+                try:
+                    evaluations[slot] = self._normalize_evaluation(item)
+                except (AttributeError, TypeError):
+                    pass
+        return evaluations
+    
+    def _normalize_evaluation(self, evaluation: Dict[str, Any]) -> Dict[str, Any]:
+        """Ensure all required fields exist"""
+        return {
+            "overall_score": evaluation.get('overall_score') or 70,
+            "relevance_score": evaluation.get('relevance_score') or 70,
+            "clarity_score": evaluation.get('clarity_score') or 70,
+            "completeness_score": evaluation.get('completeness_score') or 70,
+            "confidence_score": evaluation.get('confidence_score') or 70,
+            "strengths": evaluation.get('strengths') or [],
+            "improvements": evaluation.get('improvements') or [],
+            "filler_words_count": evaluation.get('filler_words_count') or 0,
+            "suggested_improvement": evaluation.get('suggested_improvement') or ''
+        }
+    
+    def _fallback_evaluation(self) -> Dict[str, Any]:
+        """Evaluation used when the model's reply can't be parsed"""
+        return {
+            "overall_score": 70,
+            "relevance_score": 70,
+            "clarity_score": 70,
+            "completeness_score": 70,
+            "confidence_score": 70,
+            "strengths": ["Answer provided"],
+            "improvements": ["Could not parse detailed feedback"],
+            "filler_words_count": 0,
+            "suggested_improvement": "Practice more structured answers"
+        }
+    
+    def _short_answer_evaluation(self) -> Dict[str, Any]:
+        """Low score given without the LLM to empty, trivial or copied answers"""
+        return {
+            "overall_score": 30,
+            "relevance_score": 30,
+            "clarity_score": 30,
+            "completeness_score": 30,
+            "confidence_score": 30,
+            "strengths": [],
+            "improvements": ["Answer too short to evaluate - aim for 150+ words using STAR"],
+            "filler_words_count": 0,
+            "suggested_improvement": "Expand with specific Situation, Task, Action, Result."
+        }
     
     def _generate_session_recommendations(
         self,
-        questions_asked: List[Dict],
+        filler_words_total: int,
         avg_score: float
     ) -> List[str]:
         """Generate recommendations based on session performance"""
@@ -347,11 +639,6 @@ Return your evaluation in JSON format:
             recommendations.append("Practice with a friend or mentor")
         
         # Check for common issues
-        filler_words_total = sum(
-            q.get('evaluation', {}).get('filler_words_count', 0)
-            for q in questions_asked
-        )
-        
         if filler_words_total > 10:
             recommendations.append("Work on reducing filler words (um, like, you know)")
         
@@ -367,33 +654,14 @@ Return your evaluation in JSON format:
             return "Fair"
         else:
             return "Needs Improvement"
-    
-    def _identify_strengths(self, questions_asked: List[Dict]) -> List[str]:
-        """Identify common strengths across answers"""
-        all_strengths = []
-        for q in questions_asked:
-            if 'evaluation' in q:
-                all_strengths.extend(q['evaluation'].get('strengths', []))
-        
-        # Return most common strengths
-        from collections import Counter
-        common = Counter(all_strengths).most_common(3)
-        return [strength for strength, count in common]
-    
-    def _identify_weaknesses(self, questions_asked: List[Dict]) -> List[str]:
-        """Identify common areas for improvement"""
-        all_improvements = []
-        for q in questions_asked:
-            if 'evaluation' in q:
-                all_improvements.extend(q['evaluation'].get('improvements', []))
-        
-        # Return most common improvements needed
-        from collections import Counter
-        common = Counter(all_improvements).most_common(3)
-        return [improvement for improvement, count in common]
 
 
 # Utility functions for API endpoints
+@lru_cache(maxsize=4)
+def _get_simulator(ollama_client) -> InterviewSimulator:
+    """One simulator per Ollama client, reused across API calls"""
+    return InterviewSimulator(ollama_client)
+
 async def create_interview_session(
     ollama_client,
     job_role: str,
@@ -401,7 +669,7 @@ async def create_interview_session(
     difficulty: str = 'medium'
 ) -> Dict[str, Any]:
     """Create new interview practice session"""
-    simulator = InterviewSimulator(ollama_client)
+    simulator = _get_simulator(ollama_client)
     return await simulator.start_session(job_role, company, difficulty)
 
 async def evaluate_interview_answer(
@@ -412,5 +680,5 @@ async def evaluate_interview_answer(
     question_type: str
 ) -> Dict[str, Any]:
     """Evaluate an interview answer"""
-    simulator = InterviewSimulator(ollama_client)
+    simulator = _get_simulator(ollama_client)
     return await simulator.evaluate_answer(session, question, answer, question_type)
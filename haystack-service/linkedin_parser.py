@@ -5,26 +5,103 @@ Extracts public profile data from LinkedIn URLs
 import re
 import logging
 import asyncio
-from typing import Dict, Any, Optional
+import time
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional
 from bs4 import BeautifulSoup
 from playwright.async_api import async_playwright
+from cache.memory_cache import LRUCache
 
 logger = logging.getLogger(__name__)
 
+# lxml's C parser is much faster than the pure-Python html.parser on
+# multi-megabyte profile pages; fall back only if it isn't installed
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = 'lxml'
+except ImportError:
+    _HTML_PARSER = 'html.parser'
+
+# Parsed profiles by username with the monotonic time they were scraped;
+# profiles change on a scale of days, so repeats skip the browser
+_PROFILE_CACHE = LRUCache(maxsize=1024)
+_PROFILE_TTL = 24 * 60 * 60
+
+# Profile URL shape and the username segment within it
+_LI_URL_RE = re.compile(r'https?://(www\.)?linkedin\.com/in/[\w-]+')
+_LI_USERNAME_RE = re.compile(r'linkedin\.com/in/([\w-]+)')
+
+# Page elements the extractor reads; only these (plus <head>) are pulled
+# out of the browser, not the whole rendered page
+_NAME_SELECTOR = 'h1.top-card-layout__title, h1.text-heading-xlarge, .top-card__title'
+_HEADLINE_SELECTOR = '.top-card-layout__headline, .text-body-medium, .top-card__headline'
+_SUMMARY_SECTION_SELECTOR = '.core-section-container[data-section="summary"], .about-section'
+_SUMMARY_SELECTOR = '.core-section-container[data-section="summary"] .inline-show-more-text, .about-section .description'
+
+_EXTRACT_JS = """(selectors) => {
+    const parts = selectors.map(s => document.querySelector(s)?.outerHTML || '');
+    return '<html>' + document.head.outerHTML + '<body>' + parts.join('') + '</body></html>';
+}"""
+
+# Resources never needed to read the profile DOM
+_BLOCKED_RESOURCES = frozenset({'image', 'font', 'media', 'stylesheet'})
+
+
+async def _block_heavy_resources(route):
+    if route.request.resource_type in _BLOCKED_RESOURCES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+# One Chromium process shared by every scrape; each request gets its own
+# context. Launched on first use and closed on app shutdown.
+_playwright = None
+_browser = None
+_browser_lock: Optional[asyncio.Lock] = None
+
+
+async def _get_browser():
+    """Return the shared browser, launching it on first use"""
+    global _playwright, _browser, _browser_lock
+    if _browser is not None and _browser.is_connected():
+        return _browser
+    if _browser_lock is None:
+        _browser_lock = asyncio.Lock()
+    async with _browser_lock:
+        if _browser is None or not _browser.is_connected():
+            if _playwright is None:
+                _playwright = await async_playwright().start()
+            _browser = await _playwright.chromium.launch(headless=True)
+            logger.info("Launched shared Chromium for LinkedIn scraping")
+    return _browser
+
+
+async def close_browser():
+    """Close the shared browser and Playwright driver; called on app shutdown"""
+    global _playwright, _browser
+    if _browser is not None:
+        await _browser.close()
+        _browser = None
+    if _playwright is not None:
+        await _playwright.stop()
+        _playwright = None
+
 class LinkedInScraper:
     """Scrapes public LinkedIn profile data using headless browser"""
     
     def __init__(self):
         pass
     
-    def validate_url(self, url: str) -> bool:
+    @staticmethod
+    def validate_url(url: str) -> bool:
         """Validate LinkedIn profile URL format"""
-        pattern = r'https?://(www\.)?linkedin\.com/in/[\w-]+'
-        return bool(re.match(pattern, url))
+        return bool(_LI_URL_RE.match(url))
     
-    def extract_username(self, url: str) -> Optional[str]:
+    @staticmethod
+    def extract_username(url: str) -> Optional[str]:
         """Extract username from LinkedIn URL"""
-        match = re.search(r'linkedin\.com/in/([\w-]+)', url)
+        match = _LI_USERNAME_RE.search(url)
         return match.group(1) if match else None
     
     async def scrape_profile(self, url: str) -> Dict[str, Any]:
@@ -34,57 +111,60 @@ class LinkedInScraper:
         if not self.validate_url(url):
             raise ValueError("Invalid LinkedIn profile URL")
         
-        async with async_playwright() as p:
-            # Use a realistic browser context
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context(
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
-                viewport={'width': 1920, 'height': 1080},
-                locale='en-US'
+        browser = await _get_browser()
+        # Use a realistic browser context
+        context = await browser.new_context(
+            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
+            viewport={'width': 1920, 'height': 1080},
+            locale='en-US'
+        )
+        
+        try:
+            await context.route('**/*', _block_heavy_resources)
+            page = await context.new_page()
+            logger.info(f"Navigating to LinkedIn profile: {url}")
+            await page.goto(url, timeout=30000, wait_until='domcontentloaded')
+            
+            # Wait a bit for dynamic content
+            await asyncio.sleep(2)
+            
+            # Check for authwall (searched in the browser, not copied out)
+            if "authwall" in page.url or await page.evaluate(
+                "() => document.documentElement.outerHTML.includes('Sign In')"
+            ):
+                logger.warning("Hit LinkedIn authwall or login page")
+                # Try to close potential modal if it exists (sometimes works)
+                try:
+                    await page.click('button[aria-label="Dismiss"]', timeout=2000)
+                    await asyncio.sleep(1)
+                except:
+                    pass
+            
+            # Get the parts we extract from, after JS execution
+            html_content = await page.evaluate(
+                _EXTRACT_JS,
+                [_NAME_SELECTOR, _HEADLINE_SELECTOR, _SUMMARY_SECTION_SELECTOR],
             )
+            soup = BeautifulSoup(html_content, _HTML_PARSER)
             
-            page = await context.new_page()
+            # Extract data
+            profile_data = self._extract_from_soup(soup)
             
-            try:
-                logger.info(f"Navigating to LinkedIn profile: {url}")
-                await page.goto(url, timeout=30000, wait_until='domcontentloaded')
-                
-                # Wait a bit for dynamic content
-                await asyncio.sleep(2)
-                
-                # Check for authwall
-                content = await page.content()
-                if "authwall" in page.url or "Sign In" in content:
-                    logger.warning("Hit LinkedIn authwall or login page")
-                    # Try to close potential modal if it exists (sometimes works)
-                    try:
-                        await page.click('button[aria-label="Dismiss"]', timeout=2000)
-                        await asyncio.sleep(1)
-                    except:
-                        pass
-                
-                # Get page content after JS execution
-                html_content = await page.content()
-                soup = BeautifulSoup(html_content, 'html.parser')
-                
-                # Extract data
-                profile_data = self._extract_from_soup(soup)
-                
-                # Add source URL
-                profile_data['source_url'] = url
-                profile_data['username'] = self.extract_username(url)
-                
-                if not profile_data.get('name') and not profile_data.get('headline'):
-                     logger.warning("Scraping yielded minimal data. Profile might be private.")
-                
-                return profile_data
-                
-            except Exception as e:
-                logger.error(f"Playwright scraping failed: {e}")
-                raise Exception(f"Failed to access LinkedIn profile: {str(e)}")
-            finally:
-                await browser.close()
-    
+            # Add source URL
+            profile_data['source_url'] = url
+            profile_data['username'] = self.extract_username(url)
+            
+            if not profile_data.get('name') and not profile_data.get('headline'):
+                 logger.warning("Scraping yielded minimal data. Profile might be private.")
+            
+            return profile_data
+            
+        except Exception as e:
+            logger.error(f"Playwright scraping failed: {e}")
+            raise Exception(f"Failed to access LinkedIn profile: {str(e)}")
+        finally:
+            await context.close()
+
     def _extract_from_soup(self, soup: BeautifulSoup) -> Dict[str, Any]:
         """Extract data using BS4 from rendered HTML"""
         data = {}
@@ -106,17 +186,17 @@ class LinkedInScraper:
 
         # 2. Try Standard Selectors (if allowed to view full profile)
         if not data.get('name'):
-            name_elem = soup.select_one('h1.top-card-layout__title, h1.text-heading-xlarge, .top-card__title')
+            name_elem = soup.select_one(_NAME_SELECTOR)
             if name_elem:
                 data['name'] = name_elem.get_text(strip=True)
         
         if not data.get('headline'):
-             headline_elem = soup.select_one('.top-card-layout__headline, .text-body-medium, .top-card__headline')
+             headline_elem = soup.select_one(_HEADLINE_SELECTOR)
              if headline_elem:
                  data['headline'] = headline_elem.get_text(strip=True)
                  
         # 3. Try to get About/Summary
-        summary_elem = soup.select_one('.core-section-container[data-section="summary"] .inline-show-more-text, .about-section .description')
+        summary_elem = soup.select_one(_SUMMARY_SELECTOR)
         if summary_elem:
             data['summary'] = summary_elem.get_text(strip=True)
             
@@ -142,10 +222,51 @@ class LinkedInScraper:
         
         return result
 
-async def scrape_linkedin_profile(url: str) -> Dict[str, Any]:
+async def scrape_linkedin_profile(url: str, force_refresh: bool = False) -> Dict[str, Any]:
     """
     Main async function to scrape and parse LinkedIn profile
+    
+    Results are cached per username for 24h; force_refresh bypasses the
+    cache. The result's scraped_at says when it was actually fetched.
     """
     scraper = LinkedInScraper()
+    username = scraper.extract_username(url)
+    cache_key = f"li:{username.lower()}" if username else None
+    
+    if cache_key and not force_refresh:
+        cached = _PROFILE_CACHE.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < _PROFILE_TTL:
+            logger.info(f"LinkedIn profile cache hit: {username}")
+            return cached[1]
+    
     scraped_data = await scraper.scrape_profile(url)
-    return scraper.parse_to_standard_format(scraped_data)
+    result = scraper.parse_to_standard_format(scraped_data)
+    result['scraped_at'] = datetime.now(timezone.utc).isoformat()
+    
+    # Don't pin an authwalled/private result for a day
+    if cache_key and result['name']:
+        _PROFILE_CACHE.set(cache_key, (time.monotonic(), result))
+    return result
+
+async def scrape_linkedin_profiles(
+    urls: List[str],
+    concurrency: int = 4,
+    force_refresh: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Scrape and parse several LinkedIn profiles concurrently
+    
+    Scrapes share one browser and at most `concurrency` run at a time.
+    Results keep the order of urls; a failed URL yields
+    {"error": ..., "source_url": url} instead of raising.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def scrape_one(url: str) -> Dict[str, Any]:
+        async with semaphore:
+            try:
+                return await scrape_linkedin_profile(url, force_refresh)
+            except Exception as e:
+                return {'error': str(e), 'source_url': url}
+    
+    return await asyncio.gather(*(scrape_one(url) for url in urls))
@@ -1,24 +1,27 @@
 from fastapi import FastAPI, HTTPException, UploadFile, File
-from fastapi.responses import StreamingResponse
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
 from orchestration.workflow import build_careergini_workflow, CareerGiniState
 from integrations.ollama_client import get_ollama_client
 from cache.redis_cache import ResponseCache
-from linkedin_parser import scrape_linkedin_profile
+from linkedin_parser import scrape_linkedin_profile, close_browser as close_linkedin_browser
 from resume_ats_scorer import score_resume
 from job_matcher import match_job
 from skill_gap_analyzer import analyze_skill_gaps
 from interview_simulator import create_interview_session, evaluate_interview_answer
-from career_path_predictor import predict_career_path
+from career_path_predictor import predict_career_path_json, set_persistent_cache as set_career_path_cache
 from proactive_advisor import generate_career_nudges
 from analytics_dashboard import generate_analytics_dashboard
-from agents.resume_advisor_agent import ResumeAdvisorAgent
+from agents.resume_advisor_agent import get_resume_advisor
 from agents.job_hunter_agent import JobHunterAgent
+from agents.base_agent import BaseAgent
 import uvicorn
 import logging
 import os
 import json
+import orjson
+import re
 import asyncio
 import httpx
 import PyPDF2
@@ -31,7 +34,8 @@ logger = logging.getLogger(__name__)
 
 from fastapi.staticfiles import StaticFiles
 
-app = FastAPI(title="CareerGini AI Service", version="1.0.0")
+# orjson encodes every JSON response body in C instead of stdlib json
+app = FastAPI(title="CareerGini AI Service", version="1.0.0", default_response_class=ORJSONResponse)
 
 # Ensure uploads directory exists
 os.makedirs("uploads", exist_ok=True)
@@ -39,6 +43,10 @@ os.makedirs("uploads", exist_ok=True)
 # Mount uploads directory
 app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
 
+# LLM reply cleanup: outermost {...} block and trailing commas before } or ]
+_JSON_RE = re.compile(r'\{.*\}', re.DOTALL)
+_TRAILING_COMMA_RE = re.compile(r',(\s*[}\]])')
+
 # Internal Logging Helpers (Calls profile-service)
 async def _log_activity(user_id: str, activity_type: str, activity_data: Dict[str, Any] = None):
     """Log user activity to the central profile database"""
@@ -87,6 +95,10 @@ workflow = build_careergini_workflow()
 redis_url = os.getenv("REDIS_URL", "redis://redis:6379/0")
 cache = ResponseCache(redis_url)
 
+# Opt-in: share encoded career path predictions through Redis across workers and restarts
+if os.getenv("CAREER_PATH_REDIS_CACHE", "").lower() in ("1", "true", "yes"):
+    set_career_path_cache(cache)
+
 class ChatRequest(BaseModel):
     user_id: str
     session_id: str
@@ -123,6 +135,13 @@ async def startup_event():
     health = await ollama.health_check()
     logger.info(f"Ollama Health: {health}")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release pooled Ollama connections and the shared scraping browser"""
+    await BaseAgent.aclose_http_client()
+    await close_linkedin_browser()
+    await get_ollama_client().aclose()
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
@@ -211,7 +230,7 @@ async def upload_resume(
         
         # Extract Persona using ResumeAdvisorAgent
         ollama = get_ollama_client()
-        agent = ResumeAdvisorAgent(ollama.get_generator("fast"))
+        agent = get_resume_advisor(ollama.get_generator("fast"))
         persona = agent.extract_persona(text)
         
         # Save Persona to disk
@@ -349,8 +368,8 @@ async def get_resume_persona(user_id: str):
         return {"status": "not_found", "message": "No resume persona found. Please upload a resume."}
     
     try:
-        with open(persona_path, "r") as f:
-            persona = json.load(f)
+        with open(persona_path, "rb") as f:
+            persona = orjson.loads(f.read())
         return {"status": "success", "persona": persona}
     except Exception as e:
         logger.error(f"Error reading persona: {e}")
@@ -368,8 +387,8 @@ async def update_resume_persona(user_id: str, request: PersonaUpdateRequest):
         
         # Merge if exists, else just overwrite
         if os.path.exists(persona_path):
-            with open(persona_path, "r") as f:
-                existing_persona = json.load(f)
+            with open(persona_path, "rb") as f:
+                existing_persona = orjson.loads(f.read())
             existing_persona.update(request.persona)
             merged = existing_persona
         else:
@@ -392,7 +411,6 @@ async def generate_gini_guide(user_id: str):
     """Generate hyper-personalized GINI Guide (Summary + Key Skills)"""
     try:
         from persona_manager import PersonaManager
-        import re
         pm = PersonaManager(user_id)
         
         ollama = get_ollama_client()
@@ -464,16 +482,16 @@ Output EXACTLY AND ONLY valid JSON in this format:
         elif "```" in content:
             content = content.split("```")[1].split("```")[0]
             
-        match = re.search(r'\{.*\}', content, re.DOTALL)
+        match = _JSON_RE.search(content)
         if match:
             raw = match.group(0)
-            raw = re.sub(r',(\s*[}\]])', r'\1', raw)
+            raw = _TRAILING_COMMA_RE.sub(r'\1', raw)
             try:
-                data = json.loads(raw)
-            except json.JSONDecodeError:
-                data = json.loads(content.strip())
+                data = orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                data = orjson.loads(content.strip())
         else:
-            data = json.loads(content.strip())
+            data = orjson.loads(content.strip())
             
         # Ensure fallback fields
         target_role = data.get("target_role", identity.get("professional_title", "Professional"))
@@ -509,15 +527,15 @@ async def tailor_resume_endpoint(request: ResumeTailorRequest):
     """Tailor resume to a specific Job Description"""
     try:
         ollama = get_ollama_client()
-        agent = ResumeAdvisorAgent(ollama.get_generator("fast"))
+        agent = get_resume_advisor(ollama.get_generator("fast"))
         
         # Use provided persona on fallback to saved one
         persona = request.persona
         if not persona:
             persona_path = f"uploads/{request.user_id}/persona.json"
             if os.path.exists(persona_path):
-                with open(persona_path, "r") as f:
-                    persona = json.load(f)
+                with open(persona_path, "rb") as f:
+                    persona = orjson.loads(f.read())
             else:
                 raise HTTPException(status_code=400, detail="No persona provided or found. Please upload resume first.")
         
@@ -566,8 +584,8 @@ async def tailor_resume_endpoint(request: ResumeTailorRequest):
                 "persona": persona,
                 "tailored_content": result,
             }
-            with open(session_path, "w") as f:
-                json.dump(session_data, f, indent=2)
+            with open(session_path, "wb") as f:
+                f.write(orjson.dumps(session_data, option=orjson.OPT_INDENT_2))
             logger.info(f"Saved session {session_id} for {request.user_id}")
         except Exception as se:
             logger.warning(f"Could not save session: {se}")
@@ -591,8 +609,8 @@ async def list_resume_sessions(user_id: str):
         for fname in sorted(os.listdir(sessions_dir), reverse=True):
             if fname.endswith(".json"):
                 fpath = os.path.join(sessions_dir, fname)
-                with open(fpath, "r") as f:
-                    data = json.load(f)
+                with open(fpath, "rb") as f:
+                    data = orjson.loads(f.read())
                 sessions.append({
                     "session_id": data.get("session_id", fname.replace(".json", "")),
                     "timestamp": data.get("timestamp", ""),
@@ -610,8 +628,8 @@ async def load_resume_session(user_id: str, session_id: str):
     if not os.path.exists(session_path):
         raise HTTPException(status_code=404, detail="Session not found")
     try:
-        with open(session_path, "r") as f:
-            data = json.load(f)
+        with open(session_path, "rb") as f:
+            data = orjson.loads(f.read())
         return {"status": "success", "session": data}
     except Exception as e:
         logger.error(f"Error loading session: {e}")
@@ -645,8 +663,8 @@ async def generate_resume_pdf(request: ResumeTailorRequest):
         if not request.persona:
             persona_path = f"uploads/{request.user_id}/persona.json"
             if os.path.exists(persona_path):
-                with open(persona_path, "r") as f:
-                    request.persona = json.load(f)
+                with open(persona_path, "rb") as f:
+                    request.persona = orjson.loads(f.read())
             else:
                 raise HTTPException(status_code=400, detail="No persona found")
          
@@ -713,20 +731,29 @@ async def generate_resume_pdf(request: ResumeTailorRequest):
         output_cl_path          = f"{output_dir}/cover_letter.pdf"
         output_cl_docx_path     = f"{output_dir}/cover_letter.docx"
 
-        has_cl = False
-        if "cover_letter" in request.persona and str(request.persona["cover_letter"]).strip():
+        logger.info(f"Generating documents for {request.user_id} using {request.template} template.")
+        
+        # The four documents are independent, so the blocking generations
+        # run side by side in the threadpool
+        generations = [
+            # PDF Resume
+            run_in_threadpool(generate_pdf, output_resume_path, request.persona, request.template, request.profile_pic, request.page_count or 2),
+            # DOCX Resume
+            run_in_threadpool(generate_resume_docx, output_resume_docx_path, request.persona, request.template, request.page_count or 2),
+        ]
+        wants_cl = "cover_letter" in request.persona and str(request.persona["cover_letter"]).strip()
+        if wants_cl:
             logger.info(f"Generating cover letter (len {len(str(request.persona['cover_letter']))})")
-            has_cl = await run_in_threadpool(generate_cover_letter_pdf, output_cl_path, request.persona, request.template)
+            generations.append(run_in_threadpool(generate_cover_letter_pdf, output_cl_path, request.persona, request.template))
+            generations.append(run_in_threadpool(generate_cover_letter_docx, output_cl_docx_path, request.persona, request.template))
         else:
             logger.warning("No cover letter content found. Skipping cover letter generation.")
-
-        logger.info(f"Generating documents for {request.user_id} using {request.template} template.")
         
-        # Run blocking generations in threadpool
-        # PDF Resume
-        await run_in_threadpool(generate_pdf, output_resume_path, request.persona, request.template, request.profile_pic, request.page_count or 2)
-        # DOCX Resume
-        await run_in_threadpool(generate_resume_docx, output_resume_docx_path, request.persona, request.template, request.page_count or 2)
+        results = await asyncio.gather(*generations)
+        # Each cover letter format is returned only if its own generation succeeded
+        has_cl_pdf  = bool(wants_cl) and bool(results[2])
+        has_cl_docx = bool(wants_cl) and bool(results[3])
+        has_cl = has_cl_pdf or has_cl_docx
         
         response_data = {
              "status": "success",
@@ -735,10 +762,9 @@ async def generate_resume_pdf(request: ResumeTailorRequest):
              "message": "Resume generated successfully"
         }
         
-        if has_cl:
-             # Also generate DOCX cover letter
-             await run_in_threadpool(generate_cover_letter_docx, output_cl_docx_path, request.persona, request.template)
+        if has_cl_pdf:
              response_data["cover_letter_url"] = f"/api/uploads/{request.user_id}/cover_letter.pdf"
+        if has_cl_docx:
              response_data["cover_letter_docx_url"] = f"/api/uploads/{request.user_id}/cover_letter.docx"
              
         # Log the activity
@@ -812,7 +838,7 @@ Return ONLY the JSON object, no other text."""
             json_end = clean_response.rfind('}') + 1
             if json_start >= 0 and json_end > json_start:
                 json_str = clean_response[json_start:json_end]
-                parsed_data = json.loads(json_str)
+                parsed_data = orjson.loads(json_str)
                 logger.info(f"Successfully parsed resume data: {list(parsed_data.keys())}")
             else:
                 raise ValueError("No JSON object found in response")
@@ -1097,7 +1123,7 @@ Return ONLY the JSON object, no other text:"""
             elif '```' in ai_response:
                 ai_response = ai_response.split('```')[1].split('```')[0].strip()
             
-            parsed_data = json.loads(ai_response)
+            parsed_data = orjson.loads(ai_response)
             
             # Ensure all required fields exist
             result = {
@@ -1302,8 +1328,8 @@ async def career_path_endpoint(request: CareerPathRequest):
     """
     try:
         logger.info("Predicting career path")
-        result = predict_career_path(request.user_profile, request.target_role)
-        return result
+        result = predict_career_path_json(request.user_profile, request.target_role)
+        return Response(content=result, media_type="application/json")
     except Exception as e:
         logger.error(f"Error predicting career path: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
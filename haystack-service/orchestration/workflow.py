@@ -3,7 +3,11 @@ Haystack Multi-Agent Workflow
 Orchestrates specialized agents using LOCAL Ollama models via Haystack Pipelines
 """
 
-from typing import Dict, Any, List, TypedDict
+import asyncio
+import re
+import threading
+from typing import Dict, Any, List, Optional, TypedDict
+from haystack.dataclasses import StreamingChunk
 from integrations.ollama_client import get_ollama_client
 from agents.supervisor import SupervisorAgent
 from agents.profile_agent import ProfileAgent
@@ -12,7 +16,11 @@ from agents.job_search_agent import JobSearchAgent
 from agents.resume_builder_agent import ResumeBuilderAgent
 from agents.learning_agent import LearningAgent
 
-class CareerGiniState(TypedDict):
+class _OptionalState(TypedDict, total=False):
+    # Every agent that handled the turn when a request had several intents
+    active_agents: List[str]
+
+class CareerGiniState(_OptionalState):
     """State passed between agents"""
     user_id: str
     session_id: str
@@ -23,6 +31,49 @@ class CareerGiniState(TypedDict):
     suggested_prompts: List[str]
     active_agent: str
 
+# Deterministic keyword routes in priority order. Keywords match at the start
+# of a word ("search" in "searching" but not "research").
+_KEYWORD_ROUTES = {
+    name: re.compile(r"\b(?:" + "|".join(re.escape(kw) for kw in keywords) + ")")
+    for name, keywords in (
+        ("resume", ("resume", "cv", "review my")),
+        ("job_search", ("job", "apply", "search")),
+        ("learning", ("learn", "course", "certif")),
+        ("skills_gap", ("skills", "gap", "missing")),
+    )
+}
+
+# Words that join two separate requests in one message
+_JOIN_RE = re.compile(r"\b(?:and|also|plus|as well as)\b|[&;]")
+
+def _route_by_keywords(last_message: str) -> List[str]:
+    """
+    Agents for the (lowercased) message, in priority order. The first route
+    with a keyword hit always handles it; a later route is co-activated only on
+    clear evidence of a second intent: two distinct keywords of its own, or a
+    hit in a clause (split on and/also/plus) the first route does not touch.
+    """
+    hits = {}
+    for name, pattern in _KEYWORD_ROUTES.items():
+        found = {m.group(0) for m in pattern.finditer(last_message)}
+        if found:
+            hits[name] = found
+    if not hits:
+        return []
+
+    primary, *others = hits
+    selected = [primary]
+    if others:
+        clauses = _JOIN_RE.split(last_message)
+        primary_re = _KEYWORD_ROUTES[primary]
+        for name in others:
+            if len(hits[name]) >= 2 or (len(clauses) > 1 and any(
+                _KEYWORD_ROUTES[name].search(clause) and not primary_re.search(clause)
+                for clause in clauses
+            )):
+                selected.append(name)
+    return selected
+
 class HaystackWorkflow:
     def __init__(self):
         ollama_client = get_ollama_client()
@@ -37,87 +88,114 @@ class HaystackWorkflow:
             "learning": LearningAgent(ollama_client.get_generator("fast"))
         }
 
-    async def ainvoke(self, state: Dict[str, Any]) -> Dict[str, Any]:
+    async def _select_agents(self, state: Dict[str, Any]) -> List[str]:
         """
-        Execute the workflow utilizing deterministic routing where possible.
+        Pick the agents for this turn using deterministic routing where possible.
         """
         messages = state.get("messages", [])
         last_message = messages[-1]["content"].lower() if messages else ""
         
         # 1. Deterministic Conditional Routing (Performance Optimization)
         # Bypass the LLM Supervisor entirely for clear keywords
-        active_agent_name = None
+        agent_names = _route_by_keywords(last_message)
         
-        # Simple Regex/Keyword matching
-        if any(kw in last_message for kw in ["resume", "cv", "review my"]):
-            active_agent_name = "resume"
-        elif any(kw in last_message for kw in ["job", "apply", "search"]):
-            active_agent_name = "job_search"
-        elif any(kw in last_message for kw in ["learn", "course", "certif"]):
-            active_agent_name = "learning"
-        elif any(kw in last_message for kw in ["skills", "gap", "missing"]):
-            active_agent_name = "skills_gap"
-            
         # Fallback to LLM Supervisor if deterministic routing fails
-        if not active_agent_name:
+        if not agent_names:
             routed_state = await self.supervisor.run(state)
-            active_agent_name = routed_state.get("active_agent")
-            
-        if not active_agent_name or active_agent_name not in self.agents:
-            active_agent_name = "profile"
-            
-        state["active_agent"] = active_agent_name
-            
-        # 2. Run the selected agent
-        agent = self.agents[active_agent_name]
-        final_state = await agent.run(state)
-        
-        return final_state
+            agent_names = [routed_state.get("active_agent")]
         
-    async def astream_events(self, state: Dict[str, Any], version="v1"):
+        agent_names = [name for name in agent_names if name in self.agents] or ["profile"]
+        state["active_agent"] = agent_names[0]
+        if len(agent_names) > 1:
+            state["active_agents"] = agent_names
+        return agent_names
+
+    async def ainvoke(self, state: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Mock streaming events for Haystack using conditional deterministic routing.
+        Execute the workflow utilizing deterministic routing where possible.
         """
-        messages = state.get("messages", [])
-        last_message = messages[-1]["content"].lower() if messages else ""
+        agent_names = await self._select_agents(state)
         
-        # 1. Deterministic Conditional Routing (Performance Optimization)
-        active_agent_name = None
+        # 2. Run the selected agent
+        if len(agent_names) == 1:
+            return await self.agents[agent_names[0]].run(state)
         
-        if any(kw in last_message for kw in ["resume", "cv", "review my"]):
-            active_agent_name = "resume"
-        elif any(kw in last_message for kw in ["job", "apply", "search"]):
-            active_agent_name = "job_search"
-        elif any(kw in last_message for kw in ["learn", "course", "certif"]):
-            active_agent_name = "learning"
-        elif any(kw in last_message for kw in ["skills", "gap", "missing"]):
-            active_agent_name = "skills_gap"
-            
-        if not active_agent_name:
-            routed_state = await self.supervisor.run(state)
-            active_agent_name = routed_state.get("active_agent", "profile")
+        # Several intents: the agents are independent, so fan out and merge.
+        # Each gets its own shallow copy since agents write final_output.
+        results = await asyncio.gather(*(
+            self.agents[name].run({**state}) for name in agent_names
+        ))
+        outputs = [result["final_output"] for result in results]
+        state.setdefault("agent_responses", {}).update(zip(agent_names, outputs))
+        state["final_output"] = "\n\n".join(outputs)
+        return state
         
-        state["active_agent"] = active_agent_name
+    async def astream_events(self, state: Dict[str, Any], version="v1"):
+        """
+        Stream LangGraph-style events for Haystack using conditional deterministic routing.
+        """
+        agent_names = await self._select_agents(state)
         
+        output = {"active_agent": agent_names[0]}
+        if len(agent_names) > 1:
+            output["active_agents"] = agent_names
         yield {
             "event": "on_chain_end",
             "metadata": {"langgraph_node": "supervisor"},
-            "data": {"output": {"active_agent": active_agent_name}}
+            "data": {"output": output}
         }
         
-        # 2. Agent execution
-        agent = self.agents.get(active_agent_name, self.agents["profile"])
-        final_state = await agent.run(state)
+        # 2. Agent execution — forward tokens as soon as Ollama emits them
+        if len(agent_names) == 1:
+            async for update in self.agents[agent_names[0]].astream(state):
+                yield self._chunk_event(agent_names[0], update["delta"])
+            return
         
-        # Yield the final response chunk
-        yield {
+        # Several intents: every agent generates concurrently, but replies are
+        # emitted one after another. The first streams live; later ones are
+        # buffered meanwhile and flushed once their turn comes. Streaming only
+        # reads the state, so the agents share it without copies.
+        queues = {name: asyncio.Queue() for name in agent_names}
+        
+        async def pump(name: str):
+            try:
+                async for update in self.agents[name].astream(state):
+                    queues[name].put_nowait(update["delta"])
+            finally:
+                queues[name].put_nowait(None)
+        
+        tasks = [asyncio.ensure_future(pump(name)) for name in agent_names]
+        try:
+            for i, name in enumerate(agent_names):
+                if i:
+                    yield self._chunk_event(name, "\n\n")
+                while (delta := await queues[name].get()) is not None:
+                    yield self._chunk_event(name, delta)
+            # Surface agent errors to the caller
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    @staticmethod
+    def _chunk_event(agent_name: str, delta: str) -> Dict[str, Any]:
+        return {
             "event": "on_chat_model_stream",
-            "metadata": {"langgraph_node": active_agent_name},
-            "data": {"chunk": type('obj', (object,), {'content': final_state.get('final_output', '')})}
+            "metadata": {"langgraph_node": agent_name},
+            "data": {"chunk": StreamingChunk(content=delta)}
         }
 
-def build_careergini_workflow():
+# The workflow holds no per-request state, so one instance serves the process
+_workflow: Optional[HaystackWorkflow] = None
+_workflow_lock = threading.Lock()
+
+def build_careergini_workflow() -> HaystackWorkflow:
     """
-    Build Haystack workflow instance.
+    Build Haystack workflow instance, once per process; later calls reuse it.
     """
-    return HaystackWorkflow()
+    global _workflow
+    if _workflow is None:
+        with _workflow_lock:
+            if _workflow is None:
+                _workflow = HaystackWorkflow()
+    return _workflow
@@ -19,7 +19,7 @@ from reportlab.lib.units import inch
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 from typing import Dict, Any, List, Optional
-import base64, io, logging, os
+import base64, io, logging, os, threading
 
 logger = logging.getLogger(__name__)
 PAGE_W, PAGE_H = letter  # 612 × 792 pt
@@ -81,6 +81,24 @@ def parse_base64_image(b64: str, w: float = 1.1 * inch, h: float = 1.1 * inch):
         return None
 
 
+def _build_doc(output_path: str, story: List, **doc_kwargs):
+    """
+    Build story into output_path.
+
+    ReportLab holds the whole page tree until save and then writes the file
+    in one go, so there is nothing to stream; instead the PDF is written
+    next to the target and moved into place, and a download racing a
+    regeneration never sees a truncated file.
+    """
+    tmp_path = f"{output_path}.{os.getpid()}-{threading.get_ident()}.tmp"
+    try:
+        SimpleDocTemplate(tmp_path, pagesize=letter, **doc_kwargs).build(story)
+        os.replace(tmp_path, output_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
 def _bullets(exp: dict) -> List[str]:
     raw = exp.get("tailored_bullets") or exp.get("key_achievement") or []
     if isinstance(raw, list):
@@ -585,11 +603,6 @@ def generate_cover_letter_pdf(
     mt = mb = 0.55 * inch
 
     S = build_styles(template, page_count=2)
-    doc = SimpleDocTemplate(
-        output_path, pagesize=letter,
-        leftMargin=ml, rightMargin=mr,
-        topMargin=mt, bottomMargin=mb,
-    )
 
     story: List = []
     story.append(Paragraph(_clean(persona.get("full_name")), S["name"]))
@@ -602,7 +615,9 @@ def generate_cover_letter_pdf(
     story.append(Paragraph(cl, S["body_left"]))
 
     try:
-        doc.build(story)
+        _build_doc(output_path, story,
+                   leftMargin=ml, rightMargin=mr,
+                   topMargin=mt, bottomMargin=mb)
         logger.info(f"Cover Letter PDF → {output_path}")
         return True
     except Exception as e:
@@ -682,12 +697,6 @@ def generate_pdf(
     try:
         story: List = []
 
-        doc = SimpleDocTemplate(
-            output_path, pagesize=letter,
-            leftMargin=ml, rightMargin=mr,
-            topMargin=mt, bottomMargin=mb,
-        )
-
         if template == "executive":
             _render_executive(story, persona, S, compact)
         elif template == "fresher":
@@ -695,7 +704,9 @@ def generate_pdf(
         else:
             _render_professional(story, persona, S, compact)
 
-        doc.build(story)
+        _build_doc(output_path, story,
+                   leftMargin=ml, rightMargin=mr,
+                   topMargin=mt, bottomMargin=mb)
         logger.info(f"PDF built → {output_path}  [{template}, {page_count}p, compact={compact}]")
         return True
 
@@ -1,5 +1,6 @@
 
 import json
+import orjson
 import os
 import logging
 from typing import Dict, Any, List, Optional
@@ -30,8 +31,8 @@ class PersonaManager:
         """Load profile from disk or create empty one"""
         if os.path.exists(self.profile_path):
             try:
-                with open(self.profile_path, "r") as f:
-                    return json.load(f)
+                with open(self.profile_path, "rb") as f:
+                    return orjson.loads(f.read())
             except Exception as e:
                 logger.error(f"Error loading profile for {self.user_id}: {e}")
         
@@ -169,8 +170,8 @@ class PersonaManager:
         resume_persona = {}
         if os.path.exists(persona_path):
             try:
-                with open(persona_path, "r") as f:
-                    resume_persona = json.load(f)
+                with open(persona_path, "rb") as f:
+                    resume_persona = orjson.loads(f.read())
             except Exception:
                 pass
 
@@ -4,27 +4,128 @@ Analyzes resumes for Applicant Tracking System compatibility
 """
 
 import re
-from typing import Dict, List, Any
-import spacy
-from collections import Counter
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Any, Tuple
+
+_WORD_RE = re.compile(r'\b[a-z]{2,}\b')
+_SPECIAL_RE = re.compile(r'[^\w\s\-.,;:()\[\]@#$%&*+=/<>]')
+# ASCII bytes _SPECIAL_RE never matches, deleted in one C-level pass
+_ALLOWED_ASCII = bytes(i for i in range(128) if not _SPECIAL_RE.match(chr(i)))
+_CAPS_RE = re.compile(r'[A-Z]{20,}')
+_NUM_RE = re.compile(r'\d+[%$]?|\$\d+')
+_BULLET_NUM_RE = re.compile(r'^\d+\.')
+
+# Matched against whole tokens, so 'led' doesn't count inside 'called' or 'handled'
+_ACTION_VERBS = frozenset({
+    'led', 'managed', 'developed', 'created', 'implemented', 'designed',
+    'improved', 'increased', 'reduced', 'achieved', 'delivered', 'built',
+})
+
+def _count_special_chars(text: str) -> int:
+    """
+    Number of _SPECIAL_RE matches in text, without a match list.
+    Allowed ASCII is stripped from the UTF-8 bytes first (multi-byte
+    sequences are never split); only the non-ASCII remainder, if any,
+    goes through the regex, since letters like 'é' still count as allowed.
+    """
+    rest = text.encode('utf-8', 'surrogatepass').translate(None, _ALLOWED_ASCII)
+    if rest.isascii():
+        return len(rest)
+    return len(_SPECIAL_RE.findall(rest.decode('utf-8', 'surrogatepass')))
+
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
+    'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'should',
+    'could', 'may', 'might', 'must', 'can', 'this', 'that', 'these', 'those',
+})
+
+@lru_cache(maxsize=128)
+def _tokenize(text: str) -> Tuple[str, ...]:
+    """Lowercase words of 2+ letters; shared by keyword extraction and the resume scan"""
+    return tuple(_WORD_RE.findall(text.lower()))
+
+@lru_cache(maxsize=128)
+def _extract_keywords(text: str) -> frozenset:
+    """
+    Words and bigrams of text, minus stop words.
+    Memoized: analyze_resume extracts the same resume and job description
+    twice, once for the score and once for the issues.
+    """
+    words = _tokenize(text)
+    keywords = {word for word in words if word not in _STOP_WORDS}
+    
+    # Extract multi-word phrases (bigrams) from the same tokens
+    bigrams = {
+        f"{first} {second}"
+        for first, second in zip(words, words[1:])
+        if first not in _STOP_WORDS and second not in _STOP_WORDS
+    }
+    
+    return frozenset(keywords | bigrams)
+
+_STANDARD_SECTIONS = MappingProxyType({
+    'experience': ('experience', 'work experience', 'professional experience', 'employment history', 'work history'),
+    'education': ('education', 'academic background', 'qualifications'),
+    'skills': ('skills', 'technical skills', 'core competencies', 'expertise'),
+    'summary': ('summary', 'professional summary', 'profile', 'objective'),
+    'contact': ('contact', 'contact information'),
+})
+
+def _minimal_headers(headers) -> Tuple[str, ...]:
+    """Drop headers containing a shorter one; 'work experience' can't match unless 'experience' does"""
+    return tuple(h for h in headers if not any(other != h and other in h for other in headers))
+
+# Headers actually worth searching for. Plain substring tests beat a
+# combined regex alternation by over an order of magnitude on resume text.
+_SECTION_MATCHERS = MappingProxyType({
+    section_type: _minimal_headers(headers) for section_type, headers in _STANDARD_SECTIONS.items()
+})
+_ALL_SECTION_HEADERS = _minimal_headers([h for headers in _STANDARD_SECTIONS.values() for h in headers])
+
+# spaCy pipeline shared by every scorer; loading it dominates scoring latency
+_nlp = None
+_nlp_loaded = False
+_nlp_lock = threading.Lock()
+
+def _get_nlp():
+    """Load the spaCy model once per process; None if it isn't installed"""
+    global _nlp, _nlp_loaded
+    if not _nlp_loaded:
+        with _nlp_lock:
+            if not _nlp_loaded:
+                # Imported here so importing the scorer doesn't pay for spaCy
+                import spacy
+                try:
+                    # Dependency parse and entities aren't used for scoring
+                    _nlp = spacy.load("en_core_web_sm", disable=["parser", "ner"])
+                except OSError:
+                    # Fallback if model not installed
+                    _nlp = None
+                _nlp_loaded = True
+    return _nlp
+
+@dataclass(frozen=True, slots=True)
+class ResumeScan:
+    """Everything the scoring rules read from a resume, gathered in one pass"""
+    special_char_count: int
+    has_caps_run: bool
+    line_count: int
+    long_line_count: int
+    numbers_count: int
+    verb_count: int
+    word_count: int
+    found_sections: Dict[str, bool]
+    non_standard_headers: Tuple[str, ...]
+    weak_bullets: Tuple[str, ...]
 
 class ATSScorer:
     def __init__(self):
-        # Load spaCy model for NLP
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except:
-            # Fallback if model not installed
-            self.nlp = None
-        
         # Standard ATS-friendly section headers
-        self.standard_sections = {
-            'experience': ['experience', 'work experience', 'professional experience', 'employment history', 'work history'],
-            'education': ['education', 'academic background', 'qualifications'],
-            'skills': ['skills', 'technical skills', 'core competencies', 'expertise'],
-            'summary': ['summary', 'professional summary', 'profile', 'objective'],
-            'contact': ['contact', 'contact information']
-        }
+        self.standard_sections = _STANDARD_SECTIONS
         
         # Common ATS-unfriendly elements
         self.problematic_elements = [
@@ -32,6 +133,11 @@ class ATSScorer:
             'graphics', 'special characters', 'unusual fonts'
         ]
     
+    @property
+    def nlp(self):
+        """spaCy pipeline, loaded on first use; the rule-based scoring doesn't need it"""
+        return _get_nlp()
+    
     def analyze_resume(self, resume_text: str, job_description: str = None) -> Dict[str, Any]:
         """
         Comprehensive ATS analysis of resume
@@ -43,11 +149,13 @@ class ATSScorer:
         Returns:
             Dictionary with scores, issues, and recommendations
         """
+        scan = self._scan(resume_text)
+        
         # Individual component scores
         keyword_score = self._analyze_keywords(resume_text, job_description) if job_description else 100
-        formatting_score = self._analyze_formatting(resume_text)
-        section_score = self._analyze_sections(resume_text)
-        content_score = self._analyze_content_quality(resume_text)
+        formatting_score = self._analyze_formatting(scan)
+        section_score = self._analyze_sections(scan)
+        content_score = self._analyze_content_quality(scan)
         
         # Calculate overall score (weighted average)
         overall_score = int(
@@ -60,9 +168,9 @@ class ATSScorer:
         # Collect all issues
         issues = []
         issues.extend(self._get_keyword_issues(resume_text, job_description))
-        issues.extend(self._get_formatting_issues(resume_text))
-        issues.extend(self._get_section_issues(resume_text))
-        issues.extend(self._get_content_issues(resume_text))
+        issues.extend(self._get_formatting_issues(scan))
+        issues.extend(self._get_section_issues(scan))
+        issues.extend(self._get_content_issues(scan))
         
         # Generate improvement suggestions
         improvements = self._generate_improvements(overall_score, issues)
@@ -78,6 +186,47 @@ class ATSScorer:
             "ats_friendly": overall_score >= 75
         }
     
+    def _scan(self, resume_text: str) -> ResumeScan:
+        """Split, lowercase and pattern-match the resume once for all rules"""
+        text_lower = resume_text.lower()
+        
+        lines = resume_text.split('\n')
+        long_line_count = 0
+        non_standard_headers = []
+        weak_bullets = []
+        for line in lines:
+            # Too long lines can indicate tables
+            if len(line) > 120:
+                long_line_count += 1
+            
+            # Potential custom section headers
+            if line.isupper() and len(line.split()) <= 3 and len(line) > 5:
+                line_lower = line.lower()
+                if not any(std in line_lower for std in _ALL_SECTION_HEADERS):
+                    non_standard_headers.append(line)
+            
+            # Bullet points with no numbers and substantial length
+            line_stripped = line.strip()
+            if line_stripped.startswith(('•', '-', '*')) or _BULLET_NUM_RE.match(line_stripped):
+                if not _NUM_RE.search(line) and len(line.split()) > 3:
+                    weak_bullets.append(line_stripped[:50])
+        
+        return ResumeScan(
+            special_char_count=_count_special_chars(resume_text),
+            has_caps_run=_CAPS_RE.search(resume_text) is not None,
+            line_count=len(lines),
+            long_line_count=long_line_count,
+            numbers_count=len(_NUM_RE.findall(resume_text)),
+            verb_count=sum(1 for token in _tokenize(resume_text) if token in _ACTION_VERBS),
+            word_count=len(resume_text.split()),
+            found_sections={
+                section_type: any(header in text_lower for header in headers)
+                for section_type, headers in _SECTION_MATCHERS.items()
+            },
+            non_standard_headers=tuple(non_standard_headers),
+            weak_bullets=tuple(weak_bullets),
+        )
+    
     def _analyze_keywords(self, resume_text: str, job_description: str) -> int:
         """Analyze keyword match between resume and job description"""
         if not job_description:
@@ -96,63 +245,32 @@ class ATSScorer:
         
         return int(match_percentage)
     
-    def _extract_keywords(self, text: str) -> set:
+    def _extract_keywords(self, text: str) -> frozenset:
         """Extract important keywords from text"""
         # Simple keyword extraction (can be enhanced with NLP)
-        text = text.lower()
-        
-        # Remove common words
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 
-                     'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
-                     'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'should',
-                     'could', 'may', 'might', 'must', 'can', 'this', 'that', 'these', 'those'}
-        
-        # Extract words (2+ chars, alphanumeric)
-        words = re.findall(r'\b[a-z]{2,}\b', text)
-        keywords = {word for word in words if word not in stop_words}
-        
-        # Extract multi-word phrases (bigrams)
-        bigrams = set()
-        words_list = text.split()
-        for i in range(len(words_list) - 1):
-            if words_list[i] not in stop_words and words_list[i+1] not in stop_words:
-                bigrams.add(f"{words_list[i]} {words_list[i+1]}")
-        
-        return keywords.union(bigrams)
+        return _extract_keywords(text)
     
-    def _analyze_formatting(self, resume_text: str) -> int:
+    def _analyze_formatting(self, scan: ResumeScan) -> int:
         """Analyze formatting for ATS compatibility"""
         score = 100
-        issues = []
         
         # Check for special characters
-        special_chars = re.findall(r'[^\w\s\-.,;:()\[\]@#$%&*+=/<>]', resume_text)
-        if len(special_chars) > 10:
+        if scan.special_char_count > 10:
             score -= 15
-            issues.append("Too many special characters")
         
         # Check for excessive formatting (all caps, excessive punctuation)
-        if re.search(r'[A-Z]{20,}', resume_text):
+        if scan.has_caps_run:
             score -= 10
-            issues.append("Excessive use of capital letters")
         
         # Check line length (too long lines can indicate tables)
-        lines = resume_text.split('\n')
-        long_lines = sum(1 for line in lines if len(line) > 120)
-        if long_lines > len(lines) * 0.3:
+        if scan.long_line_count > scan.line_count * 0.3:
             score -= 10
-            issues.append("Possible table formatting detected")
         
         return max(0, score)
     
-    def _analyze_sections(self, resume_text: str) -> int:
+    def _analyze_sections(self, scan: ResumeScan) -> int:
         """Check for presence of standard resume sections"""
-        text_lower = resume_text.lower()
-        
-        found_sections = {}
-        for section_type, headers in self.standard_sections.items():
-            found = any(header in text_lower for header in headers)
-            found_sections[section_type] = found
+        found_sections = scan.found_sections
         
         # Calculate score based on found sections
         required_sections = ['experience', 'education', 'skills']
@@ -166,28 +284,22 @@ class ATSScorer:
         
         return int(score)
     
-    def _analyze_content_quality(self, resume_text: str) -> int:
+    def _analyze_content_quality(self, scan: ResumeScan) -> int:
         """Analyze content quality (quantifiable achievements, action verbs)"""
         score = 100
         
         # Check for quantifiable achievements (numbers, percentages)
-        numbers = re.findall(r'\d+[%$]?|\$\d+', resume_text)
-        if len(numbers) < 5:
+        if scan.numbers_count < 5:
             score -= 20
         
         # Check for action verbs
-        action_verbs = ['led', 'managed', 'developed', 'created', 'implemented', 'designed',
-                       'improved', 'increased', 'reduced', 'achieved', 'delivered', 'built']
-        text_lower = resume_text.lower()
-        verb_count = sum(text_lower.count(verb) for verb in action_verbs)
-        if verb_count < 5:
+        if scan.verb_count < 5:
             score -= 15
         
         # Check resume length (too short or too long)
-        word_count = len(resume_text.split())
-        if word_count < 200:
+        if scan.word_count < 200:
             score -= 20
-        elif word_count > 1000:
+        elif scan.word_count > 1000:
             score -= 10
         
         return max(0, score)
@@ -216,23 +328,12 @@ class ATSScorer:
         
         return issues
     
-    def _get_formatting_issues(self, resume_text: str) -> List[Dict]:
+    def _get_formatting_issues(self, scan: ResumeScan) -> List[Dict]:
         """Get formatting-related issues"""
         issues = []
         
         # Check for non-standard section headers
-        text_lower = resume_text.lower()
-        non_standard_headers = []
-        
-        # Look for potential custom headers
-        lines = resume_text.split('\n')
-        for line in lines:
-            if line.isupper() and len(line.split()) <= 3 and len(line) > 5:
-                # Might be a header
-                if not any(std in line.lower() for section_headers in self.standard_sections.values() for std in section_headers):
-                    non_standard_headers.append(line)
-        
-        if non_standard_headers:
+        if scan.non_standard_headers:
             issues.append({
                 "type": "formatting",
                 "severity": "medium",
@@ -242,41 +343,28 @@ class ATSScorer:
         
         return issues
     
-    def _get_section_issues(self, resume_text: str) -> List[Dict]:
+    def _get_section_issues(self, scan: ResumeScan) -> List[Dict]:
         """Get section-related issues"""
         issues = []
-        text_lower = resume_text.lower()
         
         # Check for missing required sections
-        for section_type, headers in self.standard_sections.items():
-            if section_type in ['experience', 'education', 'skills']:
-                if not any(header in text_lower for header in headers):
-                    issues.append({
-                        "type": "missing_section",
-                        "severity": "high",
-                        "section": section_type.title(),
-                        "suggestion": f"Add a '{section_type.title()}' section to your resume"
-                    })
+        for section_type in ['experience', 'education', 'skills']:
+            if not scan.found_sections[section_type]:
+                issues.append({
+                    "type": "missing_section",
+                    "severity": "high",
+                    "section": section_type.title(),
+                    "suggestion": f"Add a '{section_type.title()}' section to your resume"
+                })
         
         return issues
     
-    def _get_content_issues(self, resume_text: str) -> List[Dict]:
+    def _get_content_issues(self, scan: ResumeScan) -> List[Dict]:
         """Get content quality issues"""
         issues = []
         
         # Check for weak bullet points (no action verbs or metrics)
-        lines = resume_text.split('\n')
-        weak_bullets = []
-        
-        for line in lines:
-            line_stripped = line.strip()
-            if line_stripped.startswith(('•', '-', '*')) or re.match(r'^\d+\.', line_stripped):
-                # It's a bullet point
-                if not re.search(r'\d+[%$]?|\$\d+', line) and len(line.split()) > 3:
-                    # No numbers and substantial length
-                    weak_bullets.append(line_stripped[:50])
-        
-        if weak_bullets:
+        if scan.weak_bullets:
             issues.append({
                 "type": "content_quality",
                 "severity": "medium",
@@ -313,6 +401,19 @@ class ATSScorer:
         return improvements
 
 
+_scorer = None
+_scorer_lock = threading.Lock()
+
+def get_ats_scorer() -> ATSScorer:
+    """Get or create global ATS scorer instance"""
+    global _scorer
+    if _scorer is None:
+        with _scorer_lock:
+            if _scorer is None:
+                _scorer = ATSScorer()
+    return _scorer
+
+
 # Utility function for API endpoint
 def score_resume(resume_text: str, job_description: str = None) -> Dict[str, Any]:
     """
@@ -325,5 +426,22 @@ def score_resume(resume_text: str, job_description: str = None) -> Dict[str, Any
     Returns:
         ATS analysis results
     """
-    scorer = ATSScorer()
+    scorer = get_ats_scorer()
     return scorer.analyze_resume(resume_text, job_description)
+
+def score_resumes(resume_texts: List[str], job_description: str = None) -> List[Dict[str, Any]]:
+    """
+    Score many resumes against one job description
+    
+    The job description's keywords are extracted once and served from the
+    keyword cache for every resume after the first.
+    
+    Args:
+        resume_texts: Full texts of the resumes
+        job_description: Optional job description for keyword matching
+    
+    Returns:
+        ATS analysis results, in the order of resume_texts
+    """
+    scorer = get_ats_scorer()
+    return [scorer.analyze_resume(text, job_description) for text in resume_texts]
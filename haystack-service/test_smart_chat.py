@@ -1,12 +1,31 @@
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
+import orjson
+import os
 import uuid
 import time
 
 AI_SERVICE_URL = "http://localhost:8000"
 USER_ID = "smart_chat_test_user"
 
+# One pooled session so every call reuses the same keep-alive connection
+session = requests.Session()
+session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
+def wait_for_update(path, previous_mtime, timeout=5.0, interval=0.1):
+    """Poll until path is modified after previous_mtime, or timeout elapses"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if os.path.getmtime(path) > previous_mtime:
+                return True
+        except OSError:
+            pass
+        time.sleep(interval)
+    return False
+
 def test_smart_chat():
     print(f"=== Testing Smart Chat for user: {USER_ID} ===")
     
@@ -31,9 +50,9 @@ def test_smart_chat():
     # 2. Upload Resume to seed Persona
     print("\n1. Uploading Resume...")
     try:
-        response = requests.post(f"{AI_SERVICE_URL}/resume/upload", 
-                                 params={"user_id": USER_ID},
-                                 files=files)
+        response = session.post(f"{AI_SERVICE_URL}/resume/upload", 
+                                params={"user_id": USER_ID},
+                                files=files)
         if response.status_code == 200:
             print("✓ Resume Uploaded Successfully")
             print(json.dumps(response.json(), indent=2))
@@ -57,9 +76,9 @@ def test_smart_chat():
     }
     
     try:
-        response = requests.post(f"{AI_SERVICE_URL}/chat", json=payload, timeout=60)
+        response = session.post(f"{AI_SERVICE_URL}/chat", json=payload, timeout=60)
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             answer = data.get("response", "")
             print("\nAI Response:")
             print(answer)
@@ -78,22 +97,26 @@ def test_smart_chat():
     # 4. Test Memory Module (Dynamic Update)
     print("\n3. Testing Memory Module: 'I just passed the AWS Solutions Architect exam'...")
     payload["message"] = "I just passed the AWS Solutions Architect exam."
+    profile_path = f"uploads/{USER_ID}/unified_profile.json"
+    try:
+        profile_mtime = os.path.getmtime(profile_path)
+    except OSError:
+        profile_mtime = 0.0
     
     try:
-        response = requests.post(f"{AI_SERVICE_URL}/chat", json=payload, timeout=60)
+        response = session.post(f"{AI_SERVICE_URL}/chat", json=payload, timeout=60)
         if response.status_code == 200:
             print("AI Acknowledged.")
             
             # Wait for background task
             print("Waiting for background update...")
-            time.sleep(5) 
+            wait_for_update(profile_path, profile_mtime)
             
             # Check unified profile
             # We can't query it via API yet, so we'll check file system (since we are local)
-            profile_path = f"uploads/{USER_ID}/unified_profile.json"
             try:
-                with open(profile_path, "r") as f:
-                    profile = json.load(f)
+                with open(profile_path, "rb") as f:
+                    profile = orjson.loads(f.read())
                     
                 skills = profile.get("skills", [])
                 goals = profile.get("goals", [])
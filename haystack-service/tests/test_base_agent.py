@@ -0,0 +1,83 @@
+import asyncio
+import sys
+import os
+
+import httpx
+import orjson
+import pytest
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.base_agent import BaseAgent
+
+
+class FakeGenerator:
+    """Carries the settings agents read when calling Ollama directly"""
+    model = "test-model"
+    url = "http://ollama:11434/"
+    keep_alive = "5m"
+    generation_kwargs = {"num_ctx": 2048, "top_p": 0.9}
+
+    def run(self, **kwargs):
+        raise AssertionError("agents should not block on the generator")
+
+
+class EchoAgent(BaseAgent):
+    def build_prompt(self, state):
+        return state["messages"][-1]["content"]
+
+
+@pytest.fixture
+def serve(monkeypatch):
+    """Point the shared client at an in-process Ollama stand-in for one test"""
+    clients = []
+
+    def install(handler):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(BaseAgent, "_http_client", client)
+        clients.append(client)
+
+    yield install
+    for client in clients:
+        asyncio.run(client.aclose())
+
+
+def test_run_awaits_ollama_without_threads(serve):
+    """The request carries merged options and the reply lands on the state"""
+    requests = []
+
+    def handler(request):
+        requests.append(orjson.loads(request.content))
+        return httpx.Response(200, json={"response": "Hello Jane", "done": True})
+
+    serve(handler)
+    state = {"messages": [{"role": "user", "content": "what is my name?"}]}
+    result = asyncio.run(EchoAgent(FakeGenerator()).run(state))
+
+    assert result is state
+    assert state["final_output"] == "Hello Jane"
+    assert requests == [{
+        "model": "test-model",
+        "prompt": "what is my name?",
+        "stream": False,
+        "options": {"num_ctx": 2048, "top_p": 0.9, "num_predict": 512},
+        "keep_alive": "5m",
+    }]
+
+
+def test_astream_yields_ndjson_deltas(serve):
+    """Each streamed line becomes a delta until Ollama reports done"""
+    lines = [{"response": "Hi", "done": False}, {"response": " there", "done": False}, {"response": "", "done": True}]
+
+    def handler(request):
+        assert request.url.path == "/api/generate"
+        return httpx.Response(200, content=b"\n".join(orjson.dumps(line) for line in lines))
+
+    serve(handler)
+
+    async def collect():
+        state = {"messages": [{"role": "user", "content": "hi"}]}
+        return [event async for event in EchoAgent(FakeGenerator()).astream(state)]
+
+    assert asyncio.run(collect()) == [{"delta": "Hi"}, {"delta": " there"}]
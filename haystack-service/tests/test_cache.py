@@ -14,7 +14,9 @@ from cache.redis_cache import ResponseCache
 # but we prefer integration testing with the real container if possible.
 # For unit tests, we'll assume the docker container is running or mock it.
 
-@pytest.fixture
+# One cache, and so one Redis connection pool, shared by every test; the
+# connect + ping (or its timeout when Redis is down) happens once per run
+@pytest.fixture(scope="session")
 def redis_cache():
     # Use a distinct prefix for testing to avoid colliding with real data
     # We rely on the generic 'redis' hostname inside docker, or localhost if running outside
@@ -59,13 +61,14 @@ def test_cache_miss(redis_cache):
     cached = redis_cache.get(agent, query)
     assert cached is None
 
-def test_ttl_expiration(redis_cache):
+def test_ttl_expiration(redis_cache, monkeypatch):
     """Verify keys expire after TTL"""
     if not redis_cache.redis:
         pytest.skip("Redis not available")
         
-    # Manually set Short TTL for testing
-    redis_cache.ttl = 1 
+    # Manually set Short TTL for testing; restored after the test since the
+    # cache is shared
+    monkeypatch.setattr(redis_cache, "ttl", 1)
     
     agent = "test_agent"
     query = "expire_query"
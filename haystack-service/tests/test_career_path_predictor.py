@@ -0,0 +1,108 @@
+import pytest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import orjson
+
+from career_path_predictor import predict_career_path, predict_career_path_json
+
+def test_junior_software_engineer():
+    """Empty profile starts at level 0 on the default track"""
+    result = predict_career_path({})
+
+    assert result["current_level"] == 0
+    assert result["role_category"] == "software_engineer"
+    assert [t["title"] for t in result["timeline"]][:2] == ["Junior Software Engineer", "Software Engineer"]
+    assert [t["years_from_now"] for t in result["timeline"]] == [0, 2, 4, 7, 10]
+    assert result["success_probability"] == 60
+    assert result["milestones"][0]["milestone"] == "Master System Design"
+
+def test_data_science_inference_and_salary():
+    """ML skills route to the data science track with projected salary ranges"""
+    profile = {
+        "skills": ["Machine Learning"] + [f"skill{i}" for i in range(10)],
+        "experience": [{}, {}],
+        "education": ["Masters in Statistics"],
+    }
+    result = predict_career_path(profile)
+
+    assert result["current_level"] == 2
+    assert result["role_category"] == "data_scientist"
+    assert result["success_probability"] == 80
+    projections = result["salary_projection"]["projections"]
+    assert [p["salary"] for p in projections] == [160000, 200000]
+    assert projections[0]["salary_range"] == {"min": 128000, "max": 192000}
+    assert result["salary_projection"]["growth_percentage"] == 25
+
+def test_top_level_has_no_next_step():
+    """At the last level there are no milestones and a single projection"""
+    result = predict_career_path({"experience": [{}] * 6}, target_role="software_engineer")
+
+    assert result["current_level"] == 4
+    assert result["milestones"] == []
+    assert len(result["salary_projection"]["projections"]) == 1
+    assert result["recommendations"][0] == "Focus on org-wide impact"
+
+def test_results_are_independent():
+    """Mutating one result must not leak into the next call"""
+    first = predict_career_path({})
+    first["timeline"][0]["key_skills_needed"].append("Hacking")
+    first["recommendations"].append("Extra")
+    first["alternative_paths"].clear()
+
+    second = predict_career_path({})
+    assert "Hacking" not in second["timeline"][0]["key_skills_needed"]
+    assert "Extra" not in second["recommendations"]
+    assert len(second["alternative_paths"]) == 3
+
+def test_json_matches_dict_result():
+    """Cached JSON encoding decodes to the same prediction, on hits too"""
+    profile = {"skills": ["Statistics", "SQL"], "experience": [{}], "education": ["PhD"]}
+
+    expected = predict_career_path(profile)
+    assert orjson.loads(predict_career_path_json(profile)) == expected
+    assert orjson.loads(predict_career_path_json(profile)) == expected
+
+def test_typed_result_is_immutable():
+    """predict() returns a frozen result whose to_dict matches predict_path"""
+    from dataclasses import FrozenInstanceError
+    from career_path_predictor import CareerPathPredictor, CareerPathResult
+
+    predictor = CareerPathPredictor()
+    result = predictor.predict({"experience": [{}]})
+
+    assert isinstance(result, CareerPathResult)
+    assert result.to_dict() == predictor.predict_path({"experience": [{}]})
+    with pytest.raises(FrozenInstanceError):
+        result.current_level = 3
+
+def test_persistent_cache_round_trip():
+    """Encoded predictions are written to and served from the shared cache"""
+    from career_path_predictor import set_persistent_cache
+
+    class DictCache:
+        def __init__(self):
+            self.data = {}
+
+        def get(self, agent, query):
+            return self.data.get((agent, query))
+
+        def set(self, agent, query, response):
+            self.data[(agent, query)] = response
+
+    shared = DictCache()
+    try:
+        set_persistent_cache(shared)
+        encoded = predict_career_path_json({"experience": [{}] * 2})
+        assert len(shared.data) == 1
+
+        # A fresh process (empty LRU) is served from the shared cache
+        set_persistent_cache(shared)
+        shared.data = {key: '{"cached": true}' for key in shared.data}
+        assert orjson.loads(predict_career_path_json({"experience": [{}] * 2})) == {"cached": True}
+        assert orjson.loads(encoded)["current_level"] == 2
+    finally:
+        set_persistent_cache(None)
@@ -0,0 +1,176 @@
+import asyncio
+import json
+import pytest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from interview_simulator import InterviewSimulator, _EVAL_CACHE
+
+
+@pytest.fixture(autouse=True)
+def clear_eval_cache():
+    _EVAL_CACHE.clear()
+    yield
+    _EVAL_CACHE.clear()
+
+
+def answer(detail):
+    """An answer long enough to be sent to the model"""
+    return f"In my last role I {detail} by planning the work, aligning the team and tracking results weekly."
+
+
+class FakeGenerator:
+    """Replies with canned text and records every prompt it was given"""
+    def __init__(self, reply):
+        self.reply = reply
+        self.prompts = []
+
+    def run(self, prompt, **kwargs):
+        self.prompts.append(prompt)
+        reply = self.reply(prompt) if callable(self.reply) else self.reply
+        return {"replies": [reply]}
+
+
+class FakeOllama:
+    def __init__(self, generator):
+        self.generator = generator
+
+    def get_generator(self, task_type):
+        return self.generator
+
+
+def test_batch_evaluation_uses_one_call():
+    """Pending answers are evaluated in a single prompt and matched by index"""
+    reply = "```json\n" + json.dumps([
+        {"index": 2, "overall_score": 60},
+        {"index": 1, "overall_score": 90, "strengths": ["clear"]},
+    ]) + "\n```"
+    generator = FakeGenerator(reply)
+    simulator = InterviewSimulator(FakeOllama(generator))
+
+    session = {"session_id": "s1", "questions_asked": []}
+    simulator.record_answer(session, "Q1", answer("A1"), "behavioral")
+    simulator.record_answer(session, "Q2", answer("A2"), "technical")
+    simulator.record_answer(session, "Q3", answer("A3"), "technical")
+
+    report = asyncio.run(simulator.end_session(session))
+
+    assert len(generator.prompts) == 1
+    assert "[3]" in generator.prompts[0]
+    scores = [q["evaluation"]["overall_score"] for q in session["questions_asked"]]
+    # The third answer was missing from the reply and gets the fallback
+    assert scores == [90, 60, 70]
+    assert report["questions_answered"] == 3
+    assert "clear" in report["strengths"]
+
+
+def test_unparseable_batch_falls_back_per_item():
+    """A non-JSON batch reply yields the fallback evaluation for every answer"""
+    simulator = InterviewSimulator(FakeOllama(FakeGenerator("no json here")))
+
+    evaluations = asyncio.run(simulator.evaluate_answers_batch(
+        [("Q1", answer("A1"), "behavioral"), ("Q2", answer("A2"), "technical")]
+    ))
+
+    assert [e["improvements"] for e in evaluations] == [["Could not parse detailed feedback"]] * 2
+
+
+def test_evaluate_and_advance():
+    """One round records the evaluation and moves to the next question"""
+    generator = FakeGenerator('{"overall_score": 82}')
+    simulator = InterviewSimulator(FakeOllama(generator))
+    session = asyncio.run(simulator.start_session("Engineer"))["session"]
+
+    result = asyncio.run(simulator.evaluate_and_advance(session, "Q1", answer("A1"), "behavioral"))
+
+    assert result["evaluation"]["overall_score"] == 82
+    assert result["next_question"]["index"] == 1
+    assert session["current_question_index"] == 1
+    assert len(session["questions_asked"]) == 1
+
+
+def test_failed_evaluation_does_not_advance():
+    """If evaluation fails the prefetched question is discarded"""
+    def fail(prompt):
+        raise RuntimeError("ollama down")
+
+    simulator = InterviewSimulator(FakeOllama(FakeGenerator(fail)))
+    session = asyncio.run(simulator.start_session("Engineer"))["session"]
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(simulator.evaluate_and_advance(session, "Q1", answer("A1"), "behavioral"))
+    assert session["current_question_index"] == 0
+
+
+def test_repeat_answers_hit_the_cache():
+    """Answers differing only in case and spacing reuse the first evaluation"""
+    generator = FakeGenerator('{"overall_score": 77}')
+    simulator = InterviewSimulator(FakeOllama(generator))
+    session = {"questions_asked": []}
+
+    first = asyncio.run(simulator.evaluate_answer(session, "Q1", answer("led  the team"), "behavioral"))
+    second = asyncio.run(simulator.evaluate_answer(session, "Q1", answer("led the   team").lower() + " ", "behavioral"))
+    batch = asyncio.run(simulator.evaluate_answers_batch([("Q1", answer("led the team").upper(), "behavioral")]))
+
+    assert len(generator.prompts) == 1
+    assert first == second == batch[0]
+    assert len(session["questions_asked"]) == 2
+
+
+def test_session_report_averages():
+    """Report averages each score over evaluated answers only"""
+    simulator = InterviewSimulator(FakeOllama(FakeGenerator("{}")))
+    evaluation = simulator._fallback_evaluation()
+    session = {"session_id": "s2", "questions_asked": [
+        {"question": "Q1", "evaluation": {**evaluation, "overall_score": 90, "clarity_score": 80, "relevance_score": 71}},
+        {"question": "Q2", "evaluation": {**evaluation, "overall_score": 61, "clarity_score": 60, "relevance_score": 70}},
+        {"question": "Q3"},
+    ]}
+
+    report = asyncio.run(simulator.end_session(session))
+
+    assert report["overall_score"] == 75
+    assert report["metrics"] == {"avg_clarity": 70, "avg_relevance": 70, "avg_confidence": 75}
+    assert report["performance_level"] == "Good"
+    assert report["questions_answered"] == 3
+
+
+def test_simulator_reused_per_client():
+    """API helpers share one simulator per Ollama client"""
+    from interview_simulator import _get_simulator
+
+    client = FakeOllama(FakeGenerator("{}"))
+    assert _get_simulator(client) is _get_simulator(client)
+    assert _get_simulator(client) is not _get_simulator(FakeOllama(FakeGenerator("{}")))
+    assert isinstance(_get_simulator(client).question_banks['technical'], tuple)
+
+
+def test_short_answers_skip_the_model():
+    """Trivial or copied answers get a local low score without an LLM call"""
+    generator = FakeGenerator('{"overall_score": 90}')
+    simulator = InterviewSimulator(FakeOllama(generator))
+    session = {"questions_asked": []}
+
+    evaluation = asyncio.run(simulator.evaluate_answer(session, "Q1", "I don't know", "behavioral"))
+    question = "Tell me about a time you failed. What did you learn from it?"
+    batch = asyncio.run(simulator.evaluate_answers_batch([(question, question.upper(), "behavioral")]))
+
+    assert generator.prompts == []
+    assert evaluation["overall_score"] == batch[0]["overall_score"] == 30
+    assert session["questions_asked"][0]["short_circuit"] is True
+
+
+def test_filler_words_counted_locally():
+    """Filler words are counted by regex, not asked of the model"""
+    generator = FakeGenerator('{"overall_score": 80, "filler_words_count": 9}')
+    simulator = InterviewSimulator(FakeOllama(generator))
+    text = "Um, so basically I, you know, " + answer("kind of led the team")
+
+    evaluation = asyncio.run(simulator.evaluate_answer({"questions_asked": []}, "Q1", text, "behavioral"))
+    batch = asyncio.run(simulator.evaluate_answers_batch([("Q1", text.upper(), "behavioral")]))
+
+    assert evaluation["filler_words_count"] == batch[0]["filler_words_count"] == 4
+    assert "filler_words_count" not in generator.prompts[0]
@@ -0,0 +1,83 @@
+import pytest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+from linkedin_parser import LinkedInScraper, _HTML_PARSER
+
+PROFILE_HTML = """<!DOCTYPE html>
+<html><head>
+<meta property="og:title" content="Jane Doe | LinkedIn">
+<meta property="og:description" content="Engineer at Acme">
+<meta property="og:image" content="https://media.example/jane.png">
+</head><body>
+<h1 class="top-card-layout__title">Jane D.</h1>
+<div class="core-section-container" data-section="summary">
+  <p class="inline-show-more-text"> Building reliable systems. </p>
+</div>
+</body></html>"""
+
+def test_extract_prefers_open_graph_tags():
+    """OpenGraph meta tags win over page selectors; summary comes from the page"""
+    scraper = LinkedInScraper()
+    data = scraper._extract_from_soup(BeautifulSoup(PROFILE_HTML, _HTML_PARSER))
+
+    assert data == {
+        "name": "Jane Doe",
+        "headline": "Engineer at Acme",
+        "profile_image": "https://media.example/jane.png",
+        "summary": "Building reliable systems.",
+    }
+
+def test_extract_falls_back_to_selectors():
+    """Without og:title the name is read from the top card heading"""
+    html = PROFILE_HTML.replace('<meta property="og:title" content="Jane Doe | LinkedIn">', "")
+    scraper = LinkedInScraper()
+    data = scraper._extract_from_soup(BeautifulSoup(html, _HTML_PARSER))
+
+    assert data["name"] == "Jane D."
+
+def test_url_validation_and_username():
+    """Only /in/ profile URLs are accepted and the username is extracted"""
+    assert LinkedInScraper.validate_url("https://www.linkedin.com/in/jane-doe")
+    assert not LinkedInScraper.validate_url("https://linkedin.com/company/acme")
+    assert LinkedInScraper().extract_username("https://linkedin.com/in/jane_doe-42/") == "jane_doe-42"
+    assert LinkedInScraper.extract_username("https://example.com") is None
+
+def test_scrape_many_reports_errors_in_order():
+    """Invalid URLs fail individually without aborting the batch"""
+    import asyncio
+    from linkedin_parser import scrape_linkedin_profiles
+
+    urls = ["https://example.com/a", "not a url"]
+    results = asyncio.run(scrape_linkedin_profiles(urls))
+
+    assert [r["source_url"] for r in results] == urls
+    assert all("Invalid LinkedIn profile URL" in r["error"] for r in results)
+
+def test_profiles_are_cached_by_username(monkeypatch):
+    """A second scrape of the same profile is served from the cache"""
+    import asyncio
+    import linkedin_parser
+
+    calls = []
+
+    async def fake_scrape(self, url):
+        calls.append(url)
+        return {"name": "Jane Doe", "source_url": url}
+
+    monkeypatch.setattr(LinkedInScraper, "scrape_profile", fake_scrape)
+    linkedin_parser._PROFILE_CACHE.clear()
+    try:
+        first = asyncio.run(linkedin_parser.scrape_linkedin_profile("https://www.linkedin.com/in/jane"))
+        second = asyncio.run(linkedin_parser.scrape_linkedin_profile("https://linkedin.com/in/Jane/"))
+        assert len(calls) == 1
+        assert second == first and "scraped_at" in first
+
+        asyncio.run(linkedin_parser.scrape_linkedin_profile("https://linkedin.com/in/jane", force_refresh=True))
+        assert len(calls) == 2
+    finally:
+        linkedin_parser._PROFILE_CACHE.clear()
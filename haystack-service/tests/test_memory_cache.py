@@ -0,0 +1,37 @@
+import sys
+import os
+
+# Add parent directory to path so we can import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cache.memory_cache import LRUCache, content_key
+
+
+def test_content_key_is_stable():
+    """Same parts give the same key; part boundaries matter"""
+    assert content_key("resume", "jd") == content_key("resume", "jd")
+    assert content_key("ab", "c") != content_key("a", "bc")
+    assert len(content_key("x")) == 32
+
+
+def test_get_returns_copy():
+    """Mutating a returned value must not corrupt the cache"""
+    cache = LRUCache(maxsize=4)
+    cache.set("k", {"skills": ["Python"]})
+    hit = cache.get("k")
+    hit["skills"].append("Go")
+    assert cache.get("k") == {"skills": ["Python"]}
+    assert cache.get("missing") is None
+
+
+def test_evicts_least_recently_used():
+    """Oldest untouched entry is dropped once maxsize is exceeded"""
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
@@ -0,0 +1,63 @@
+import asyncio
+import sys
+import os
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.profile_updater_agent import ProfileUpdaterAgent, _MAX_USER_CHARS, _MAX_AI_CHARS
+
+
+class RecordingGenerator:
+    """Records every prompt and replies with a fixed update"""
+    def __init__(self, reply='{"has_update": true, "intent": "update_skills", "data": {"skills": ["AWS"]}}'):
+        self.reply = reply
+        self.prompts = []
+
+    def run(self, prompt, generation_kwargs=None):
+        self.prompts.append(prompt)
+        return {"replies": [self.reply]}
+
+
+def test_turns_without_facts_skip_the_model():
+    """Greetings and plain questions never reach the LLM"""
+    generator = RecordingGenerator()
+    agent = ProfileUpdaterAgent(generator)
+
+    assert asyncio.run(agent.analyze_convo("hi there, how are you?", "Hello!")) is None
+    assert generator.prompts == []
+
+
+def test_long_turns_are_truncated():
+    """Only the head of each side of the turn is sent to the model"""
+    generator = RecordingGenerator()
+    agent = ProfileUpdaterAgent(generator)
+    user_message = "I just got certified in AWS. " + "u" * 5000
+    ai_response = "Congratulations! " + "a" * 5000
+
+    result = asyncio.run(agent.analyze_convo(user_message, ai_response))
+
+    assert result["data"]["skills"] == ["AWS"]
+    prompt = generator.prompts[0]
+    assert f"USER: {user_message[:_MAX_USER_CHARS]}\nAI: {ai_response[:_MAX_AI_CHARS]}\n" in prompt
+    assert "u" * (_MAX_USER_CHARS + 1) not in prompt
+
+
+def test_achievements_reach_the_model():
+    """First-person news such as a passed exam is analysed, not filtered out"""
+    generator = RecordingGenerator()
+    agent = ProfileUpdaterAgent(generator)
+    messages = [
+        "I just passed the AWS Solutions Architect exam.",
+        "I completed a course on Kubernetes",
+        "I finished my MBA",
+        "I got promoted to team lead",
+        "I moved to Berlin last month",
+        "I built a React app",
+    ]
+
+    for message in messages:
+        asyncio.run(agent.analyze_convo(message, "Congratulations!"))
+
+    assert len(generator.prompts) == len(messages)
+    assert "USER: I just passed the AWS Solutions Architect exam." in generator.prompts[0]
@@ -0,0 +1,63 @@
+import asyncio
+import sys
+import os
+import time
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.resume_advisor_agent import get_resume_advisor, _first_json_object, _parse_json
+
+
+class SlowGenerator:
+    """Returns a canned reply after a fixed delay"""
+    def __init__(self, reply, delay=0.0):
+        self.reply = reply
+        self.delay = delay
+
+    def run(self, prompt, generation_kwargs=None):
+        time.sleep(self.delay)
+        return {"replies": [self.reply]}
+
+
+PERSONA = {"full_name": "Jane Doe", "top_skills": ["Python"], "experience_highlights": []}
+
+
+def test_advisor_reused_per_generator():
+    """The agent and its components are built once per generator"""
+    generator = SlowGenerator("{}")
+    agent = get_resume_advisor(generator)
+
+    assert get_resume_advisor(generator) is agent
+    assert get_resume_advisor(SlowGenerator("{}")) is not agent
+    assert agent.pipeline.get_component("tailor_resume") is agent.tailor_comp
+    assert agent.pipeline.get_component("finalize_resume") is agent.finalize_comp
+
+
+def test_tailor_and_cover_letter_overlap():
+    """Both LLM calls run concurrently and are merged into one result"""
+    agent = get_resume_advisor(SlowGenerator('{"tailored_summary": "Strong fit"}', delay=0.2))
+
+    start = time.monotonic()
+    result = asyncio.run(agent.tailor_resume(PERSONA, "Python developer"))
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 0.35
+    assert result["tailored_summary"] == "Strong fit"
+    assert "cover_letter" in result
+
+
+def test_first_json_object_ignores_braces_in_strings():
+    """Scanning stops at the first balanced object, skipping quoted braces"""
+    text = 'Result: {"a": "x } {", "b": {"c": "q\\"}"}} trailing }'
+
+    assert _first_json_object(text) == '{"a": "x } {", "b": {"c": "q\\"}"}}'
+    assert _first_json_object('{"open": ') is None
+    assert _first_json_object("no json") is None
+
+
+def test_parse_json_survives_trailing_braces():
+    """A stray brace after the object no longer breaks parsing"""
+    reply = '{"tailored_skills": ["Python",],}\n\nNote: kept {all} roles.'
+
+    assert _parse_json(reply) == {"tailored_skills": ["Python"]}
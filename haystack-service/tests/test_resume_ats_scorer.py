@@ -0,0 +1,78 @@
+import pytest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from resume_ats_scorer import ATSScorer, get_ats_scorer, score_resume
+
+RESUME = """Jane Doe
+Contact Information
+jane@example.com
+
+PROFESSIONAL SUMMARY
+Backend engineer with 8 years building data platforms.
+
+EXPERIENCE
+Senior Engineer, Acme (2019-2024)
+• Led a team of 6 engineers and delivered the platform 2 months early
+• Reduced infrastructure cost by 35% and increased throughput 4x
+• Built the python data pipeline processing 10M events per day
+
+EDUCATION
+BSc Computer Science
+
+SKILLS
+Python, AWS, Kubernetes
+"""
+
+
+def test_scorer_is_shared():
+    """score_resume reuses one scorer and one spaCy pipeline"""
+    assert get_ats_scorer() is get_ats_scorer()
+    assert ATSScorer().nlp is get_ats_scorer().nlp
+
+
+def test_sections_and_keywords():
+    """Standard sections are found and missing JD keywords are reported"""
+    result = score_resume(RESUME, "Python developer with Terraform experience")
+
+    assert result["section_completeness"] == 100
+    assert not [i for i in result["issues"] if i["type"] == "missing_section"]
+    missing = {i["keyword"] for i in result["issues"] if i["type"] == "missing_keyword"}
+    assert "terraform" in missing and "python" not in missing
+
+
+def test_action_verbs_match_whole_words():
+    """Verbs inside other words ('called', 'rebuilt') don't count as action verbs"""
+    scorer = ATSScorer()
+    filler = " ".join(["word"] * 250) + " 1 2 3 4 5"
+    embedded = filler + " called handled enabled rebuilt compiled"
+    real = filler + " led managed built delivered reduced"
+
+    assert scorer._analyze_content_quality(scorer._scan(embedded)) == 85
+    assert scorer._analyze_content_quality(scorer._scan(real)) == 100
+
+
+def test_special_char_count_matches_regex():
+    """The byte-level count agrees with the original regex, including non-ASCII text"""
+    from resume_ats_scorer import _SPECIAL_RE, _count_special_chars
+
+    samples = [RESUME, "José Müller — Engineer • Led 5 teams → 30% growth ~ `ok` ★", "plain, ascii! text?", ""]
+    for text in samples:
+        assert _count_special_chars(text) == len(_SPECIAL_RE.findall(text))
+
+
+def test_bulk_scoring_matches_single():
+    """Bulk scoring gives the same results, in order, and extracts the JD once"""
+    from resume_ats_scorer import _extract_keywords, score_resumes
+
+    jd = "Senior Python engineer with AWS and Terraform"
+    texts = [RESUME, RESUME.replace("Python", "Go"), "too short"]
+    _extract_keywords.cache_clear()
+    results = score_resumes(texts, jd)
+
+    assert results == [score_resume(text, jd) for text in texts]
+    # One miss per distinct text: the job description plus three resumes
+    assert _extract_keywords.cache_info().misses == 4
@@ -0,0 +1,63 @@
+import asyncio
+import sys
+import os
+
+import httpx
+import pytest
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.base_agent import BaseAgent
+from agents.supervisor import SupervisorAgent, _keyword_hits
+
+
+class FakeGenerator:
+    model = "test-model"
+    url = "http://ollama:11434"
+    keep_alive = "5m"
+    generation_kwargs = {}
+
+
+@pytest.fixture
+def ollama(monkeypatch):
+    """Fake Ollama that always answers 'profile' and records each prompt"""
+    prompts = []
+
+    def handler(request):
+        prompts.append(request.content)
+        return httpx.Response(200, json={"response": "profile", "done": True})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(BaseAgent, "_http_client", client)
+    yield prompts
+    asyncio.run(client.aclose())
+
+
+def route(message):
+    state = {"messages": [{"role": "user", "content": message}]}
+    return asyncio.run(SupervisorAgent(FakeGenerator()).run(state))["active_agent"]
+
+
+def test_obvious_intent_routes_locally(ollama):
+    """Two distinct keywords from one category skip the LLM"""
+    assert route("Review my resume for ATS") == "resume"
+    assert ollama == []
+
+
+def test_keywords_inside_words_do_not_route(ollama):
+    """Substrings such as 'ats' in 'whats' are not keyword hits"""
+    assert _keyword_hits("hey whats up? thats all for now") == {}
+    assert _keyword_hits("what stats do you track on chats?") == {}
+    assert _keyword_hits("my username got renamed") == {}
+
+    assert route("hey whats up? thats all for now") == "profile"
+    assert len(ollama) == 1
+
+
+def test_repeated_keyword_counts_once(ollama):
+    """One keyword said twice is not enough to bypass the LLM"""
+    assert _keyword_hits("resume, resume") == {"resume": 1}
+
+    route("resume, resume")
+    assert len(ollama) == 1
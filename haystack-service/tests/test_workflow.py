@@ -0,0 +1,88 @@
+import asyncio
+import pytest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from orchestration.workflow import HaystackWorkflow, _route_by_keywords
+
+
+class FakeAgent:
+    """Replies with a fixed text after a delay, by run or token stream"""
+    def __init__(self, reply, delay=0.0):
+        self.reply = reply
+        self.delay = delay
+
+    async def run(self, state):
+        await asyncio.sleep(self.delay)
+        state["final_output"] = self.reply
+        return state
+
+    async def astream(self, state):
+        await asyncio.sleep(self.delay)
+        for word in self.reply.split(" "):
+            yield {"delta": word + " "}
+
+
+def make_workflow(**agents):
+    workflow = HaystackWorkflow.__new__(HaystackWorkflow)
+    workflow.supervisor = FakeAgent("")
+    workflow.agents = {"profile": FakeAgent("hello"), **agents}
+    return workflow
+
+
+def state_for(message):
+    return {"messages": [{"role": "user", "content": message}], "agent_responses": {}}
+
+
+def test_multi_intent_runs_agents_concurrently():
+    """Messages matching several routes fan out and merge in priority order"""
+    workflow = make_workflow(
+        resume=FakeAgent("resume tips", delay=0.2),
+        job_search=FakeAgent("job leads", delay=0.2),
+    )
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        result = await workflow.ainvoke(state_for("Find a job and review my resume"))
+        return result, loop.time() - start
+
+    result, elapsed = asyncio.run(run())
+
+    assert elapsed < 0.35
+    assert result["active_agent"] == "resume"
+    assert result["active_agents"] == ["resume", "job_search"]
+    assert result["agent_responses"] == {"resume": "resume tips", "job_search": "job leads"}
+    assert result["final_output"] == "resume tips\n\njob leads"
+
+
+def test_multi_intent_stream_keeps_replies_in_order():
+    """Concurrent streams are emitted one agent after another"""
+    workflow = make_workflow(
+        resume=FakeAgent("resume tips", delay=0.1),
+        job_search=FakeAgent("job leads"),
+    )
+
+    async def collect():
+        return [event async for event in workflow.astream_events(state_for("job and resume help"))]
+
+    events = asyncio.run(collect())
+
+    assert events[0]["data"]["output"] == {"active_agent": "resume", "active_agents": ["resume", "job_search"]}
+    text = "".join(e["data"]["chunk"].content for e in events[1:])
+    assert text == "resume tips \n\njob leads "
+
+
+def test_incidental_keyword_does_not_fan_out():
+    """A single request touching a second route's keyword keeps one agent"""
+    assert _route_by_keywords("what skills do i need for this job?") == ["job_search"]
+    assert _route_by_keywords("find a job and review my resume") == ["resume", "job_search"]
+
+
+def test_keywords_match_whole_word_starts():
+    """Keywords inside other words do not route"""
+    assert _route_by_keywords("i did some research on roles in singapore") == []
+    assert _route_by_keywords("searching for remote jobs") == ["job_search"]